@@ -1,24 +1,30 @@
 from __future__ import annotations
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import cast, TypedDict
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.storage import Store
 from .token import Token
 from .hub import ElectroluxHub
+from .capability_cache import CapabilityCache
+from .appliance_snapshot import ApplianceSnapshotStore
 from .const import (
     CONF_ACCESS_TOKEN,
     CONF_ACCOUNT_EMAIL,
     CONF_API_KEY,
+    CONF_FAST_START,
+    CONF_LIVESTREAM_COALESCE_WINDOW,
     CONF_REFRESH_TOKEN,
+    CONF_REQUEST_CONCURRENCY,
     CONF_TOKEN_EXPIRATION_DATE,
     CONF_USE_LIVESTREAM_UPDATES,
+    DISCOVERY_CONCURRENCY,
     DOMAIN,
+    LIVESTREAM_COALESCE_WINDOW_MS,
     MIN_SCAN_INTERVAL,
 )
 from .jwt_utils import get_token_expiration
@@ -89,6 +95,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry) -
             entry.data.get(CONF_USE_LIVESTREAM_UPDATES, True),
         ),
     )
+    fast_start = cast(bool, entry.options.get(CONF_FAST_START, False))
+    request_concurrency = cast(int, entry.options.get(CONF_REQUEST_CONCURRENCY, DISCOVERY_CONCURRENCY))
+    livestream_coalesce_window_ms = cast(
+        int,
+        entry.options.get(CONF_LIVESTREAM_COALESCE_WINDOW, LIVESTREAM_COALESCE_WINDOW_MS),
+    )
 
     token: Token = {
         "access_token": access_token,
@@ -102,9 +114,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry) -
         token=token,
         scan_interval=scan_interval,
         use_livestream_updates=use_livestream_updates,
+        discovery_concurrency=request_concurrency,
+        state_refresh_concurrency=request_concurrency,
+        capability_cache=CapabilityCache(hass, entry.entry_id),
+        appliance_snapshot=ApplianceSnapshotStore(hass, entry.entry_id) if fast_start else None,
+        on_appliances_changed=lambda: hass.config_entries.async_schedule_reload(entry.entry_id),
+        livestream_coalesce_window=livestream_coalesce_window_ms / 1000,
     )
 
-    timer = None
     try:
         account_email = cast(str | None, entry.data.get(CONF_ACCOUNT_EMAIL)) or await hub.api.get_account_email()
         if account_email and entry.title != account_email:
@@ -114,14 +131,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry) -
                 data={**entry.data, CONF_ACCOUNT_EMAIL: account_email},
             )
 
-        await hub.discover_appliances()
+        restored = fast_start and await hub.restore_appliance_snapshot()
+        if not restored:
+            await hub.discover_appliances()
 
         hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN][entry.entry_id] = {
             "hub": hub,
-            "timer": timer
         }
         await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+        if restored:
+            hub.reconcile_appliances_in_background()
+        hub.start_token_refresh()
 
         async def close_hub_at_stop(_) -> None:
             await hub.close()
@@ -134,11 +155,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry) -
 
             entry.async_on_unload(async_at_started(hass, start_livestream_after_started))
         else:
-            timer = async_track_time_interval(hass, hub.poll_appliances, timedelta(seconds=scan_interval))
-            hass.data[DOMAIN][entry.entry_id]["timer"] = timer
+            hub.start_polling()
     except Exception:
-        if timer is not None:
-            timer()
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
         await hub.close()
         raise
@@ -164,10 +182,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry)
         return False
 
     if isinstance(entry_data, dict):
-        timer = entry_data.get("timer")
-        if callable(timer):
-            timer()
-
         hub = entry_data.get("hub")
         if hub is not None:
             await hub.close()
@@ -176,3 +190,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry)
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ElectroluxConfigEntry) -> None:
+    await CapabilityCache(hass, entry.entry_id).async_remove()
+    await ApplianceSnapshotStore(hass, entry.entry_id).async_remove()
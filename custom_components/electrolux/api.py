@@ -2,7 +2,9 @@ import asyncio
 import aiohttp
 import json
 import logging
+import time
 from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional, Protocol
 from urllib.parse import urlparse
@@ -12,7 +14,24 @@ from .capabilities import ApplianceInfo, capabilities_from_json
 from .appliance_state import ApplianceState, ConnectionState, Properties, ReportedProperties, Status
 
 from .appliance import Appliance
-from .const import API_HOST
+from .const import (
+    API_COMMAND_CONCURRENCY,
+    API_DISCOVERY_CONCURRENCY,
+    API_HOST,
+    API_RATE_LIMIT_DEFAULT_RETRY_AFTER,
+    API_RATE_LIMIT_MAX_RETRIES,
+    API_RATE_LIMIT_MAX_RETRY_AFTER,
+    API_REQUEST_BURST,
+    API_REQUEST_RATE,
+    API_STATE_CONCURRENCY,
+    API_TOKEN_CONCURRENCY,
+    LIVESTREAM_IDLE_TIMEOUT,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_REFRESH_RETRY_BASE_DELAY,
+    TOKEN_REFRESH_RETRY_MAX_DELAY,
+)
+from .scheduler import RequestPriority, RequestScheduler, parse_retry_after
+from .sse import IdleWatchdog, SSEDecoder
 from .token import Token
 
 
@@ -24,19 +43,102 @@ class TokenRefreshCallback(Protocol):
         pass
 
 
+JsonLoads = Callable[[bytes | str], Any]
+
+
+@dataclass
+class ResponseStats:
+    responses: int = 0
+    bytes_received: int = 0
+    decode_seconds: float = 0.0
+    last_body_size: int = 0
+    last_decode_seconds: float = 0.0
+
+    def record(self, body_size: int, decode_seconds: float) -> None:
+        self.responses += 1
+        self.bytes_received += body_size
+        self.decode_seconds += decode_seconds
+        self.last_body_size = body_size
+        self.last_decode_seconds = decode_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ConnectionStats:
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0
+    livestream_connects: int = 0
+    livestream_rotations: int = 0
+    last_livestream_connect_seconds: float | None = None
+    total_livestream_connect_seconds: float = 0.0
+
+    def record_livestream_connect(self, elapsed: float) -> None:
+        self.livestream_connects += 1
+        self.last_livestream_connect_seconds = elapsed
+        self.total_livestream_connect_seconds += elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class TokenRefreshStats:
+    proactive_refreshes: int = 0
+    failures: int = 0
+    last_refresh_at: datetime | None = None
+    next_refresh_at: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "proactive_refreshes": self.proactive_refreshes,
+            "failures": self.failures,
+            "last_refresh_at": self.last_refresh_at.isoformat() if self.last_refresh_at else None,
+            "next_refresh_at": self.next_refresh_at.isoformat() if self.next_refresh_at else None,
+        }
+
+
 class ElectroluxAPI:
     def __init__(
         self, 
         api_key: str, 
         token: Token,
-        on_token_refresh: TokenRefreshCallback
+        on_token_refresh: TokenRefreshCallback,
+        json_loads: JsonLoads | None = None,
+        token_refresh_margin: float = TOKEN_REFRESH_MARGIN,
+        clock: Callable[[], datetime] = datetime.now,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
     ):
         self.api_key = api_key
         self.token = token
         self.on_token_refresh = on_token_refresh
+        self._json_loads: JsonLoads = json_loads or json.loads
+        self.response_stats = ResponseStats()
+        self.connection_stats = ConnectionStats()
+        self.livestream_last_event_id: str | None = None
+        self.livestream_retry_ms: int | None = None
+        self.token_refresh_stats = TokenRefreshStats()
+        self._token_refresh_margin = token_refresh_margin
+        self._clock = clock
+        self._sleep = sleep
+        self._livestream_response: aiohttp.ClientResponse | None = None
+        self._livestream_rotating = False
+        self.scheduler = RequestScheduler(
+            rate=API_REQUEST_RATE,
+            burst=API_REQUEST_BURST,
+            lane_limits={
+                RequestPriority.COMMAND: API_COMMAND_CONCURRENCY,
+                RequestPriority.TOKEN: API_TOKEN_CONCURRENCY,
+                RequestPriority.STATE: API_STATE_CONCURRENCY,
+                RequestPriority.DISCOVERY: API_DISCOVERY_CONCURRENCY,
+            },
+        )
         self._token_refresh_lock = asyncio.Lock()
         
-        self.connector = aiohttp.TCPConnector(keepalive_timeout=30, limit=100)
+        self.connector = aiohttp.TCPConnector(keepalive_timeout=30, limit=100, ttl_dns_cache=300)
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
 
         headers = {
@@ -48,11 +150,35 @@ class ElectroluxAPI:
         self.session = aiohttp.ClientSession(
             connector=self.connector,
             timeout=timeout,
-            headers=headers
+            headers=headers,
+            trace_configs=[self._connection_trace_config()],
         )
+
+    def _connection_trace_config(self) -> aiohttp.TraceConfig:
+        stats = self.connection_stats
+
+        async def on_connection_create_end(*_: Any) -> None:
+            stats.connections_created += 1
+
+        async def on_connection_reuseconn(*_: Any) -> None:
+            stats.connections_reused += 1
+
+        async def on_dns_resolvehost_end(*_: Any) -> None:
+            stats.dns_lookups += 1
+
+        async def on_dns_cache_hit(*_: Any) -> None:
+            stats.dns_cache_hits += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace_config
     
 
     async def close(self):
+        self.scheduler.close()
         if self.session and not self.session.closed:
             await self.session.close()
         if hasattr(self, 'connector') and self.connector and not self.connector.closed:
@@ -75,17 +201,56 @@ class ElectroluxAPI:
         if not self.token or not self.token["token_expiration_date"]:
             return
 
-        if datetime.now() < self.token["token_expiration_date"]:
+        if self._clock() < self.token["token_expiration_date"]:
             return
 
         async with self._token_refresh_lock:
-            if self.token and self.token["token_expiration_date"] and datetime.now() < self.token["token_expiration_date"]:
+            if self.token and self.token["token_expiration_date"] and self._clock() < self.token["token_expiration_date"]:
                 return
 
             _LOGGER.info("Access token expired, refreshing...")
             if not await self.refresh_access_token():
                 raise Exception("Failed to refresh access token")
 
+    async def keep_access_token_fresh(self) -> None:
+        failures = 0
+        while self.token and self.token["token_expiration_date"]:
+            remaining = (self.token["token_expiration_date"] - self._clock()).total_seconds()
+            if failures:
+                delay = min(TOKEN_REFRESH_RETRY_MAX_DELAY, TOKEN_REFRESH_RETRY_BASE_DELAY * 2 ** (failures - 1))
+            else:
+                delay = max(remaining - self._token_refresh_margin, remaining / 2)
+            self.token_refresh_stats.next_refresh_at = self._clock() + timedelta(seconds=max(0.0, delay))
+            if delay > 0:
+                await self._sleep(delay)
+
+            async with self._token_refresh_lock:
+                expiration = self.token["token_expiration_date"]
+                if expiration and (expiration - self._clock()).total_seconds() > self._token_refresh_margin:
+                    failures = 0
+                    continue
+
+                _LOGGER.debug("Refreshing access token ahead of expiry")
+                refreshed = await self.refresh_access_token()
+
+            if not refreshed:
+                failures += 1
+                self.token_refresh_stats.failures += 1
+                _LOGGER.warning("Proactive access token refresh failed %s times in a row", failures)
+                continue
+
+            failures = 0
+            self.token_refresh_stats.proactive_refreshes += 1
+            self.token_refresh_stats.last_refresh_at = self._clock()
+
+    def _rotate_livestream(self) -> None:
+        if self._livestream_response is None or self._livestream_response.closed:
+            return
+
+        _LOGGER.debug("Rotating Electrolux livestream onto the refreshed access token")
+        self._livestream_rotating = True
+        self._livestream_response.close()
+
     def _is_valid_livestream_url(self, livestream_url: str) -> bool:
         parsed = urlparse(livestream_url)
         hostname = parsed.hostname
@@ -96,7 +261,21 @@ class ElectroluxAPI:
         )
 
 
-    async def _request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+    def _handle_rate_limited(self, method: str, url: str, response: aiohttp.ClientResponse) -> float:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        delay = retry_after if retry_after is not None else API_RATE_LIMIT_DEFAULT_RETRY_AFTER
+        self.scheduler.pause(delay)
+        _LOGGER.warning("%s %s was rate limited, pausing API requests for %.0f seconds", method, url, delay)
+        return delay
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        priority: RequestPriority = RequestPriority.STATE,
+        **kwargs,
+    ) -> Any:
         if url != "/api/v1/token/refresh":
             await self._ensure_access_token()
         
@@ -106,27 +285,63 @@ class ElectroluxAPI:
         headers = self._auth_interceptor(url, headers)
 
         kwargs['headers'] = headers
-        
-        async with self.session.request(method, url, **kwargs) as response:
-            response.raise_for_status()
-            
-            body = await response.text()
-            response._body = body.encode()
-            return response
+
+        attempt = 0
+        while True:
+            async with (
+                self.scheduler.slot(priority),
+                self.session.request(method, url, **kwargs) as response,
+            ):
+                if response.status == 429:
+                    delay = self._handle_rate_limited(method, url, response)
+                    if (
+                        method == "GET"
+                        and attempt < API_RATE_LIMIT_MAX_RETRIES
+                        and delay <= API_RATE_LIMIT_MAX_RETRY_AFTER
+                    ):
+                        attempt += 1
+                        self.scheduler.retries += 1
+                        continue
+
+                response.raise_for_status()
+                
+                body = await response.read()
+            break
+
+        if not body:
+            self.response_stats.record(0, 0.0)
+            return None
+
+        decode_started_at = time.perf_counter()
+        data = self._json_loads(body)
+        decode_seconds = time.perf_counter() - decode_started_at
+        self.response_stats.record(len(body), decode_seconds)
+        _LOGGER.debug(
+            "%s %s returned %s bytes decoded in %.2fms",
+            method,
+            url,
+            len(body),
+            decode_seconds * 1000,
+        )
+        return data
     
 
     async def refresh_access_token(self) -> bool:
         try:
-            response = await self._request("POST", "/api/v1/token/refresh", json={"refreshToken": self.token["refresh_token"]})
-            
-            data = await response.json()
+            data = await self._request(
+                "POST",
+                "/api/v1/token/refresh",
+                priority=RequestPriority.TOKEN,
+                json={"refreshToken": self.token["refresh_token"]},
+            )
             token: Token = {
                 "access_token": data["accessToken"],
                 "refresh_token": data["refreshToken"],
-                "token_expiration_date": datetime.now() + timedelta(seconds=data["expiresIn"])
+                "token_expiration_date": self._clock() + timedelta(seconds=data["expiresIn"])
             }
 
             self.token = token
+            self._rotate_livestream()
             
             await self.on_token_refresh(token)
 
@@ -139,8 +354,7 @@ class ElectroluxAPI:
     async def get_appliances(self) -> Optional[list[Appliance]]:
         try:
             _LOGGER.info("Making API request to get appliances...")
-            response = await self._request("GET", "/api/v1/appliances")
-            data = await response.json()
+            data = await self._request("GET", "/api/v1/appliances", priority=RequestPriority.DISCOVERY)
             _LOGGER.info(f"API response: {data}")
 
             appliances: list[Appliance] = []
@@ -161,8 +375,7 @@ class ElectroluxAPI:
 
     async def get_account_email(self, *, raise_on_error: bool = False) -> Optional[str]:
         try:
-            response = await self._request("GET", "/api/v1/users/current/email")
-            data = await response.json()
+            data = await self._request("GET", "/api/v1/users/current/email", priority=RequestPriority.DISCOVERY)
             return data.get("email")
         except aiohttp.ClientResponseError as e:
             if raise_on_error:
@@ -177,8 +390,7 @@ class ElectroluxAPI:
 
     async def get_livestream_configuration(self) -> Optional[dict[str, Any]]:
         try:
-            response = await self._request("GET", "/api/v1/configurations/livestream")
-            data = await response.json()
+            data = await self._request("GET", "/api/v1/configurations/livestream", priority=RequestPriority.DISCOVERY)
             livestream_url = data.get("url") if isinstance(data, dict) else None
             if (
                 not isinstance(data, dict)
@@ -196,7 +408,7 @@ class ElectroluxAPI:
         self,
         livestream_url: str,
         on_connected: Callable[[], Awaitable[None]] | None = None,
-    ) -> AsyncIterator[dict[str, Any]]:
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         if not self._is_valid_livestream_url(livestream_url):
             raise ValueError(f"Unexpected livestream URL: {livestream_url}")
 
@@ -205,66 +417,89 @@ class ElectroluxAPI:
         headers = {
             "Accept": "text/event-stream",
             "Authorization": f"Bearer {self.token['access_token']}",
-            "x-api-key": self.api_key,
         }
+        if self.livestream_last_event_id:
+            headers["Last-Event-ID"] = self.livestream_last_event_id
         timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=None)
-        connect_started_at = asyncio.get_running_loop().time()
+        loop = asyncio.get_running_loop()
+        connect_started_at = loop.time()
         _LOGGER.debug("Opening Electrolux livestream SSE endpoint")
 
+        connections_created = self.connection_stats.connections_created
+        watchdog: IdleWatchdog | None = None
+
+        await self.scheduler.acquire(RequestPriority.STATE)
         try:
-            async with aiohttp.ClientSession() as websession:
-                async with websession.get(livestream_url, timeout=timeout, headers=headers) as response:
-                    response.raise_for_status()
-                    connect_elapsed = asyncio.get_running_loop().time() - connect_started_at
-                    _LOGGER.debug("Connected to Electrolux livestream SSE endpoint after %.2fs", connect_elapsed)
-                    if on_connected is not None:
-                        await on_connected()
-
-                    while True:
-                        event_type = None
-                        data_lines: list[str] = []
-
-                        while True:
-                            if response.closed:
-                                raise ConnectionError("SSE response stream closed unexpectedly")
-
-                            line = await asyncio.wait_for(response.content.readline(), timeout=120)
-                            if not line:
-                                raise ConnectionError("SSE connection closed by server")
-
-                            line_str = line.decode().strip()
-                            if line_str == "":
-                                break
-                            if line_str.startswith(":"):
-                                continue
-                            if line_str.startswith("event:"):
-                                event_type = line_str.removeprefix("event:").strip()
-                            elif line_str.startswith("data:"):
-                                data_lines.append(line_str.removeprefix("data:").strip())
-
-                        if event_type == "ping" or not data_lines:
+            async with self.session.get(livestream_url, timeout=timeout, headers=headers) as response:
+                if response.status == 429:
+                    self._handle_rate_limited("GET", livestream_url, response)
+                response.raise_for_status()
+                connect_elapsed = loop.time() - connect_started_at
+                self.connection_stats.record_livestream_connect(connect_elapsed)
+                _LOGGER.debug(
+                    "Connected to Electrolux livestream SSE endpoint after %.2fs (%s)",
+                    connect_elapsed,
+                    "new connection"
+                    if self.connection_stats.connections_created > connections_created
+                    else "reused connection",
+                )
+                self._livestream_rotating = False
+                self._livestream_response = response
+                if on_connected is not None:
+                    await on_connected()
+
+                decoder = SSEDecoder(self.livestream_last_event_id)
+                watchdog = IdleWatchdog(loop, LIVESTREAM_IDLE_TIMEOUT, response.close)
+                watchdog.start()
+                async for chunk in response.content.iter_any():
+                    watchdog.touch()
+                    sse_events = decoder.feed(chunk)
+                    self.livestream_last_event_id = decoder.last_event_id
+                    self.livestream_retry_ms = decoder.retry
+                    events: list[dict[str, Any]] = []
+                    for sse_event in sse_events:
+                        if sse_event.event == "ping":
                             continue
-
                         try:
-                            event = json.loads("\n".join(data_lines))
-                        except json.JSONDecodeError:
-                            _LOGGER.debug("Ignoring invalid livestream event payload: %s", data_lines)
+                            event = self._json_loads(sse_event.data)
+                        except ValueError:
+                            _LOGGER.debug("Ignoring invalid livestream event payload: %s", sse_event.data)
                             continue
-
                         if isinstance(event, dict):
                             _LOGGER.debug(
                                 "Received Electrolux livestream event type=%s payload=%s",
-                                event_type or "message",
+                                sse_event.event,
                                 event,
                             )
-                            yield event
+                            events.append(event)
+                    if events:
+                        yield events
+
+                if self._livestream_rotating:
+                    self.connection_stats.livestream_rotations += 1
+                    return
+                if watchdog.fired:
+                    raise ConnectionError(f"SSE connection idle for {LIVESTREAM_IDLE_TIMEOUT} seconds")
+                raise ConnectionError("SSE connection closed by server")
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            if self._livestream_rotating:
+                self.connection_stats.livestream_rotations += 1
+                return
+            if watchdog is not None and watchdog.fired:
+                raise ConnectionError(f"SSE connection idle for {LIVESTREAM_IDLE_TIMEOUT} seconds") from e
+            raise
         finally:
+            self._livestream_response = None
+            self._livestream_rotating = False
+            if watchdog is not None:
+                watchdog.cancel()
             _LOGGER.debug("Closing Electrolux livestream SSE endpoint")
 
     async def get_appliance_info(self, appliance_id: str) -> Optional[ApplianceInfo]:
         try:
-            response = await self._request("GET", f"/api/v1/appliances/{appliance_id}/info")
-            data = await response.json()
+            data = await self._request(
+                "GET", f"/api/v1/appliances/{appliance_id}/info", priority=RequestPriority.DISCOVERY
+            )
 
             return capabilities_from_json(data)
         except Exception as e:
@@ -273,8 +508,9 @@ class ElectroluxAPI:
 
     async def get_appliance_state(self, appliance_id: str) -> Optional[ApplianceState]:
         try:
-            response = await self._request("GET", f"/api/v1/appliances/{appliance_id}/state")
-            data = await response.json()
+            data = await self._request(
+                "GET", f"/api/v1/appliances/{appliance_id}/state", priority=RequestPriority.STATE
+            )
 
             reported = data.get("properties", {}).get("reported", {})
             if not isinstance(reported, dict):
@@ -295,7 +531,9 @@ class ElectroluxAPI:
 
     async def send_command(self, appliance_id: str, body: dict[str, Any]) -> bool:
         try:
-            await self._request("PUT", f"/api/v1/appliances/{appliance_id}/command", json=body)
+            await self._request(
+                "PUT", f"/api/v1/appliances/{appliance_id}/command", priority=RequestPriority.COMMAND, json=body
+            )
             return True
         except Exception as e:
             _LOGGER.error(f"Failed to send command: {e}")
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .appliance import Appliance
+from .appliance_state import ApplianceState, ConnectionState, Properties, ReportedProperties, Status
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+APPLIANCE_SNAPSHOT_VERSION = 1
+APPLIANCE_SNAPSHOT_SAVE_DELAY = 60
+
+
+class ApplianceSnapshotStore:
+    """Last-known appliances and reported states of a config entry, used for fast start."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            version=APPLIANCE_SNAPSHOT_VERSION,
+            key=f"{DOMAIN}.{entry_id}.snapshot",
+        )
+
+    async def async_load(self) -> list[tuple[Appliance, ApplianceState]]:
+        data = await self._store.async_load() or {}
+        snapshot: list[tuple[Appliance, ApplianceState]] = []
+        for item in data.get("appliances", []):
+            try:
+                snapshot.append((_appliance_from_dict(item["appliance"]), _state_from_dict(item["state"])))
+            except (KeyError, TypeError, ValueError) as e:
+                _LOGGER.debug("Ignoring unreadable appliance snapshot entry: %s", e)
+        return snapshot
+
+    async def async_save(self, snapshot: list[tuple[Appliance, ApplianceState]]) -> None:
+        await self._store.async_save(_snapshot_to_dict(snapshot))
+
+    def async_delay_save(self, snapshot_func: Callable[[], list[tuple[Appliance, ApplianceState]]]) -> None:
+        self._store.async_delay_save(lambda: _snapshot_to_dict(snapshot_func()), APPLIANCE_SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+
+def _snapshot_to_dict(snapshot: list[tuple[Appliance, ApplianceState]]) -> dict[str, Any]:
+    return {
+        "appliances": [
+            {"appliance": _appliance_to_dict(appliance), "state": _state_to_dict(state)}
+            for appliance, state in snapshot
+        ]
+    }
+
+
+def _appliance_to_dict(appliance: Appliance) -> dict[str, Any]:
+    return {
+        "id": appliance.id,
+        "name": appliance.name,
+        "type": appliance.type,
+        "created": appliance.created.isoformat(),
+    }
+
+
+def _appliance_from_dict(data: dict[str, Any]) -> Appliance:
+    return Appliance(
+        id=data["id"],
+        name=data["name"],
+        type=data["type"],
+        created=datetime.fromisoformat(data["created"]),
+    )
+
+
+def _state_to_dict(state: ApplianceState) -> dict[str, Any]:
+    return {
+        "id": state.id,
+        "connection_state": state.connectionState.value if state.connectionState else None,
+        "status": state.status.value if state.status else None,
+        "reported": state.properties.reported.raw,
+        "data_model_version": state.data_model_version,
+    }
+
+
+def _state_from_dict(data: dict[str, Any]) -> ApplianceState:
+    reported = data.get("reported")
+    return ApplianceState(
+        id=data["id"],
+        connectionState=ConnectionState.from_string(data.get("connection_state")),
+        status=Status.from_string(data.get("status")),
+        properties=Properties(reported=ReportedProperties(raw=reported if isinstance(reported, dict) else {})),
+        data_model_version=data.get("data_model_version"),
+    )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from copy import deepcopy
-from dataclasses import dataclass, replace
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
 from typing import Any
 
@@ -73,6 +75,12 @@ class Capability:
 
 
 Capabilities = dict[str, Capability]
+StatePredicate = Callable[[dict[str, Any]], bool]
+CompiledTrigger = tuple[StatePredicate | None, dict[str, Any]]
+NameIndex = dict[str, tuple[int, str]]
+
+_MISSING = object()
+_RUNTIME_CAPABILITIES_CACHE_SIZE = 32
 
 
 @dataclass
@@ -92,28 +100,360 @@ class ApplianceInfo:
     capabilities: Capabilities
     data_model_version: str | None = None
     raw: dict[str, Any] | None = None
+    _trigger_dependency_paths: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _sorted_dependency_paths: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _runtime_capabilities_cache: OrderedDict[tuple[Any, ...], Capabilities] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    runtime_cache_hits: int = field(default=0, init=False, repr=False, compare=False)
+    runtime_cache_misses: int = field(default=0, init=False, repr=False, compare=False)
+    _trigger_graph: TriggerGraph | None = field(default=None, init=False, repr=False, compare=False)
+    _live_key: tuple[Any, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _live_runtime: Capabilities | None = field(default=None, init=False, repr=False, compare=False)
+    _live_actions: dict[str, list[dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    runtime_incremental_updates: int = field(default=0, init=False, repr=False, compare=False)
+    runtime_full_updates: int = field(default=0, init=False, repr=False, compare=False)
+    _compiled_triggers: dict[str, CompiledTriggers] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _name_index: NameIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _property_paths: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._compiled_triggers = {
+            path: compiled
+            for path, capability in self.capabilities.items()
+            if (compiled := compile_triggers(capability)) is not None
+        }
+
+    @property
+    def trigger_dependency_paths(self) -> frozenset[str]:
+        """Reported paths whose values can change the runtime capabilities."""
+        if self._trigger_dependency_paths is None:
+            self._trigger_dependency_paths = frozenset(
+                path
+                for capability in self.capabilities.values()
+                for path in _trigger_source_paths(capability)
+            )
+        return self._trigger_dependency_paths
+
+    @property
+    def trigger_graph(self) -> TriggerGraph:
+        if self._trigger_graph is None:
+            self._trigger_graph = build_trigger_graph(self.capabilities)
+        return self._trigger_graph
 
     def capability(self, path: str) -> Capability | None:
         return self.capabilities.get(path)
 
+    @property
+    def name_index(self) -> NameIndex:
+        """Normalized capability paths and names mapped to the first capability carrying them.
+
+        Triggers never change a capability's path or name, so the index also serves every runtime capability set.
+        """
+        if self._name_index is None:
+            self._name_index = build_name_index(self.capabilities)
+        return self._name_index
+
+    @property
+    def property_paths(self) -> dict[str, str]:
+        """Livestream property names mapped to capability paths by exact path, then unique name, then unique leaf."""
+        if self._property_paths is None:
+            self._property_paths = build_property_paths(self.capabilities)
+        return self._property_paths
+
+    def resolve_property_path(self, property_name: str) -> str:
+        return self.property_paths.get(property_name, property_name)
+
     def find_capability(
         self,
         *names: str,
         runtime_capabilities: Capabilities | None = None,
     ) -> Capability | None:
         capabilities = runtime_capabilities or self.capabilities
-        wanted = {_normalize_name(name) for name in names}
-        for capability in capabilities.values():
-            if _normalize_name(capability.path) in wanted or _normalize_name(capability.name) in wanted:
-                return capability
-        return None
+        index = self.name_index
+        matches = [entry for name in names if (entry := index.get(_normalize_name(name))) is not None]
+        if not matches:
+            return None
+        return capabilities.get(min(matches)[1])
 
     def runtime_capabilities(self, reported_state: dict[str, Any]) -> Capabilities:
+        """Capabilities after applying triggers; the returned mapping is cached and must not be mutated."""
+        return self._runtime_capabilities_for_key(self._runtime_cache_key(reported_state), reported_state)
+
+    def update_runtime_capabilities(self, reported_state: dict[str, Any]) -> set[str]:
+        """Move the live runtime capabilities to reported_state and return the paths whose attributes changed.
+
+        Only triggers reading a dependency that changed since the previous call are re-evaluated, and only the
+        capabilities those triggers write are rebuilt. The first call establishes the baseline and reports every path.
+        """
+        key = self._runtime_cache_key(reported_state)
+        previous = self._live_runtime
+        if previous is None or self._live_key is None:
+            self.runtime_full_updates += 1
+            runtime = self._runtime_capabilities_for_key(key, reported_state)
+            self._live_actions = {
+                source: self._source_actions(source, reported_state) for source in self.trigger_graph.writes
+            }
+            self._live_key, self._live_runtime = key, runtime
+            return set(runtime)
+        if key == self._live_key:
+            return set()
+
+        self.runtime_incremental_updates += 1
+        graph = self.trigger_graph
+        changed_dependencies = {path for (path, old), (_, new) in zip(self._live_key, key) if old != new}
+        actions = dict(self._live_actions)
+        targets: set[str] = set()
+        for source in graph.sources_reading(changed_dependencies):
+            source_actions = self._source_actions(source, reported_state)
+            if source_actions != actions[source]:
+                actions[source] = source_actions
+                targets |= graph.writes[source]
+
+        runtime = dict(previous)
+        changed: set[str] = set()
+        for target in targets:
+            capability = self.capabilities[target]
+            for source in graph.writers[target]:
+                for action in actions[source]:
+                    for target_name, attrs in action.items():
+                        if isinstance(attrs, dict) and graph.action_paths.get((source, target_name)) == target:
+                            capability = _apply_action_attrs(capability, attrs)
+            if capability != previous[target]:
+                runtime[target] = capability
+                changed.add(target)
+
+        if not changed:
+            runtime = previous
+        self._live_key, self._live_runtime, self._live_actions = key, runtime, actions
+        self._cache_runtime_capabilities(key, runtime)
+        return changed
+
+    def _source_actions(self, source: str, reported_state: dict[str, Any]) -> list[dict[str, Any]]:
+        compiled = self._compiled_triggers.get(source)
+        return compiled.matching_actions(reported_state) if compiled is not None else []
+
+    def _runtime_cache_key(self, reported_state: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(
+            (path, _freeze_state_value(get_state_value(reported_state, path)))
+            for path in self._sorted_trigger_dependency_paths
+        )
+
+    def _runtime_capabilities_for_key(self, key: tuple[Any, ...], reported_state: dict[str, Any]) -> Capabilities:
+        cache = self._runtime_capabilities_cache
+        if (capabilities := cache.get(key)) is not None:
+            cache.move_to_end(key)
+            self.runtime_cache_hits += 1
+            return capabilities
+
+        self.runtime_cache_misses += 1
+        capabilities = self._compute_runtime_capabilities(reported_state)
+        self._cache_runtime_capabilities(key, capabilities)
+        return capabilities
+
+    def _cache_runtime_capabilities(self, key: tuple[Any, ...], capabilities: Capabilities) -> None:
+        cache = self._runtime_capabilities_cache
+        cache[key] = capabilities
+        cache.move_to_end(key)
+        if len(cache) > _RUNTIME_CAPABILITIES_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _compute_runtime_capabilities(self, reported_state: dict[str, Any]) -> Capabilities:
         capabilities = {path: replace(capability) for path, capability in self.capabilities.items()}
-        for capability in list(capabilities.values()):
-            _apply_triggers(capabilities, capability, reported_state)
+        for path, triggers in self._compiled_triggers.items():
+            _apply_actions(
+                capabilities,
+                self.capabilities[path],
+                triggers.matching_actions(reported_state),
+                self.name_index,
+            )
         return capabilities
 
+    @property
+    def _sorted_trigger_dependency_paths(self) -> tuple[str, ...]:
+        if self._sorted_dependency_paths is None:
+            self._sorted_dependency_paths = tuple(sorted(self.trigger_dependency_paths))
+        return self._sorted_dependency_paths
+
+    def runtime_cache_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.runtime_cache_hits,
+            "misses": self.runtime_cache_misses,
+            "size": len(self._runtime_capabilities_cache),
+            "incremental_updates": self.runtime_incremental_updates,
+            "full_updates": self.runtime_full_updates,
+        }
+
+
+@dataclass(frozen=True)
+class CompiledTriggers:
+    """A capability's triggers with conditions compiled into predicates over the reported state."""
+
+    path_parts: tuple[str, ...]
+    static: tuple[CompiledTrigger, ...]
+    by_value: dict[str, tuple[CompiledTrigger, ...]]
+
+    def matching_actions(self, reported_state: dict[str, Any]) -> list[dict[str, Any]]:
+        triggers = self.static
+        if self.by_value:
+            current_value = _get_state_parts(reported_state, self.path_parts)
+            value_triggers = self.by_value.get(str(current_value))
+            if value_triggers is None:
+                value_triggers = self.by_value.get(_normalize_value(current_value))
+            if value_triggers:
+                triggers = triggers + value_triggers
+        return [action for predicate, action in triggers if predicate is None or predicate(reported_state)]
+
+
+def compile_triggers(capability: Capability) -> CompiledTriggers | None:
+    static = _compile_trigger_list(capability.triggers, capability)
+    by_value: dict[str, tuple[CompiledTrigger, ...]] = {}
+    raw_values = (capability.raw or {}).get("values")
+    if isinstance(raw_values, dict):
+        for value, value_config in raw_values.items():
+            if not value_config:
+                continue
+            by_value[value] = (
+                _compile_trigger_list(
+                    [trigger for trigger in value_config.get("triggers", []) if isinstance(trigger, dict)],
+                    capability,
+                )
+                if isinstance(value_config, dict)
+                else ()
+            )
+    if not static and not any(by_value.values()):
+        return None
+    return CompiledTriggers(path_parts=tuple(capability.path.split(".")), static=static, by_value=by_value)
+
+
+def _compile_trigger_list(triggers: Iterable[dict[str, Any]], capability: Capability) -> tuple[CompiledTrigger, ...]:
+    compiled: list[CompiledTrigger] = []
+    for trigger in triggers:
+        action = trigger.get("action")
+        if not isinstance(action, dict):
+            continue
+        condition = trigger.get("condition")
+        compiled.append((None if condition is None else _compile_condition(condition, capability), action))
+    return tuple(compiled)
+
+
+def _compile_condition(condition: Any, capability: Capability) -> StatePredicate:
+    if not isinstance(condition, dict):
+        return lambda reported_state: False
+
+    operator = str(condition.get("operator", "eq")).lower()
+    if operator in {"and", "or"}:
+        left_condition = _compile_condition(condition.get("operand_1"), capability)
+        right_condition = _compile_condition(condition.get("operand_2"), capability)
+        if operator == "and":
+            return lambda reported_state: left_condition(reported_state) and right_condition(reported_state)
+        return lambda reported_state: left_condition(reported_state) or right_condition(reported_state)
+
+    left = _compile_operand(condition.get("operand_1"), capability)
+    right = _compile_operand(condition.get("operand_2"), capability)
+    if operator == "ne":
+        return lambda reported_state: left(reported_state) != right(reported_state)
+    return lambda reported_state: left(reported_state) == right(reported_state)
+
+
+def _compile_operand(operand: Any, capability: Capability) -> Callable[[dict[str, Any]], Any]:
+    """Return a function producing the normalized operand value for a reported state."""
+    if isinstance(operand, dict):
+        return _compile_condition(operand, capability)
+    if operand == "value":
+        value_parts = tuple(capability.path.split("."))
+        return lambda reported_state: _normalize_value(_get_state_parts(reported_state, value_parts))
+    if isinstance(operand, str):
+        target_path = operand
+        if capability.parent_path and "." not in operand:
+            target_path = f"{capability.parent_path}.{operand}"
+        parts = tuple(target_path.split("."))
+        literal = _normalize_value(operand)
+
+        def state_or_literal(reported_state: dict[str, Any]) -> Any:
+            value = _get_state_parts(reported_state, parts)
+            return literal if value is None else _normalize_value(value)
+
+        return state_or_literal
+
+    constant = _normalize_value(operand)
+    return lambda reported_state: constant
+
+
+@dataclass(frozen=True)
+class TriggerGraph:
+    """Which reported paths each trigger source reads and which capabilities its actions write."""
+
+    reads: dict[str, frozenset[str]]
+    writes: dict[str, frozenset[str]]
+    readers: dict[str, frozenset[str]]
+    writers: dict[str, tuple[str, ...]]
+    action_paths: dict[tuple[str, str], str]
+
+    def sources_reading(self, paths: Iterable[str]) -> set[str]:
+        sources: set[str] = set()
+        for path in paths:
+            if (readers := self.readers.get(path)) is not None:
+                sources |= readers
+                continue
+            for read_path, readers in self.readers.items():
+                if read_path.startswith(f"{path}.") or path.startswith(f"{read_path}."):
+                    sources |= readers
+        return sources
+
+    def capabilities_affected_by(self, paths: Iterable[str]) -> set[str]:
+        return {target for source in self.sources_reading(paths) for target in self.writes[source]}
+
+    def trigger_inputs_for(self, paths: Iterable[str]) -> set[str]:
+        """Reported paths read by the triggers that write any of the given capabilities."""
+        return {read_path for path in paths for source in self.writers.get(path, ()) for read_path in self.reads[source]}
+
+
+def build_trigger_graph(capabilities: Capabilities) -> TriggerGraph:
+    reads: dict[str, frozenset[str]] = {}
+    writes: dict[str, frozenset[str]] = {}
+    readers: dict[str, set[str]] = {}
+    writers: dict[str, list[str]] = {}
+    action_paths: dict[tuple[str, str], str] = {}
+    name_index = build_name_index(capabilities)
+
+    for path, capability in capabilities.items():
+        triggers = _all_triggers(capability)
+        if not triggers:
+            continue
+
+        targets: set[str] = set()
+        for trigger in triggers:
+            action = trigger.get("action")
+            if not isinstance(action, dict):
+                continue
+            for target_name, attrs in action.items():
+                if not isinstance(attrs, dict):
+                    continue
+                target_path = resolve_action_path(capability, target_name, capabilities, name_index)
+                if target_path is not None:
+                    action_paths[(path, target_name)] = target_path
+                    targets.add(target_path)
+
+        reads[path] = frozenset(_trigger_source_paths(capability))
+        writes[path] = frozenset(targets)
+        for read_path in reads[path]:
+            readers.setdefault(read_path, set()).add(path)
+        for target_path in targets:
+            writers.setdefault(target_path, []).append(path)
+
+    return TriggerGraph(
+        reads=reads,
+        writes=writes,
+        readers={path: frozenset(sources) for path, sources in readers.items()},
+        writers={path: tuple(sources) for path, sources in writers.items()},
+        action_paths=action_paths,
+    )
+
 
 def capabilities_from_json(json: dict[str, Any]) -> ApplianceInfo:
     appliance_info_json = json.get("applianceInfo", {})
@@ -135,6 +475,29 @@ def capabilities_from_json(json: dict[str, Any]) -> ApplianceInfo:
     )
 
 
+def appliance_info_to_dict(info: ApplianceInfo) -> dict[str, Any]:
+    return {
+        "appliance_info": asdict(info.appliance_info),
+        "capabilities": [_capability_to_dict(capability) for capability in info.capabilities.values()],
+        "data_model_version": info.data_model_version,
+        "raw": info.raw,
+    }
+
+
+def appliance_info_from_dict(data: dict[str, Any]) -> ApplianceInfo:
+    capabilities: Capabilities = {}
+    for raw_capability in data["capabilities"]:
+        capability = _capability_from_dict(raw_capability)
+        capabilities[capability.path] = capability
+
+    return ApplianceInfo(
+        appliance_info=ApplianceInfoValue(**data["appliance_info"]),
+        capabilities=capabilities,
+        data_model_version=data.get("data_model_version"),
+        raw=data.get("raw"),
+    )
+
+
 def normalize_capabilities(raw_capabilities: dict[str, Any], parent_path: str | None = None) -> Capabilities:
     capabilities: Capabilities = {}
     for name, raw_capability in raw_capabilities.items():
@@ -170,7 +533,87 @@ def command_body_for_capability(
     return {"commands": [_nested_command(capability.path.split("."), value)]}
 
 
-def resolve_action_path(source: Capability, target_name: str, capabilities: Capabilities) -> str | None:
+def command_body_for_capabilities(commands: list[tuple[Capability, Any]]) -> dict[str, Any]:
+    return {"commands": [_nested_command(capability.path.split("."), value) for capability, value in commands]}
+
+
+def reported_state_after(reported_state: dict[str, Any], writes: list[tuple[str, Any]]) -> dict[str, Any]:
+    reported = deepcopy(reported_state)
+    for path, value in writes:
+        set_state_value(reported, path, value)
+    return reported
+
+
+def implied_writes(
+    writes: list[tuple[str, Any]],
+    simulated_writes: list[tuple[str, Any]],
+) -> list[list[tuple[str, Any]]]:
+    """Split simulated_writes into the state changes the appliance applies after each of writes.
+
+    simulated_writes must start with writes[0] and contain every write in order; the entries between one write and
+    the next, such as the running state implied by a power write, are attributed to the earlier write.
+    """
+    implied: list[list[tuple[str, Any]]] = []
+    index = 0
+    for write in simulated_writes:
+        if index < len(writes) and write == writes[index]:
+            implied.append([])
+            index += 1
+        elif implied:
+            implied[-1].append(write)
+        else:
+            raise ValueError(f"Simulated write {write} precedes the first command write")
+    if index != len(writes):
+        raise ValueError(f"Simulated writes do not contain command write {writes[index]}")
+    return implied
+
+
+def diff_state_paths(old: dict[str, Any], new: dict[str, Any], parent_path: str | None = None) -> set[str]:
+    """Return the dotted leaf paths whose values differ between two reported states."""
+    changed: set[str] = set()
+    for key in old.keys() | new.keys():
+        path = f"{parent_path}.{key}" if parent_path else key
+        old_value = old.get(key, _MISSING)
+        new_value = new.get(key, _MISSING)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changed |= diff_state_paths(old_value, new_value, path)
+        elif old_value != new_value or type(old_value) is not type(new_value):
+            changed.add(path)
+            for value in (old_value, new_value):
+                if isinstance(value, dict):
+                    changed |= diff_state_paths(value, {}, path)
+    return changed
+
+
+def build_name_index(capabilities: Capabilities) -> NameIndex:
+    index: NameIndex = {}
+    for position, (path, capability) in enumerate(capabilities.items()):
+        index.setdefault(_normalize_name(path), (position, path))
+        index.setdefault(_normalize_name(capability.name), (position, path))
+    return index
+
+
+def build_property_paths(capabilities: Capabilities) -> dict[str, str]:
+    names: dict[str, list[str]] = {}
+    leaves: dict[str, list[str]] = {}
+    for path, capability in capabilities.items():
+        names.setdefault(capability.name, []).append(path)
+        leaves.setdefault(path.rsplit(".", 1)[-1], []).append(path)
+
+    property_paths = {path: path for path in capabilities}
+    for candidates in (names, leaves):
+        for property_name, paths in candidates.items():
+            if len(paths) == 1:
+                property_paths.setdefault(property_name, paths[0])
+    return property_paths
+
+
+def resolve_action_path(
+    source: Capability,
+    target_name: str,
+    capabilities: Capabilities,
+    name_index: NameIndex | None = None,
+) -> str | None:
     if target_name == "self":
         return source.path
     if target_name in capabilities:
@@ -182,11 +625,10 @@ def resolve_action_path(source: Capability, target_name: str, capabilities: Capa
         if sibling_path in capabilities:
             return sibling_path
 
-    normalized_target = _normalize_name(target_name)
-    for path, capability in capabilities.items():
-        if _normalize_name(path) == normalized_target or _normalize_name(capability.name) == normalized_target:
-            return path
-    return None
+    if name_index is None:
+        name_index = build_name_index(capabilities)
+    entry = name_index.get(_normalize_name(target_name))
+    return entry[1] if entry is not None else None
 
 
 def _capability_from_json(path: str, name: str, raw_capability: dict[str, Any]) -> Capability:
@@ -216,38 +658,106 @@ def _capability_from_json(path: str, name: str, raw_capability: dict[str, Any])
     )
 
 
+def _capability_to_dict(capability: Capability) -> dict[str, Any]:
+    return {
+        "path": capability.path,
+        "name": capability.name,
+        "type": capability.type,
+        "access": capability.access.value,
+        "min": capability.min,
+        "max": capability.max,
+        "step": capability.step,
+        "disabled": capability.disabled,
+        "values": list(capability.values),
+        "default": capability.default,
+        "triggers": [_copy_trigger(trigger) for trigger in capability.triggers],
+        "schedulable": capability.schedulable,
+        "raw": deepcopy(capability.raw),
+    }
+
+
+def _capability_from_dict(data: dict[str, Any]) -> Capability:
+    return Capability(
+        path=data["path"],
+        name=data["name"],
+        type=data["type"],
+        access=Access(data["access"]),
+        min=data.get("min"),
+        max=data.get("max"),
+        step=data.get("step"),
+        disabled=bool(data.get("disabled", False)),
+        values=tuple(data.get("values", ())),
+        default=data.get("default"),
+        triggers=tuple(trigger for trigger in data.get("triggers", ()) if isinstance(trigger, dict)),
+        schedulable=bool(data.get("schedulable", False)),
+        raw=data.get("raw"),
+    )
+
+
 def _copy_trigger(trigger: dict[str, Any]) -> dict[str, Any]:
     return deepcopy(trigger)
 
 
-def _looks_like_capability_group(value: dict[str, Any]) -> bool:
-    if "access" in value or "values" in value or "min" in value or "max" in value:
-        return False
-    return any(isinstance(child, dict) for child in value.values())
+def _freeze_state_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_state_value(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze_state_value(item) for item in value)
+    return (type(value).__name__, value)
 
 
-def _apply_triggers(capabilities: Capabilities, capability: Capability, reported_state: dict[str, Any]) -> None:
+def _all_triggers(capability: Capability) -> list[dict[str, Any]]:
     triggers = list(capability.triggers)
-    current_value = get_state_value(reported_state, capability.path)
     raw_values = (capability.raw or {}).get("values")
     if isinstance(raw_values, dict):
-        value_config = raw_values.get(str(current_value)) or raw_values.get(_normalize_value(current_value))
-        if isinstance(value_config, dict):
-            triggers.extend(trigger for trigger in value_config.get("triggers", []) if isinstance(trigger, dict))
+        for value_config in raw_values.values():
+            if isinstance(value_config, dict):
+                triggers.extend(trigger for trigger in value_config.get("triggers", []) if isinstance(trigger, dict))
+    return triggers
+
 
+def _trigger_source_paths(capability: Capability) -> set[str]:
+    triggers = _all_triggers(capability)
+    if not triggers:
+        return set()
+
+    paths = {capability.path}
     for trigger in triggers:
-        condition = trigger.get("condition")
-        if condition is not None and not _evaluate_condition(condition, capability, reported_state):
-            continue
+        _collect_condition_paths(trigger.get("condition"), capability, paths)
+    return paths
 
-        action = trigger.get("action")
-        if not isinstance(action, dict):
-            continue
 
+def _collect_condition_paths(condition: Any, capability: Capability, paths: set[str]) -> None:
+    if not isinstance(condition, dict):
+        return
+
+    for operand in (condition.get("operand_1"), condition.get("operand_2")):
+        if isinstance(operand, dict):
+            _collect_condition_paths(operand, capability, paths)
+        elif isinstance(operand, str) and operand != "value":
+            if capability.parent_path and "." not in operand:
+                paths.add(f"{capability.parent_path}.{operand}")
+            else:
+                paths.add(operand)
+
+
+def _looks_like_capability_group(value: dict[str, Any]) -> bool:
+    if "access" in value or "values" in value or "min" in value or "max" in value:
+        return False
+    return any(isinstance(child, dict) for child in value.values())
+
+
+def _apply_actions(
+    capabilities: Capabilities,
+    capability: Capability,
+    actions: list[dict[str, Any]],
+    name_index: NameIndex,
+) -> None:
+    for action in actions:
         for target_name, attrs in action.items():
             if not isinstance(attrs, dict):
                 continue
-            target_path = resolve_action_path(capability, target_name, capabilities)
+            target_path = resolve_action_path(capability, target_name, capabilities, name_index)
             if target_path is None:
                 continue
             capabilities[target_path] = _apply_action_attrs(capabilities[target_path], attrs)
@@ -276,41 +786,13 @@ def _apply_action_attrs(capability: Capability, attrs: dict[str, Any]) -> Capabi
     return replace(capability, **changes) if changes else capability
 
 
-def _evaluate_condition(condition: Any, capability: Capability, reported_state: dict[str, Any]) -> bool:
-    if not isinstance(condition, dict):
-        return False
-
-    operator = str(condition.get("operator", "eq")).lower()
-    if operator in {"and", "or"}:
-        left = _evaluate_condition(condition.get("operand_1"), capability, reported_state)
-        right = _evaluate_condition(condition.get("operand_2"), capability, reported_state)
-        return left and right if operator == "and" else left or right
-
-    left = _condition_operand_value(condition.get("operand_1"), capability, reported_state)
-    right = _condition_operand_value(condition.get("operand_2"), capability, reported_state)
-    if operator == "ne":
-        return _normalize_value(left) != _normalize_value(right)
-    return _normalize_value(left) == _normalize_value(right)
-
-
-def _condition_operand_value(operand: Any, capability: Capability, reported_state: dict[str, Any]) -> Any:
-    if isinstance(operand, dict):
-        return _evaluate_condition(operand, capability, reported_state)
-    if operand == "value":
-        return get_state_value(reported_state, capability.path)
-    if isinstance(operand, str):
-        target_path = operand
-        if capability.parent_path and "." not in operand:
-            target_path = f"{capability.parent_path}.{operand}"
-        value = get_state_value(reported_state, target_path)
-        if value is not None:
-            return value
-    return operand
+def get_state_value(reported_state: dict[str, Any], path: str) -> Any:
+    return _get_state_parts(reported_state, path.split("."))
 
 
-def get_state_value(reported_state: dict[str, Any], path: str) -> Any:
+def _get_state_parts(reported_state: dict[str, Any], parts: Iterable[str]) -> Any:
     current: Any = reported_state
-    for part in path.split("."):
+    for part in parts:
         if not isinstance(current, dict) or part not in current:
             return None
         current = current[part]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .appliance_state import ApplianceState
+from .capabilities import ApplianceInfo, appliance_info_from_dict, appliance_info_to_dict
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPABILITY_CACHE_VERSION = 1
+
+
+class CapabilityCache:
+    """Disk-backed ApplianceInfo cache keyed by appliance id, PNC and data model version."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            version=CAPABILITY_CACHE_VERSION,
+            key=f"{DOMAIN}.{entry_id}.capabilities",
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+
+        data = await self._store.async_load() or {}
+        appliances = data.get("appliances")
+        self._entries = appliances if isinstance(appliances, dict) else {}
+        self._loaded = True
+
+    def __contains__(self, appliance_id: str) -> bool:
+        return appliance_id in self._entries
+
+    def get(self, appliance_id: str, state: ApplianceState) -> ApplianceInfo | None:
+        entry = self._entries.get(appliance_id)
+        if not isinstance(entry, dict):
+            return None
+
+        if entry.get("data_model_version") != _state_data_model_version(state):
+            _LOGGER.debug("Capability cache miss for appliance %s: data model version changed", appliance_id)
+            return None
+        pnc = _state_pnc(state)
+        if pnc is not None and entry.get("pnc") != pnc:
+            _LOGGER.debug("Capability cache miss for appliance %s: PNC changed", appliance_id)
+            return None
+
+        try:
+            return appliance_info_from_dict(entry["info"])
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.debug("Dropping unreadable capability cache entry for appliance %s: %s", appliance_id, e)
+            self._entries.pop(appliance_id, None)
+            self._dirty = True
+            return None
+
+    def set(self, appliance_id: str, info: ApplianceInfo, state: ApplianceState) -> bool:
+        entry = {
+            "pnc": info.appliance_info.pnc or _state_pnc(state),
+            "data_model_version": _state_data_model_version(state),
+            "info": appliance_info_to_dict(info),
+        }
+        if self._entries.get(appliance_id) == entry:
+            return False
+
+        self._entries[appliance_id] = entry
+        self._dirty = True
+        return True
+
+    def retain(self, appliance_ids: set[str]) -> None:
+        for appliance_id in list(self._entries):
+            if appliance_id not in appliance_ids:
+                self._entries.pop(appliance_id)
+                self._dirty = True
+
+    async def async_save(self) -> None:
+        if not self._dirty:
+            return
+
+        await self._store.async_save({"appliances": self._entries})
+        self._dirty = False
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+        self._entries = {}
+        self._dirty = False
+
+
+def _state_data_model_version(state: ApplianceState) -> str | None:
+    value = state.data_model_version or state.get_reported("dataModelVersion")
+    return str(value) if value is not None else None
+
+
+def _state_pnc(state: ApplianceState) -> str | None:
+    value = state.get_reported("applianceData.pnc")
+    return str(value) if value is not None else None
@@ -10,5 +10,44 @@ CONF_REFRESH_TOKEN = "refresh_token"
 CONF_TOKEN_EXPIRATION_DATE = "token_expiration_date"
 CONF_ACCOUNT_EMAIL = "account_email"
 CONF_USE_LIVESTREAM_UPDATES = "use_livestream_updates"
+CONF_FAST_START = "fast_start"
+CONF_REQUEST_CONCURRENCY = "request_concurrency"
+CONF_LIVESTREAM_COALESCE_WINDOW = "livestream_coalesce_window"
 
 MIN_SCAN_INTERVAL = 30
+POLL_MAX_INTERVAL_FACTOR = 4
+POLL_DISCONNECTED_INTERVAL = 900
+POLL_STAGGER = 2
+
+# The Electrolux API does not publish its rate limits; 429 responses and their Retry-After are authoritative and
+# pause the scheduler. The local bucket only smooths bursts, sized so discovery and the startup refresh of a
+# typical household (a few requests per appliance) fit in the burst instead of being serialized.
+API_REQUEST_RATE = 5.0
+API_REQUEST_BURST = 30
+API_RATE_LIMIT_DEFAULT_RETRY_AFTER = 30
+API_RATE_LIMIT_MAX_RETRY_AFTER = 120
+API_RATE_LIMIT_MAX_RETRIES = 2
+API_COMMAND_CONCURRENCY = 4
+API_TOKEN_CONCURRENCY = 1
+API_STATE_CONCURRENCY = 4
+API_DISCOVERY_CONCURRENCY = 2
+
+DISCOVERY_CONCURRENCY = 4
+MAX_REQUEST_CONCURRENCY = 16
+STATE_REFRESH_CONCURRENCY = 4
+STATE_REFRESH_TIMEOUT = 15
+TOKEN_REFRESH_MARGIN = 600
+TOKEN_REFRESH_RETRY_BASE_DELAY = 30
+TOKEN_REFRESH_RETRY_MAX_DELAY = 600
+
+LIVESTREAM_IDLE_TIMEOUT = 120
+LIVESTREAM_COALESCE_WINDOW_MS = 0
+MAX_LIVESTREAM_COALESCE_WINDOW_MS = 1000
+COMMAND_ECHO_TTL = 60
+COMMAND_ECHO_MAX_ENTRIES = 500
+COMMAND_DEBOUNCE_WINDOW = 0.5
+
+LIVESTREAM_RECONNECT_BASE_DELAY = 5
+LIVESTREAM_RECONNECT_MAX_DELAY = 300
+LIVESTREAM_CIRCUIT_FAILURE_THRESHOLD = 8
+LIVESTREAM_CIRCUIT_OPEN_DURATION = 900
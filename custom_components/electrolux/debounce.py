@@ -0,0 +1,102 @@
+"""Last-write-wins debouncing of capability commands."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class _PendingCommand:
+    value: Any
+    send: Callable[[Any], Awaitable[bool]]
+    deadline: float
+    waiters: list[asyncio.Future[bool]] = field(default_factory=list)
+
+
+class CommandDebouncer:
+    """Collapse rapid writes for the same key into one send of the final value."""
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._pending: dict[Hashable, _PendingCommand] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.submitted = 0
+        self.sent = 0
+        self.avoided = 0
+
+    async def submit(self, key: Hashable, value: Any, send: Callable[[Any], Awaitable[bool]]) -> bool:
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[bool] = loop.create_future()
+        deadline = loop.time() + self.window
+        self.submitted += 1
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingCommand(value=value, send=send, deadline=deadline)
+            self._pending[key] = pending
+            task = loop.create_task(self._flush(key, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            pending.value = value
+            pending.send = send
+            pending.deadline = deadline
+            self.avoided += 1
+        pending.waiters.append(waiter)
+
+        return await waiter
+
+    async def _flush(self, key: Hashable, pending: _PendingCommand) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while (delay := pending.deadline - loop.time()) > 0:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._pending.pop(key, None)
+            for waiter in pending.waiters:
+                waiter.cancel()
+            raise
+
+        if self._pending.get(key) is pending:
+            del self._pending[key]
+
+        self.sent += 1
+        try:
+            result = await pending.send(pending.value)
+        except Exception as e:
+            for waiter in pending.waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+        except asyncio.CancelledError:
+            for waiter in pending.waiters:
+                waiter.cancel()
+            raise
+
+        for waiter in pending.waiters:
+            if not waiter.done():
+                waiter.set_result(result)
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        for pending in self._pending.values():
+            for waiter in pending.waiters:
+                waiter.cancel()
+        self._pending.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "window": self.window,
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "avoided": self.avoided,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id) or {}
+    hub = entry_data.get("hub")
+    return {
+        "options": dict(entry.options),
+        "hub": hub.diagnostics() if hub is not None else None,
+    }
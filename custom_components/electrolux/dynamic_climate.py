@@ -215,20 +215,21 @@ class DynamicClimate(DynamicElectroluxEntity, ClimateEntity):
         if capability_value is not None:
             self._last_writable_fan_mode = _fan_mode_state_key(capability_value)
 
-    def _handle_appliance_state_update(self, changed_property: str | None) -> None:
-        if changed_property is None or changed_property == self.fan_mode_path:
+    def _handle_appliance_state_update(self, changed_properties: frozenset[str] | None) -> None:
+        if changed_properties is None or self.fan_mode_path in changed_properties:
             self._prefer_last_writable_fan_mode = False
 
+    def _turn_on_write(self) -> tuple[str, Any] | None:
+        if self.power_path:
+            return self.power_path, _capability_value(self.capability(self.power_path), ON_VALUES, "ON")
+        if self.state_path:
+            return self.state_path, "RUNNING"
+        return None
+
     async def async_turn_on(self) -> None:
         self._recompute_capability_controls()
-        if self.power_path:
-            value = _capability_value(self.capability(self.power_path), ON_VALUES, "ON")
-            success = await self.send_capability(self.power_path, value)
-        elif self.state_path:
-            success = await self.send_capability(self.state_path, "RUNNING")
-        else:
-            success = False
-        if success:
+        write = self._turn_on_write()
+        if write is not None and await self.send_capability(*write):
             self._set_local_running_state(True)
             self._update_attributes()
             self.async_write_ha_state()
@@ -255,37 +256,62 @@ class DynamicClimate(DynamicElectroluxEntity, ClimateEntity):
         previous_fan_capability = self.capability(self.fan_mode_path)
         previous_fan_writable = bool(previous_fan_capability and previous_fan_capability.can_write)
         previous_writable_fan_mode = self._last_writable_fan_mode
-        if not _is_running(self.state_value(self.state_path)):
-            await self.async_turn_on()
-            self._recompute_capability_controls()
+
+        writes: list[tuple[str, Any]] = []
+        simulated_writes: list[tuple[str, Any]] = []
+        turn_on_write = None if _is_running(self.state_value(self.state_path)) else self._turn_on_write()
+        if turn_on_write is not None:
+            writes.append(turn_on_write)
+            simulated_writes.append(turn_on_write)
+            if self.state_path and turn_on_write[0] != self.state_path:
+                simulated_writes.append((self.state_path, "RUNNING"))
+
+        fan_mode_write = None
+        if self.mode_path:
+            mode_write = (
+                self.mode_path,
+                _api_mode_from_hvac(self.capabilities_after(simulated_writes).get(self.mode_path), hvac_mode),
+            )
+            writes.append(mode_write)
+            simulated_writes.append(mode_write)
+            fan_mode_write = self._fan_mode_alignment_write(self.capabilities_after(simulated_writes))
+            if fan_mode_write is not None:
+                writes.append(fan_mode_write)
+                simulated_writes.append(fan_mode_write)
+
+        if not writes or not await self.send_capabilities(writes, simulated_writes):
+            return
+
+        if turn_on_write is not None:
+            self._set_local_running_state(True)
         if self.mode_path:
-            value = _api_mode_from_hvac(self.capability(self.mode_path), hvac_mode)
-            if await self.send_capability(self.mode_path, value):
-                self._recompute_capability_controls()
-                await self._align_fan_mode_after_hvac_mode_change(
-                    previous_fan_writable,
-                    previous_writable_fan_mode,
-                )
-                self._update_attributes()
-                self.async_write_ha_state()
-
-    async def _align_fan_mode_after_hvac_mode_change(
+            self._recompute_capability_controls()
+            self._after_hvac_mode_change(fan_mode_write, previous_fan_writable, previous_writable_fan_mode)
+        self._update_attributes()
+        self.async_write_ha_state()
+
+    def _fan_mode_alignment_write(self, runtime_capabilities: dict[str, Capability]) -> tuple[str, Any] | None:
+        capability = runtime_capabilities.get(self.fan_mode_path) if self.fan_mode_path else None
+        if self.fan_mode_path is None or capability is None or not capability.can_write or not capability.values:
+            return None
+        if _fan_mode_capability_value(capability, self.state_value(self.fan_mode_path)) is not None:
+            return None
+        return self.fan_mode_path, capability.values[0]
+
+    def _after_hvac_mode_change(
         self,
+        fan_mode_write: tuple[str, Any] | None,
         previous_fan_writable: bool,
         previous_writable_fan_mode: str | None,
     ) -> None:
-        capability = self.capability(self.fan_mode_path)
-        if self.fan_mode_path is None or capability is None or not capability.can_write or not capability.values:
+        if fan_mode_write is not None:
+            self._last_writable_fan_mode = _fan_mode_state_key(fan_mode_write[1])
+            self._prefer_last_writable_fan_mode = False
             return
 
-        current_value = _fan_mode_capability_value(capability, self.state_value(self.fan_mode_path))
-        if current_value is None:
-            value = capability.values[0]
-            if await self.send_capability(self.fan_mode_path, value):
-                self._last_writable_fan_mode = _fan_mode_state_key(value)
-                self._prefer_last_writable_fan_mode = False
+        capability = self.capability(self.fan_mode_path)
+        if capability is None or not capability.can_write or not capability.values:
             return
-
         if (
             previous_writable_fan_mode
             and not previous_fan_writable
@@ -297,7 +323,7 @@ class DynamicClimate(DynamicElectroluxEntity, ClimateEntity):
         self._recompute_capability_controls()
         if self.target_temperature_path is None or "temperature" not in kwargs:
             return
-        if await self.send_capability(self.target_temperature_path, kwargs["temperature"]):
+        if await self.send_capability(self.target_temperature_path, kwargs["temperature"], debounce=True):
             self._update_attributes()
             self.async_write_ha_state()
 
@@ -163,6 +163,6 @@ class DynamicNumber(DynamicElectroluxEntity, NumberEntity):
         self._attr_native_value = self.state_value(self.capability_path)
 
     async def async_set_native_value(self, value: float) -> None:
-        if await self.send_capability(self.capability_path, value):
+        if await self.send_capability(self.capability_path, value, debounce=True):
             self._update_attributes()
             self.async_write_ha_state()
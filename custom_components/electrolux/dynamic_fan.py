@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 
 from .appliance import ApplianceData
-from .capabilities import set_state_value
+from .capabilities import Capability
 from .dynamic_helpers import (
     OFF_VALUES,
     DynamicElectroluxEntity,
@@ -126,6 +125,9 @@ class DynamicFan(DynamicElectroluxEntity, FanEntity):
     def preset_modes(self) -> list[str] | None:
         return self._attr_preset_modes
 
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        return (*super()._state_snapshot(), self.is_on)
+
     @property
     def is_on(self) -> bool:
         if not self.available:
@@ -141,22 +143,21 @@ class DynamicFan(DynamicElectroluxEntity, FanEntity):
         preset_mode: str | None = None,
         **kwargs: Any,
     ) -> None:
-        success = True
-        sent_command = False
         workmode_capability = self.capability(self.workmode_path)
         speed_capability = self.capability(self.fan_speed_path)
         can_workmode_write = workmode_capability is not None and workmode_capability.can_write
         can_speed_write = speed_capability is not None and speed_capability.can_write
         if percentage is None and not can_workmode_write and can_speed_write:
             percentage = self._attr_percentage or 100
+        writes: list[tuple[str, Any]] = []
         if self.workmode_path and can_workmode_write:
             workmode = self._workmode_for_speed(preset_mode) if percentage is not None else preset_mode or self._last_active_mode
-            success = await self.send_capability(self.workmode_path, workmode)
-            sent_command = True
-        if success and percentage is not None and self.fan_speed_path and can_speed_write:
-            success = await self.send_capability(self.fan_speed_path, self._fan_speed_from_percentage(percentage))
-            sent_command = True
-        if success and sent_command:
+            writes.append((self.workmode_path, workmode))
+        if percentage is not None and self.fan_speed_path:
+            speed_capability = self.capabilities_after(writes).get(self.fan_speed_path)
+            if speed_capability is not None and speed_capability.can_write:
+                writes.append((self.fan_speed_path, self._fan_speed_from_percentage(percentage)))
+        if writes and await self.send_capabilities(writes):
             self._update_attributes()
             self.async_write_ha_state()
 
@@ -179,8 +180,17 @@ class DynamicFan(DynamicElectroluxEntity, FanEntity):
         if current and not _is_off_value(current):
             self._last_active_mode = current
         value = _capability_value(workmode_capability, (*OFF_VALUES, "PowerOff", "POWER_OFF"), "PowerOff")
-        if await self.send_capability(self.workmode_path, value):
-            await self._async_turn_off_safety_lock()
+        writes: list[tuple[str, Any]] = [(self.workmode_path, value)]
+        if safety_lock_write := self._safety_lock_off_write(self.capabilities_after(writes)):
+            writes.append(safety_lock_write)
+        if await self.send_capabilities(writes):
+            if safety_lock_write is not None:
+                await self.hub._update_entities_for_appliance(
+                    self.appliance.id,
+                    self.appliance_state,
+                    call_async_update=False,
+                    changed_property=self.safety_lock_path,
+                )
             self._update_attributes()
             self.async_write_ha_state()
 
@@ -247,24 +257,16 @@ class DynamicFan(DynamicElectroluxEntity, FanEntity):
     def _fan_speed_can_write_for_workmode(self, workmode: str) -> bool:
         if self.workmode_path is None or self.fan_speed_path is None:
             return False
-        reported = deepcopy(self.appliance_state.properties.reported.raw)
-        set_state_value(reported, self.workmode_path, workmode)
-        capability = self.info.runtime_capabilities(reported).get(self.fan_speed_path)
+        capability = self.capabilities_after([(self.workmode_path, workmode)]).get(self.fan_speed_path)
         return capability is not None and capability.can_write
 
-    async def _async_turn_off_safety_lock(self) -> None:
+    def _safety_lock_off_write(self, runtime_capabilities: dict[str, Capability]) -> tuple[str, Any] | None:
         if not self.safety_lock_path or not _is_on_value(self.state_value(self.safety_lock_path)):
-            return
+            return None
 
-        capability = self.capability(self.safety_lock_path)
+        capability = runtime_capabilities.get(self.safety_lock_path)
         if capability is None or not capability.can_write:
-            return
+            return None
 
         value: bool | str = False if capability.type == "boolean" else _capability_value(capability, OFF_VALUES, "OFF")
-        if await self.send_capability(self.safety_lock_path, value):
-            await self.hub._update_entities_for_appliance(
-                self.appliance.id,
-                self.appliance_state,
-                call_async_update=False,
-                changed_property=self.safety_lock_path,
-            )
+        return self.safety_lock_path, value
@@ -5,8 +5,9 @@ from typing import Any
 from homeassistant.components.climate import HVACMode
 from .appliance import ApplianceData
 from .appliance_state import ConnectionState
-from .capabilities import Capability, DeviceType
+from .capabilities import Capability, DeviceType, reported_state_after
 from .entity import ElectroluxApplianceEntity
+from .entity_state import attribute_snapshot
 from .hub import ElectroluxHub
 
 
@@ -18,6 +19,8 @@ OFF_VALUES = ("OFF", "Off", "off", "FALSE", "false", "DISABLED", "disabled")
 
 
 class DynamicElectroluxEntity(ElectroluxApplianceEntity):
+    _last_written_state: tuple[Any, ...] | None = None
+
     def __init__(self, hub: ElectroluxHub, appliance_data: ApplianceData) -> None:
         self.hub = hub
         self.appliance_data = appliance_data
@@ -26,6 +29,24 @@ class DynamicElectroluxEntity(ElectroluxApplianceEntity):
         self.appliance_state = appliance_data.state
         self._attr_should_poll = False
 
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Everything this entity exposes to Home Assistant that can change between updates."""
+        return (self.available, attribute_snapshot(self))
+
+    def async_write_ha_state(self) -> None:
+        self._last_written_state = self._state_snapshot()
+        super().async_write_ha_state()
+
+    def async_write_ha_state_if_changed(self) -> bool:
+        if self._state_snapshot() == self._last_written_state:
+            return False
+        self.async_write_ha_state()
+        return True
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.hub.remove_entity(self)
+        await super().async_will_remove_from_hass()
+
     @property
     def available(self) -> bool:
         return self.appliance_state.connectionState == ConnectionState.CONNECTED
@@ -35,17 +56,35 @@ class DynamicElectroluxEntity(ElectroluxApplianceEntity):
             return None
         return self.info.runtime_capabilities(self.appliance_state.properties.reported.raw).get(path)
 
+    def capabilities_after(self, writes: list[tuple[str, Any]]) -> dict[str, Capability]:
+        return self.info.runtime_capabilities(reported_state_after(self.appliance_state.properties.reported.raw, writes))
+
     def state_value(self, path: str | None, default: Any = None) -> Any:
         if path is None:
             return default
         return self.appliance_state.get_reported(path, default)
 
-    async def send_capability(self, path: str, value: Any) -> bool:
-        success = await self.hub.send_capability_command(self.appliance.id, path, value)
-        if success:
+    async def send_capability(self, path: str, value: Any, *, debounce: bool = False) -> bool:
+        success = await self.hub.send_capability_command(self.appliance.id, path, value, debounce=debounce)
+        if success and not debounce:
             self.appliance_state.set_reported(path, value)
         return success
 
+    async def send_capabilities(
+        self,
+        writes: list[tuple[str, Any]],
+        simulated_writes: list[tuple[str, Any]] | None = None,
+    ) -> bool:
+        success = await self.hub.send_capability_commands(
+            self.appliance.id,
+            writes,
+            simulated_writes=simulated_writes,
+        )
+        if success:
+            for path, value in simulated_writes if simulated_writes is not None else writes:
+                self.appliance_state.set_reported(path, value)
+        return success
+
 
 def _main_entity_consumed_paths(appliance_data: ApplianceData) -> set[str]:
     runtime_capabilities = appliance_data.info.runtime_capabilities(appliance_data.state.properties.reported.raw)
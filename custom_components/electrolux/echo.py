@@ -0,0 +1,139 @@
+"""Recognition of livestream echoes of commands this integration sent."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any
+
+EchoKey = tuple[str, str]
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class CommandEchoTracker:
+    """Expiring multiset of sent (appliance, property, value) commands with a global size bound."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._pending: dict[EchoKey, dict[Hashable, deque[tuple[int, float]]]] = {}
+        self._expiry: deque[tuple[float, int, EchoKey, Hashable]] = deque()
+        self._sequence = 0
+        self._size = 0
+        self.registered = 0
+        self.matched = 0
+        self.expired = 0
+        self.evicted = 0
+        self.latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+        self.last_latency_seconds: float | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def register(self, appliance_id: str, property_name: str, value: Any) -> None:
+        now = self._clock()
+        self._expire(now)
+        while self._size >= self.max_entries and self._expiry:
+            if self._pop_oldest():
+                self.evicted += 1
+
+        key = (appliance_id, property_name)
+        frozen = _hashable(value)
+        sequence = self._sequence
+        self._sequence += 1
+        self._pending.setdefault(key, {}).setdefault(frozen, deque()).append((sequence, now))
+        self._expiry.append((now + self.ttl, sequence, key, frozen))
+        self._size += 1
+        self.registered += 1
+        if len(self._expiry) > 2 * self.max_entries:
+            self._compact()
+
+    def match(self, appliance_id: str, property_name: str, value: Any) -> bool:
+        """Consume the oldest pending command with this value and record its echo latency."""
+        now = self._clock()
+        self._expire(now)
+        key = (appliance_id, property_name)
+        values = self._pending.get(key)
+        if not values:
+            return False
+        frozen = _hashable(value)
+        entries = values.get(frozen)
+        if not entries:
+            return False
+
+        _, sent_at = entries.popleft()
+        self._release(key, frozen)
+        latency = now - sent_at
+        self.matched += 1
+        self.latency_seconds += latency
+        self.max_latency_seconds = max(self.max_latency_seconds, latency)
+        self.last_latency_seconds = latency
+        return True
+
+    def discard_where(self, predicate: Callable[[str, str], bool]) -> None:
+        for key in [key for key in self._pending if predicate(*key)]:
+            self._size -= sum(len(entries) for entries in self._pending.pop(key).values())
+
+    def _expire(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            if self._pop_oldest():
+                self.expired += 1
+
+    def _pop_oldest(self) -> bool:
+        """Pop the oldest queued entry; return whether it was still pending rather than already matched."""
+        _, sequence, key, frozen = self._expiry.popleft()
+        entries = self._pending.get(key, {}).get(frozen)
+        if not entries or entries[0][0] != sequence:
+            return False
+        entries.popleft()
+        self._release(key, frozen)
+        return True
+
+    def _compact(self) -> None:
+        """Drop queued entries that were already matched or discarded so the queue stays bounded."""
+        pending = {
+            sequence
+            for values in self._pending.values()
+            for entries in values.values()
+            for sequence, _ in entries
+        }
+        self._expiry = deque(entry for entry in self._expiry if entry[1] in pending)
+
+    def _release(self, key: EchoKey, frozen: Hashable) -> None:
+        self._size -= 1
+        values = self._pending[key]
+        if not values[frozen]:
+            del values[frozen]
+        if not values:
+            del self._pending[key]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ttl": self.ttl,
+            "pending": self._size,
+            "registered": self.registered,
+            "matched": self.matched,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "average_latency_seconds": round(self.latency_seconds / self.matched, 3) if self.matched else None,
+            "max_latency_seconds": round(self.max_latency_seconds, 3),
+            "last_latency_seconds": (
+                round(self.last_latency_seconds, 3) if self.last_latency_seconds is not None else None
+            ),
+        }
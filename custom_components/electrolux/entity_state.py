@@ -0,0 +1,23 @@
+"""Snapshot of the attribute values an entity exposes to Home Assistant."""
+
+from __future__ import annotations
+
+from typing import Any
+
+ATTRIBUTE_PREFIX = "_attr_"
+CACHED_ATTRIBUTE_PREFIX = "__attr_"
+
+
+def attribute_snapshot(entity: Any) -> tuple[tuple[str, Any], ...]:
+    """The entity's ``_attr_`` values sorted by name.
+
+    Home Assistant's ``CachedProperties`` metaclass stores ``_attr_`` values backing cached properties, such as
+    ``_attr_native_value``, under ``__attr_`` names, so those are collected as well under their ``_attr_`` name.
+    """
+    values: dict[str, Any] = {}
+    for name, value in vars(entity).items():
+        if name.startswith(CACHED_ATTRIBUTE_PREFIX):
+            values[name[1:]] = value
+        elif name.startswith(ATTRIBUTE_PREFIX):
+            values[name] = value
+    return tuple(sorted(values.items(), key=lambda item: item[0]))
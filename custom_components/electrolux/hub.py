@@ -1,25 +1,108 @@
 import asyncio
 from contextlib import suppress
-from datetime import datetime
+from dataclasses import asdict, dataclass, field
 import logging
 from homeassistant.const import CONF_SCAN_INTERVAL
-from .const import CONF_ACCESS_TOKEN, CONF_API_KEY, CONF_REFRESH_TOKEN, CONF_TOKEN_EXPIRATION_DATE, DOMAIN
+from .const import (
+    COMMAND_DEBOUNCE_WINDOW,
+    COMMAND_ECHO_MAX_ENTRIES,
+    COMMAND_ECHO_TTL,
+    CONF_ACCESS_TOKEN,
+    CONF_API_KEY,
+    CONF_REFRESH_TOKEN,
+    CONF_TOKEN_EXPIRATION_DATE,
+    DISCOVERY_CONCURRENCY,
+    DOMAIN,
+    LIVESTREAM_CIRCUIT_FAILURE_THRESHOLD,
+    LIVESTREAM_CIRCUIT_OPEN_DURATION,
+    LIVESTREAM_COALESCE_WINDOW_MS,
+    LIVESTREAM_RECONNECT_BASE_DELAY,
+    LIVESTREAM_RECONNECT_MAX_DELAY,
+    MIN_SCAN_INTERVAL,
+    POLL_DISCONNECTED_INTERVAL,
+    POLL_MAX_INTERVAL_FACTOR,
+    POLL_STAGGER,
+    STATE_REFRESH_CONCURRENCY,
+    STATE_REFRESH_TIMEOUT,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 from .api import ElectroluxAPI
-from typing import Optional, Any
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Optional, Any, TypeVar
 from .appliance_state import ApplianceState, ConnectionState, update_reported_property
-from .capabilities import Capability, command_body_for_capability
+from .capabilities import (
+    ApplianceInfo,
+    Capability,
+    command_body_for_capabilities,
+    command_body_for_capability,
+    diff_state_paths,
+    implied_writes,
+    reported_state_after,
+)
+from .capability_cache import CapabilityCache
+from .appliance_snapshot import ApplianceSnapshotStore
+from .debounce import CommandDebouncer
+from .echo import CommandEchoTracker
+from .polling import AdaptivePollSchedule
+from .reconnect import CircuitState, ReconnectPolicy
+from .subscriptions import EntitySubscriptions
 from .token import Token
 from .appliance import Appliance, ApplianceData
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@dataclass
+class LivestreamStats:
+    events_received: int = 0
+    events_applied: int = 0
+    events_folded: int = 0
+    flushes: int = 0
+    dispatches: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class StateRefreshStats:
+    refreshes: int = 0
+    unchanged: int = 0
+    changed_paths: int = 0
+    full_dispatches: int = 0
+
+    def record(self, changed_properties: frozenset[str] | None) -> None:
+        self.refreshes += 1
+        if changed_properties is None:
+            self.full_dispatches += 1
+        elif not changed_properties:
+            self.unchanged += 1
+        else:
+            self.changed_paths += len(changed_properties)
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class EntityWriteStats:
+    platforms: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def record(self, platform: str, written: bool) -> None:
+        counts = self.platforms.setdefault(platform, {"written": 0, "skipped": 0})
+        counts["written" if written else "skipped"] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {platform: dict(counts) for platform, counts in self.platforms.items()}
+
 
 class ElectroluxHub:
     _COMMAND_ONLY_PROPERTIES = frozenset({"executeCommand"})
-    _COMMAND_HISTORY_LIMIT = 50
 
     def __init__(
         self,
@@ -28,25 +111,64 @@ class ElectroluxHub:
         token: Token,
         scan_interval: Optional[int],
         use_livestream_updates: bool = True,
+        discovery_concurrency: int = DISCOVERY_CONCURRENCY,
+        state_refresh_concurrency: int = STATE_REFRESH_CONCURRENCY,
+        state_refresh_timeout: float = STATE_REFRESH_TIMEOUT,
+        capability_cache: CapabilityCache | None = None,
+        appliance_snapshot: ApplianceSnapshotStore | None = None,
+        on_appliances_changed: Callable[[], None] | None = None,
+        livestream_coalesce_window: float = LIVESTREAM_COALESCE_WINDOW_MS / 1000,
+        command_debounce_window: float = COMMAND_DEBOUNCE_WINDOW,
+        command_echo_ttl: float = COMMAND_ECHO_TTL,
     ) -> None:
         self.hass = hass
         self.api_key = api_key
         self.token = token
         self.scan_interval = scan_interval
         self._use_livestream_updates = use_livestream_updates
-        self.entities = []
+        self._discovery_concurrency = max(1, discovery_concurrency)
+        self._state_refresh_concurrency = max(1, state_refresh_concurrency)
+        self._state_refresh_timeout = state_refresh_timeout
+        self._capability_cache = capability_cache
+        self._appliance_snapshot = appliance_snapshot
+        self._on_appliances_changed = on_appliances_changed
+        self._livestream_coalesce_window = livestream_coalesce_window
+        self.entity_subscriptions = EntitySubscriptions(self._entity_dependencies)
         self.discovered_appliances: list[Appliance] = []
         self.discovered_appliance_data: dict[str, ApplianceData] = {}
         self._livestream_task: asyncio.Task[None] | None = None
+        self._background_tasks: set[asyncio.Task[Any]] = set()
         self._livestream_supported_properties_loaded = False
         self._livestream_supported_properties_by_appliance: dict[str, set[str]] = {}
-        self._livestream_command_history: dict[tuple[str, str], list[Any]] = {}
+        self._command_echoes = CommandEchoTracker(ttl=command_echo_ttl, max_entries=COMMAND_ECHO_MAX_ENTRIES)
+        self._pending_livestream_updates: dict[str, set[str]] = {}
+        self._livestream_flush_task: asyncio.Task[None] | None = None
+        self.livestream_stats = LivestreamStats()
+        self.state_refresh_stats = StateRefreshStats()
+        self.entity_write_stats = EntityWriteStats()
+        self.poll_schedule = AdaptivePollSchedule(
+            base_interval=scan_interval or MIN_SCAN_INTERVAL,
+            min_interval=MIN_SCAN_INTERVAL,
+            max_interval=(scan_interval or MIN_SCAN_INTERVAL) * POLL_MAX_INTERVAL_FACTOR,
+            disconnected_interval=POLL_DISCONNECTED_INTERVAL,
+            stagger=POLL_STAGGER,
+        )
+        self._polling_task: asyncio.Task[None] | None = None
+        self._poll_wakeup = asyncio.Event()
+        self._command_debouncer = CommandDebouncer(command_debounce_window)
+        self.livestream_reconnect_policy = ReconnectPolicy(
+            base_delay=LIVESTREAM_RECONNECT_BASE_DELAY,
+            max_delay=LIVESTREAM_RECONNECT_MAX_DELAY,
+            failure_threshold=LIVESTREAM_CIRCUIT_FAILURE_THRESHOLD,
+            open_duration=LIVESTREAM_CIRCUIT_OPEN_DURATION,
+        )
         self._closed = False
         
         self.api = ElectroluxAPI(
             api_key=api_key,
             token=token,
-            on_token_refresh=self.on_token_refresh
+            on_token_refresh=self.on_token_refresh,
+            json_loads=json_loads,
         )
 
     async def on_token_refresh(self, token: Token):
@@ -70,6 +192,9 @@ class ElectroluxHub:
         expected_livestream: dict[str, Any] | None = None,
     ) -> bool:
         success = await self.api.send_command(appliance_id, body)
+        if success and self._polling_task is not None:
+            self.poll_schedule.record_command(appliance_id, asyncio.get_running_loop().time())
+            self._poll_wakeup.set()
         if success and self._use_livestream_updates:
             livestream_body = {
                 property_name: value
@@ -92,20 +217,130 @@ class ElectroluxHub:
         value: Any,
         *,
         expected_livestream: dict[str, Any] | None = None,
+        debounce: bool = False,
     ) -> bool:
+        if not debounce or self._command_debouncer.window <= 0:
+            return await self._send_capability_command(
+                appliance_id,
+                capability_path,
+                value,
+                expected_livestream=expected_livestream,
+            )
+
+        if self._capability_command_body(appliance_id, capability_path, value) is None:
+            return False
+        return await self._command_debouncer.submit(
+            (appliance_id, capability_path),
+            value,
+            lambda final_value: self._send_capability_command(
+                appliance_id,
+                capability_path,
+                final_value,
+                expected_livestream=expected_livestream,
+            ),
+        )
+
+    async def _send_capability_command(
+        self,
+        appliance_id: str,
+        capability_path: str,
+        value: Any,
+        *,
+        expected_livestream: dict[str, Any] | None = None,
+    ) -> bool:
+        body = self._capability_command_body(appliance_id, capability_path, value)
+        if body is None:
+            return False
+
+        success = await self.send_command(appliance_id, body, expected_livestream=expected_livestream)
+        if success and (appliance_data := self.discovered_appliance_data.get(appliance_id)):
+            appliance_data.state.set_reported(capability_path, value)
+        return success
+
+    async def send_capability_commands(
+        self,
+        appliance_id: str,
+        writes: list[tuple[str, Any]],
+        *,
+        simulated_writes: list[tuple[str, Any]] | None = None,
+        expected_livestream: dict[str, Any] | None = None,
+    ) -> bool:
+        """Send ordered capability writes; simulated_writes adds the state changes the appliance applies in between."""
+        appliance_data = self.discovered_appliance_data.get(appliance_id)
+        if appliance_data is None or not writes:
+            return False
+
+        implied = implied_writes(writes, simulated_writes if simulated_writes is not None else writes)
+        if len(writes) == 1 or not appliance_data.is_dam:
+            for (capability_path, value), state_changes in zip(writes, implied):
+                if not await self._send_capability_command(
+                    appliance_id,
+                    capability_path,
+                    value,
+                    expected_livestream=expected_livestream,
+                ):
+                    return False
+                for path, state_value in state_changes:
+                    appliance_data.state.set_reported(path, state_value)
+            return True
+
+        commands: list[tuple[Capability, Any]] = []
+        reported = appliance_data.state.properties.reported.raw
+        applied: list[tuple[str, Any]] = []
+        for (capability_path, value), state_changes in zip(writes, implied):
+            runtime_capabilities = appliance_data.info.runtime_capabilities(reported_state_after(reported, applied))
+            capability = self._writable_capability(
+                appliance_id,
+                runtime_capabilities.get(capability_path),
+                capability_path,
+                value,
+            )
+            if capability is None:
+                return False
+            commands.append((capability, value))
+            applied.append((capability_path, value))
+            applied.extend(state_changes)
+
+        success = await self.send_command(
+            appliance_id,
+            command_body_for_capabilities(commands),
+            expected_livestream=expected_livestream,
+        )
+        if success:
+            for capability_path, value in applied:
+                appliance_data.state.set_reported(capability_path, value)
+        return success
+
+    def _capability_command_body(self, appliance_id: str, capability_path: str, value: Any) -> dict[str, Any] | None:
         appliance_data = self.discovered_appliance_data.get(appliance_id)
         if appliance_data is None:
             _LOGGER.debug("Ignoring command for unknown appliance %s capability %s", appliance_id, capability_path)
-            return False
+            return None
 
-        runtime_capability = self.runtime_capability(appliance_id, capability_path)
+        runtime_capability = self._writable_capability(
+            appliance_id,
+            self.runtime_capability(appliance_id, capability_path),
+            capability_path,
+            value,
+        )
+        if runtime_capability is None:
+            return None
+        return command_body_for_capability(runtime_capability, value, is_dam=appliance_data.is_dam)
+
+    def _writable_capability(
+        self,
+        appliance_id: str,
+        runtime_capability: Capability | None,
+        capability_path: str,
+        value: Any,
+    ) -> Capability | None:
         if runtime_capability is None or not runtime_capability.can_write:
             _LOGGER.debug(
                 "Ignoring command for unavailable capability %s on appliance %s",
                 capability_path,
                 appliance_id,
             )
-            return False
+            return None
         if not self._is_capability_value_allowed(runtime_capability, value):
             _LOGGER.debug(
                 "Ignoring command for capability %s on appliance %s because value is outside capabilities: %s",
@@ -113,13 +348,8 @@ class ElectroluxHub:
                 appliance_id,
                 value,
             )
-            return False
-
-        body = command_body_for_capability(runtime_capability, value, is_dam=appliance_data.is_dam)
-        success = await self.send_command(appliance_id, body, expected_livestream=expected_livestream)
-        if success:
-            appliance_data.state.set_reported(capability_path, value)
-        return success
+            return None
+        return runtime_capability
 
     def _is_capability_value_allowed(self, capability: Capability, value: Any) -> bool:
         if capability.values:
@@ -174,31 +404,23 @@ class ElectroluxHub:
 
     def register_livestream_command_echo_filter(self, appliance_id: str, body: dict[str, Any]) -> None:
         for property_name, value in body.items():
-            history_key = (appliance_id, property_name)
-            history = self._livestream_command_history.setdefault(history_key, [])
-            history.append(self._normalize_livestream_value(property_name, value))
-            if len(history) > self._COMMAND_HISTORY_LIMIT:
-                del history[:-self._COMMAND_HISTORY_LIMIT]
+            self._command_echoes.register(
+                appliance_id,
+                property_name,
+                self._normalize_livestream_value(property_name, value),
+            )
             _LOGGER.debug(
-                "Registered livestream command history for appliance %s: %s=%s",
+                "Registered livestream command echo for appliance %s: %s=%s",
                 appliance_id,
                 property_name,
                 value,
             )
 
     def _should_ignore_livestream_event(self, appliance_id: str, property_name: str, value: Any) -> bool:
-        history_key = (appliance_id, property_name)
-        history = self._livestream_command_history.get(history_key)
-        if not history:
-            return False
-
         normalized_value = self._normalize_livestream_value(property_name, value)
-        if normalized_value not in history:
+        if not self._command_echoes.match(appliance_id, property_name, normalized_value):
             return False
 
-        history.remove(normalized_value)
-        if not history:
-            self._livestream_command_history.pop(history_key, None)
         _LOGGER.debug(
             "Ignoring livestream echo for appliance %s: %s=%s",
             appliance_id,
@@ -215,9 +437,9 @@ class ElectroluxHub:
     def _set_livestream_supported_properties(self, supported_properties: dict[str, set[str]]) -> None:
         self._livestream_supported_properties_by_appliance = supported_properties
         self._livestream_supported_properties_loaded = True
-        for appliance_id, property_name in list(self._livestream_command_history):
-            if not self._can_receive_livestream_property(appliance_id, property_name):
-                self._livestream_command_history.pop((appliance_id, property_name), None)
+        self._command_echoes.discard_where(
+            lambda appliance_id, property_name: not self._can_receive_livestream_property(appliance_id, property_name)
+        )
 
     async def _update_entities_for_appliance(
         self,
@@ -226,36 +448,40 @@ class ElectroluxHub:
         *,
         call_async_update: bool,
         changed_property: str | None = None,
+        changed_properties: frozenset[str] | None = None,
     ) -> None:
-        for entity in self.entities:
-            if not hasattr(entity, 'appliance_id'):
-                continue
+        if changed_properties is None and changed_property is not None:
+            changed_properties = frozenset({changed_property})
 
-            if entity.appliance_id != appliance_id:
-                continue
-
-            if not self._entity_handles_livestream_property(entity, changed_property):
-                continue
+        appliance_data = self.discovered_appliance_data.get(appliance_id)
+        for entity in self.entity_subscriptions.for_appliance(appliance_id):
+            if hasattr(entity, 'appliance_state'):
+                entity.appliance_state = state
+            if hasattr(entity, 'appliance_data') and appliance_data is not None:
+                entity.appliance_data = appliance_data
 
+        for entity in self.entity_subscriptions.matching(appliance_id, changed_properties):
             if getattr(entity, "hass", None) is None:
                 continue
 
             try:
-                if hasattr(entity, 'appliance_state'):
-                    entity.appliance_state = state
-                if hasattr(entity, 'appliance_data') and entity.appliance_id in self.discovered_appliance_data:
-                    entity.appliance_data = self.discovered_appliance_data[entity.appliance_id]
-
                 if hasattr(entity, '_handle_appliance_state_update'):
-                    entity._handle_appliance_state_update(changed_property)
+                    entity._handle_appliance_state_update(changed_properties)
 
                 if hasattr(entity, '_update_attributes'):
                     entity._update_attributes()
+                self.entity_subscriptions.refresh(entity)
 
                 if call_async_update and hasattr(entity, 'async_update'):
                     await entity.async_update()
 
-                if hasattr(entity, 'async_write_ha_state'):
+                if hasattr(entity, 'async_write_ha_state_if_changed'):
+                    written = entity.async_write_ha_state_if_changed()
+                    platform = getattr(getattr(entity, "platform", None), "domain", None) or type(entity).__name__
+                    self.entity_write_stats.record(platform, written)
+                    if not written:
+                        continue
+                elif hasattr(entity, 'async_write_ha_state'):
                     entity.async_write_ha_state()
 
                 is_on = getattr(entity, "is_on", None)
@@ -268,47 +494,150 @@ class ElectroluxHub:
             except Exception as e:
                 _LOGGER.error(f"Failed to update entity {entity.entity_id}: {e}")
 
-    def _entity_handles_livestream_property(self, entity: Any, changed_property: str | None) -> bool:
-        if changed_property is None or changed_property == "connectionState":
-            return True
+    def start_polling(self) -> None:
+        if self._closed or (self._polling_task is not None and not self._polling_task.done()):
+            return
 
-        livestream_properties = getattr(entity, "livestream_properties", None)
-        if livestream_properties is None or changed_property in livestream_properties:
-            return True
-        changed_leaf = changed_property.rsplit(".", 1)[-1]
-        return any(prop.rsplit(".", 1)[-1] == changed_leaf for prop in livestream_properties)
+        self._polling_task = self._create_background_task(self._polling_loop(), "electrolux_polling")
 
-    async def poll_appliances(self, _: datetime):
-        _LOGGER.info("Polling appliances")
+    async def _polling_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            self.poll_schedule.sync(self.discovered_appliance_data, loop.time())
+            delay = self.poll_schedule.next_delay(loop.time())
+            self._poll_wakeup.clear()
+            with suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await self._poll_wakeup.wait()
+
+            for appliance_id in self.poll_schedule.due(loop.time()):
+                try:
+                    await self._poll_appliance(appliance_id)
+                except Exception as e:
+                    _LOGGER.error(f"Error during periodic update of appliance {appliance_id}: {e}")
+                    self.poll_schedule.record_failure(appliance_id, loop.time())
+
+    async def _poll_appliance(self, appliance_id: str) -> None:
+        _LOGGER.debug("Polling appliance %s", appliance_id)
+        loop = asyncio.get_running_loop()
+        state = await self._fetch_appliance_state(appliance_id)
+        appliance_data = self.discovered_appliance_data.get(appliance_id)
+        if not state or appliance_data is None:
+            self.poll_schedule.record_failure(appliance_id, loop.time())
+            return
 
-        try:
-            await self._refresh_appliance_states(call_async_update=True)
-        except Exception as e:
-            _LOGGER.error(f"Error during periodic update: {e}")
+        changed_properties = await self._apply_appliance_state(appliance_data, state, call_async_update=True)
+        self.poll_schedule.record_poll(
+            appliance_id,
+            loop.time(),
+            changed=changed_properties is None or bool(changed_properties),
+            connected=state.connectionState != ConnectionState.DISCONNECTED,
+        )
+        if self._appliance_snapshot is not None:
+            self._appliance_snapshot.async_delay_save(self._appliance_snapshot_data)
 
     async def _refresh_appliance_states(self, *, call_async_update: bool) -> None:
         if not self.discovered_appliance_data:
             return
 
-        for appliance_data in self.discovered_appliance_data.values():
-            state = await self.api.get_appliance_state(appliance_data.appliance.id)
-            if not state:
-                continue
+        started_at = asyncio.get_running_loop().time()
+        semaphore = asyncio.Semaphore(self._state_refresh_concurrency)
+        appliance_ids = list(self.discovered_appliance_data)
+        results = await asyncio.gather(
+            *(
+                self._refresh_appliance_state(appliance_id, semaphore, call_async_update=call_async_update)
+                for appliance_id in appliance_ids
+            ),
+            return_exceptions=True,
+        )
+        refreshed = 0
+        for appliance_id, result in zip(appliance_ids, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Failed to refresh state for appliance %s: %s", appliance_id, result)
+            elif result:
+                refreshed += 1
+        _LOGGER.debug(
+            "Refreshed %s of %s appliance states in %.2fs",
+            refreshed,
+            len(appliance_ids),
+            asyncio.get_running_loop().time() - started_at,
+        )
+        if refreshed and self._appliance_snapshot is not None:
+            self._appliance_snapshot.async_delay_save(self._appliance_snapshot_data)
 
-            appliance_data.state = state
-            await self._update_entities_for_appliance(
-                appliance_data.appliance.id,
-                state,
-                call_async_update=call_async_update,
+    async def _refresh_appliance_state(
+        self,
+        appliance_id: str,
+        semaphore: asyncio.Semaphore,
+        *,
+        call_async_update: bool,
+    ) -> bool:
+        async with semaphore:
+            state = await self._fetch_appliance_state(appliance_id)
+
+        appliance_data = self.discovered_appliance_data.get(appliance_id)
+        if not state or appliance_data is None:
+            return False
+
+        await self._apply_appliance_state(appliance_data, state, call_async_update=call_async_update)
+        return True
+
+    async def _fetch_appliance_state(self, appliance_id: str) -> ApplianceState | None:
+        try:
+            async with asyncio.timeout(self._state_refresh_timeout):
+                return await self.api.get_appliance_state(appliance_id)
+        except TimeoutError:
+            _LOGGER.warning(
+                "Timed out refreshing state for appliance %s after %ss",
+                appliance_id,
+                self._state_refresh_timeout,
             )
+            return None
+
+    async def _apply_appliance_state(
+        self,
+        appliance_data: ApplianceData,
+        state: ApplianceState,
+        *,
+        call_async_update: bool,
+    ) -> frozenset[str] | None:
+        changed_properties = self._changed_state_properties(appliance_data, state)
+        pending_properties = self._pending_livestream_updates.pop(appliance_data.appliance.id, None)
+        if changed_properties is not None and pending_properties:
+            changed_properties |= pending_properties
+        appliance_data.state = state
+        self.state_refresh_stats.record(changed_properties)
+        await self._update_entities_for_appliance(
+            appliance_data.appliance.id,
+            state,
+            call_async_update=call_async_update,
+            changed_properties=changed_properties,
+        )
+        return changed_properties
+
+    def _changed_state_properties(self, appliance_data: ApplianceData, state: ApplianceState) -> frozenset[str] | None:
+        previous = appliance_data.state
+        if previous.connectionState != state.connectionState or previous.status != state.status:
+            return None
+
+        reported_state = state.properties.reported.raw
+        changed_paths = diff_state_paths(previous.properties.reported.raw, reported_state)
+        return frozenset(changed_paths | appliance_data.info.update_runtime_capabilities(reported_state))
 
     async def _refresh_appliance_states_after_livestream_connect(self) -> None:
+        self.livestream_reconnect_policy.record_success()
         _LOGGER.debug("Refreshing appliance states after Electrolux livestream connection")
         try:
             await self._refresh_appliance_states(call_async_update=False)
         except Exception as e:
             _LOGGER.warning("Failed to refresh appliance states after livestream connection: %s", e)
 
+    def start_token_refresh(self) -> None:
+        if self._closed:
+            return
+
+        self._create_background_task(self.api.keep_access_token_fresh(), "electrolux_token_refresh")
+
     def start_livestream(self) -> None:
         if self._closed:
             return
@@ -323,6 +652,7 @@ class ElectroluxHub:
 
     async def _livestream_loop(self) -> None:
         while not self._closed:
+            self.livestream_reconnect_policy.before_attempt()
             try:
                 configuration = await self.api.get_livestream_configuration()
                 if not configuration:
@@ -337,16 +667,28 @@ class ElectroluxHub:
                     supported_properties,
                 )
 
-                async for event in self.api.stream_livestream_events(
+                async for events in self.api.stream_livestream_events(
                     livestream_url,
                     on_connected=self._refresh_appliance_states_after_livestream_connect,
                 ):
-                    await self._handle_livestream_event(event, supported_properties)
+                    for event in events:
+                        await self._handle_livestream_event(event, supported_properties)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
-                _LOGGER.warning(f"Livestream disconnected, reconnecting in 10 seconds: {e}")
-                await asyncio.sleep(10)
+                retry_ms = self.api.livestream_retry_ms
+                min_delay = max(retry_ms / 1000 if retry_ms else 0.0, self.api.scheduler.pause_remaining())
+                delay = self.livestream_reconnect_policy.record_failure(min_delay)
+                if self.livestream_reconnect_policy.state is CircuitState.OPEN:
+                    _LOGGER.warning(
+                        "Livestream failed %s times in a row, pausing reconnects for %.0f seconds: %s",
+                        self.livestream_reconnect_policy.consecutive_failures,
+                        delay,
+                        e,
+                    )
+                else:
+                    _LOGGER.warning("Livestream disconnected, reconnecting in %.1f seconds: %s", delay, e)
+                await asyncio.sleep(delay)
 
     def _livestream_supported_properties(self, configuration: dict[str, Any]) -> dict[str, set[str]]:
         supported_properties: dict[str, set[str]] = {}
@@ -359,6 +701,7 @@ class ElectroluxHub:
 
     async def _handle_livestream_event(self, event: dict[str, Any], supported_properties: dict[str, set[str]]) -> None:
         _LOGGER.debug("Handling Electrolux livestream event: %s", event)
+        self.livestream_stats.events_received += 1
 
         appliance_id = event.get("applianceId")
         property_name = event.get("property")
@@ -400,12 +743,7 @@ class ElectroluxHub:
                 previous_connection_state,
                 state.connectionState,
             )
-            await self._update_entities_for_appliance(
-                appliance_id,
-                state,
-                call_async_update=False,
-                changed_property=property_name,
-            )
+            await self._dispatch_livestream_update(appliance_id, state, {property_name})
             return
 
         property_path = self._resolve_property_path(appliance_id, property_name)
@@ -421,8 +759,10 @@ class ElectroluxHub:
             )
             return
 
+        changed_properties = {property_path}
         if appliance_data := self.discovered_appliance_data.get(appliance_id):
             appliance_data.state = state
+            changed_properties |= appliance_data.info.update_runtime_capabilities(reported.raw)
 
         _LOGGER.debug(
             "Applied livestream event for appliance %s: %s %s -> %s",
@@ -432,41 +772,99 @@ class ElectroluxHub:
             value,
         )
 
-        await self._update_entities_for_appliance(
-            appliance_id,
-            state,
-            call_async_update=False,
-            changed_property=property_path,
-        )
+        await self._dispatch_livestream_update(appliance_id, state, changed_properties)
+
+    async def _dispatch_livestream_update(
+        self,
+        appliance_id: str,
+        state: ApplianceState,
+        changed_properties: set[str],
+    ) -> None:
+        self.livestream_stats.events_applied += 1
+        if self._livestream_coalesce_window <= 0:
+            self.livestream_stats.dispatches += 1
+            await self._update_entities_for_appliance(
+                appliance_id,
+                state,
+                call_async_update=False,
+                changed_properties=frozenset(changed_properties),
+            )
+            return
+
+        pending = self._pending_livestream_updates.get(appliance_id)
+        if pending is None:
+            self._pending_livestream_updates[appliance_id] = set(changed_properties)
+        else:
+            self.livestream_stats.events_folded += 1
+            pending |= changed_properties
+
+        if self._livestream_flush_task is None or self._livestream_flush_task.done():
+            self._livestream_flush_task = self._create_background_task(
+                self._flush_livestream_updates_after_window(),
+                "electrolux_livestream_flush",
+            )
+
+    async def _flush_livestream_updates_after_window(self) -> None:
+        while self._pending_livestream_updates:
+            await asyncio.sleep(self._livestream_coalesce_window)
+            pending = self._pending_livestream_updates
+            self._pending_livestream_updates = {}
+            self.livestream_stats.flushes += 1
+            for appliance_id, changed_properties in pending.items():
+                appliance_data = self.discovered_appliance_data.get(appliance_id)
+                if appliance_data is None:
+                    continue
+                self.livestream_stats.dispatches += 1
+                await self._update_entities_for_appliance(
+                    appliance_id,
+                    appliance_data.state,
+                    call_async_update=False,
+                    changed_properties=frozenset(changed_properties),
+                )
 
     def _resolve_property_path(self, appliance_id: str, property_name: str) -> str:
         appliance_data = self.discovered_appliance_data.get(appliance_id)
         if appliance_data is None:
             return property_name
-        if property_name in appliance_data.info.capabilities:
-            return property_name
-        exact_name_matches = [
-            capability.path
-            for capability in appliance_data.info.capabilities.values()
-            if capability.name == property_name
-        ]
-        if len(exact_name_matches) == 1:
-            return exact_name_matches[0]
-        leaf_matches = [
-            capability.path
-            for capability in appliance_data.info.capabilities.values()
-            if capability.path.rsplit(".", 1)[-1] == property_name
-        ]
-        return leaf_matches[0] if len(leaf_matches) == 1 else property_name
+        return appliance_data.info.resolve_property_path(property_name)
 
     def _get_entity_appliance_state(self, appliance_id: str) -> ApplianceState | None:
-        for entity in self.entities:
-            if not hasattr(entity, 'appliance_id') or entity.appliance_id != appliance_id:
-                continue
+        for entity in self.entity_subscriptions.for_appliance(appliance_id):
             if hasattr(entity, 'appliance_state'):
                 return entity.appliance_state
         return None
 
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "appliances": len(self.discovered_appliance_data),
+            "entities": len(self.entity_subscriptions),
+            "commands": self._command_debouncer.as_dict(),
+            "state_refresh": self.state_refresh_stats.as_dict(),
+            "entity_writes": self.entity_write_stats.as_dict(),
+            "runtime_capabilities": {
+                appliance_id: appliance_data.info.runtime_cache_stats()
+                for appliance_id, appliance_data in self.discovered_appliance_data.items()
+            },
+            "polling": {
+                "running": self._polling_task is not None and not self._polling_task.done(),
+                "appliances": self.poll_schedule.as_dict(asyncio.get_running_loop().time()),
+            },
+            "livestream": {
+                "enabled": self._use_livestream_updates,
+                "running": self._livestream_task is not None and not self._livestream_task.done(),
+                "reconnect": self.livestream_reconnect_policy.as_dict(),
+                "events": self.livestream_stats.as_dict(),
+                "command_echoes": self._command_echoes.as_dict(),
+                "last_event_id": self.api.livestream_last_event_id,
+            },
+            "api": {
+                "responses": self.api.response_stats.as_dict(),
+                "connections": self.api.connection_stats.as_dict(),
+                "rate_limit": self.api.scheduler.as_dict(),
+                "token_refresh": self.api.token_refresh_stats.as_dict(),
+            },
+        }
+
     def get_discovered_appliances(self) -> list[Appliance]:
         return self.discovered_appliances
 
@@ -475,37 +873,234 @@ class ElectroluxHub:
 
     async def discover_appliances(self):
         try:
-            _LOGGER.info("Starting appliance discovery...")
-            appliances = await self.api.get_appliances() or []
-            self.discovered_appliances = appliances
-            self.discovered_appliance_data = {}
-            if not appliances:
-                _LOGGER.warning("No appliances discovered")
-                return []
-
-            _LOGGER.info(f"Discovered {len(appliances)} appliances:")
-            for appliance in appliances:
-                _LOGGER.info(f"  - {appliance.name} (ID: {appliance.id}, Type: {appliance.type})")
-                info = await self.api.get_appliance_info(appliance.id)
-                state = await self.api.get_appliance_state(appliance.id)
-                if info is None or state is None:
-                    _LOGGER.warning("Skipping appliance %s because info or state is unavailable", appliance.id)
-                    continue
-                self.discovered_appliance_data[appliance.id] = ApplianceData(
-                    appliance=appliance,
-                    info=info,
-                    state=state,
-                )
-
-            return appliances
+            discovered = await self._fetch_appliance_data()
         except Exception as e:
             _LOGGER.error(f"Failed to discover appliances: {e}")
+            discovered = None
+
+        if discovered is None:
             self.discovered_appliances = []
             self.discovered_appliance_data = {}
             return []
-    
+
+        appliances, appliance_data = discovered
+        self.discovered_appliances = appliances
+        self.discovered_appliance_data = appliance_data
+        await self._save_appliance_snapshot()
+        return appliances
+
+    async def _fetch_appliance_data(self) -> tuple[list[Appliance], dict[str, ApplianceData]] | None:
+        _LOGGER.info("Starting appliance discovery...")
+        started_at = asyncio.get_running_loop().time()
+        appliances = await self.api.get_appliances()
+        if appliances is None:
+            return None
+        if not appliances:
+            _LOGGER.warning("No appliances discovered")
+            return [], {}
+
+        _LOGGER.info(f"Discovered {len(appliances)} appliances:")
+        for appliance in appliances:
+            _LOGGER.info(f"  - {appliance.name} (ID: {appliance.id}, Type: {appliance.type})")
+
+        if self._capability_cache is not None:
+            await self._capability_cache.async_load()
+
+        semaphore = asyncio.Semaphore(self._discovery_concurrency)
+        results = await asyncio.gather(
+            *(self._discover_appliance_data(appliance, semaphore) for appliance in appliances),
+            return_exceptions=True,
+        )
+        appliance_data: dict[str, ApplianceData] = {}
+        cached_appliance_ids: list[str] = []
+        for appliance, result in zip(appliances, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Skipping appliance %s because discovery failed: %s", appliance.id, result)
+                continue
+            if result is None:
+                _LOGGER.warning("Skipping appliance %s because info or state is unavailable", appliance.id)
+                continue
+            data, from_cache = result
+            appliance_data[appliance.id] = data
+            if from_cache:
+                cached_appliance_ids.append(appliance.id)
+
+        _LOGGER.info(
+            "Appliance discovery finished in %.2fs: %s ready (%s from capability cache), %s skipped (concurrency=%s)",
+            asyncio.get_running_loop().time() - started_at,
+            len(appliance_data),
+            len(cached_appliance_ids),
+            len(appliances) - len(appliance_data),
+            self._discovery_concurrency,
+        )
+
+        if self._capability_cache is not None:
+            self._capability_cache.retain({appliance.id for appliance in appliances})
+            await self._capability_cache.async_save()
+            if cached_appliance_ids:
+                self._create_background_task(
+                    self._revalidate_capability_cache(cached_appliance_ids),
+                    "electrolux_capability_cache_revalidation",
+                )
+        return appliances, appliance_data
+
+    async def _discover_appliance_data(
+        self,
+        appliance: Appliance,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[ApplianceData, bool] | None:
+        started_at = asyncio.get_running_loop().time()
+
+        async def bounded(request: Awaitable[_T]) -> _T:
+            async with semaphore:
+                return await request
+
+        cache = self._capability_cache
+        info: ApplianceInfo | None = None
+        if cache is not None and appliance.id in cache:
+            state = await bounded(self.api.get_appliance_state(appliance.id))
+            if state is None:
+                return None
+            info = cache.get(appliance.id, state)
+            from_cache = info is not None
+            if info is None:
+                info = await bounded(self.api.get_appliance_info(appliance.id))
+        else:
+            from_cache = False
+            info, state = await asyncio.gather(
+                bounded(self.api.get_appliance_info(appliance.id)),
+                bounded(self.api.get_appliance_state(appliance.id)),
+            )
+        _LOGGER.debug(
+            "Fetched %s and state for appliance %s in %.2fs",
+            "cached info" if from_cache else "info",
+            appliance.id,
+            asyncio.get_running_loop().time() - started_at,
+        )
+        if info is None or state is None:
+            return None
+        if cache is not None and not from_cache:
+            cache.set(appliance.id, info, state)
+        info.update_runtime_capabilities(state.properties.reported.raw)
+        return ApplianceData(appliance=appliance, info=info, state=state), from_cache
+
+    async def _revalidate_capability_cache(self, appliance_ids: list[str]) -> None:
+        cache = self._capability_cache
+        if cache is None:
+            return
+
+        semaphore = asyncio.Semaphore(self._discovery_concurrency)
+
+        async def fetch_info(appliance_id: str) -> ApplianceInfo | None:
+            async with semaphore:
+                return await self.api.get_appliance_info(appliance_id)
+
+        infos = await asyncio.gather(*(fetch_info(appliance_id) for appliance_id in appliance_ids))
+        capabilities_changed = False
+        for appliance_id, info in zip(appliance_ids, infos):
+            appliance_data = self.discovered_appliance_data.get(appliance_id)
+            if info is None or appliance_data is None:
+                continue
+            if not cache.set(appliance_id, info, appliance_data.state):
+                continue
+
+            _LOGGER.info("Capabilities changed for appliance %s; refreshing capability cache", appliance_id)
+            capabilities_changed = True
+
+        await cache.async_save()
+        if capabilities_changed and self._on_appliances_changed is not None:
+            self._on_appliances_changed()
+
+    async def restore_appliance_snapshot(self) -> bool:
+        if self._appliance_snapshot is None or self._capability_cache is None:
+            return False
+
+        await self._capability_cache.async_load()
+        snapshot = await self._appliance_snapshot.async_load()
+        appliance_data: dict[str, ApplianceData] = {}
+        for appliance, state in snapshot:
+            info = self._capability_cache.get(appliance.id, state)
+            if info is None:
+                _LOGGER.debug("Cannot restore appliance %s from snapshot without cached capabilities", appliance.id)
+                return False
+            info.update_runtime_capabilities(state.properties.reported.raw)
+            appliance_data[appliance.id] = ApplianceData(appliance=appliance, info=info, state=state)
+
+        if not appliance_data:
+            return False
+
+        self.discovered_appliances = [data.appliance for data in appliance_data.values()]
+        self.discovered_appliance_data = appliance_data
+        _LOGGER.info("Restored %s appliances from the last known snapshot", len(appliance_data))
+        return True
+
+    def reconcile_appliances_in_background(self) -> None:
+        self._create_background_task(self._reconcile_appliances(), "electrolux_reconcile_appliances")
+
+    async def _reconcile_appliances(self) -> None:
+        try:
+            discovered = await self._fetch_appliance_data()
+        except Exception as e:
+            _LOGGER.error(f"Failed to discover appliances: {e}")
+            discovered = None
+
+        if not discovered or not discovered[1]:
+            _LOGGER.warning("Live appliance discovery failed; keeping the restored appliance snapshot")
+            return
+
+        appliances, discovered_data = discovered
+        restored = self.discovered_appliance_data
+        if discovered_data.keys() != restored.keys() or any(
+            discovered_data[appliance_id].info != restored[appliance_id].info for appliance_id in restored
+        ):
+            _LOGGER.info("Discovered appliances differ from the restored snapshot; reloading entities")
+            self.discovered_appliances = appliances
+            self.discovered_appliance_data = discovered_data
+            await self._save_appliance_snapshot()
+            if self._on_appliances_changed is not None:
+                self._on_appliances_changed()
+            return
+
+        self.discovered_appliances = appliances
+        for appliance_id, appliance_data in restored.items():
+            live_data = discovered_data[appliance_id]
+            appliance_data.appliance = live_data.appliance
+            appliance_data.state = live_data.state
+            self._pending_livestream_updates.pop(appliance_id, None)
+            await self._update_entities_for_appliance(
+                appliance_id,
+                appliance_data.state,
+                call_async_update=False,
+            )
+        await self._save_appliance_snapshot()
+        _LOGGER.debug("Reconciled %s restored appliances with live state", len(restored))
+
+    def _appliance_snapshot_data(self) -> list[tuple[Appliance, ApplianceState]]:
+        return [(data.appliance, data.state) for data in self.discovered_appliance_data.values()]
+
+    async def _save_appliance_snapshot(self) -> None:
+        if self._appliance_snapshot is not None and self.discovered_appliance_data:
+            await self._appliance_snapshot.async_save(self._appliance_snapshot_data())
+
+    def _create_background_task(self, coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task[Any]:
+        task = self.hass.async_create_background_task(coro, name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     def add_entities(self, entities: list[Any]):
-        self.entities.extend(entities)
+        for entity in entities:
+            self.entity_subscriptions.add(entity)
+
+    def remove_entity(self, entity: Any) -> None:
+        self.entity_subscriptions.remove(entity)
+
+    def _entity_dependencies(self, entity: Any) -> frozenset[str] | None:
+        properties = getattr(entity, "livestream_properties", None)
+        info = getattr(entity, "info", None)
+        if properties is None or info is None:
+            return properties
+        return properties | info.trigger_graph.trigger_inputs_for(properties)
 
     async def close(self):
         """Close the API session."""
@@ -523,5 +1118,13 @@ class ElectroluxHub:
             self._livestream_task = None
             _LOGGER.debug("Electrolux livestream task cancelled")
 
+        for task in list(self._background_tasks):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        await self._command_debouncer.close()
+        await self._save_appliance_snapshot()
+
         if hasattr(self, 'api') and self.api:
             await self.api.close()
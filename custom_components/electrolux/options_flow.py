@@ -4,7 +4,17 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_SCAN_INTERVAL
 
-from .const import CONF_USE_LIVESTREAM_UPDATES, MIN_SCAN_INTERVAL
+from .const import (
+    CONF_FAST_START,
+    CONF_LIVESTREAM_COALESCE_WINDOW,
+    CONF_REQUEST_CONCURRENCY,
+    CONF_USE_LIVESTREAM_UPDATES,
+    DISCOVERY_CONCURRENCY,
+    LIVESTREAM_COALESCE_WINDOW_MS,
+    MAX_LIVESTREAM_COALESCE_WINDOW_MS,
+    MAX_REQUEST_CONCURRENCY,
+    MIN_SCAN_INTERVAL,
+)
 
 
 def _use_livestream_updates_default(config_entry: ConfigEntry) -> bool:
@@ -14,6 +24,18 @@ def _use_livestream_updates_default(config_entry: ConfigEntry) -> bool:
     )
 
 
+def _fast_start_default(config_entry: ConfigEntry) -> bool:
+    return config_entry.options.get(CONF_FAST_START, False)
+
+
+def _request_concurrency_default(config_entry: ConfigEntry) -> int:
+    return config_entry.options.get(CONF_REQUEST_CONCURRENCY, DISCOVERY_CONCURRENCY)
+
+
+def _livestream_coalesce_window_default(config_entry: ConfigEntry) -> int:
+    return config_entry.options.get(CONF_LIVESTREAM_COALESCE_WINDOW, LIVESTREAM_COALESCE_WINDOW_MS)
+
+
 def _scan_interval_default(config_entry: ConfigEntry) -> int:
     scan_interval = config_entry.options.get(
         CONF_SCAN_INTERVAL,
@@ -22,17 +44,38 @@ def _scan_interval_default(config_entry: ConfigEntry) -> int:
     return max(MIN_SCAN_INTERVAL, scan_interval)
 
 
-def get_options_schema(config_entry: ConfigEntry, use_livestream_updates: bool | None = None) -> vol.Schema:
+def get_options_schema(
+    config_entry: ConfigEntry,
+    use_livestream_updates: bool | None = None,
+    fast_start: bool | None = None,
+) -> vol.Schema:
     if use_livestream_updates is None:
         use_livestream_updates = _use_livestream_updates_default(config_entry)
+    if fast_start is None:
+        fast_start = _fast_start_default(config_entry)
 
     schema = {
         vol.Required(
             CONF_USE_LIVESTREAM_UPDATES,
             default=use_livestream_updates,
         ): bool,
+        vol.Required(
+            CONF_FAST_START,
+            default=fast_start,
+        ): bool,
+        vol.Required(
+            CONF_REQUEST_CONCURRENCY,
+            default=_request_concurrency_default(config_entry),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_REQUEST_CONCURRENCY)),
     }
-    if not use_livestream_updates:
+    if use_livestream_updates:
+        schema[
+            vol.Required(
+                CONF_LIVESTREAM_COALESCE_WINDOW,
+                default=_livestream_coalesce_window_default(config_entry),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_LIVESTREAM_COALESCE_WINDOW_MS))
+    else:
         schema[
             vol.Required(
                 CONF_SCAN_INTERVAL,
@@ -46,6 +89,15 @@ def get_options_schema(config_entry: ConfigEntry, use_livestream_updates: bool |
 def options_from_user_input(config_entry: ConfigEntry, user_input: dict[str, Any]) -> dict[str, Any]:
     return {
         CONF_USE_LIVESTREAM_UPDATES: user_input[CONF_USE_LIVESTREAM_UPDATES],
+        CONF_FAST_START: user_input.get(CONF_FAST_START, _fast_start_default(config_entry)),
+        CONF_REQUEST_CONCURRENCY: user_input.get(
+            CONF_REQUEST_CONCURRENCY,
+            _request_concurrency_default(config_entry),
+        ),
+        CONF_LIVESTREAM_COALESCE_WINDOW: user_input.get(
+            CONF_LIVESTREAM_COALESCE_WINDOW,
+            _livestream_coalesce_window_default(config_entry),
+        ),
         CONF_SCAN_INTERVAL: user_input.get(
             CONF_SCAN_INTERVAL,
             _scan_interval_default(config_entry),
@@ -60,7 +112,11 @@ class ElectroluxOptionsFlow(OptionsFlow):
             if not use_livestream_updates and CONF_SCAN_INTERVAL not in user_input:
                 return self.async_show_form(
                     step_id="init",
-                    data_schema=get_options_schema(self.config_entry, use_livestream_updates=False),
+                    data_schema=get_options_schema(
+                        self.config_entry,
+                        use_livestream_updates=False,
+                        fast_start=user_input.get(CONF_FAST_START),
+                    ),
                 )
 
             return self.async_create_entry(data=options_from_user_input(self.config_entry, user_input))
@@ -0,0 +1,111 @@
+"""Adaptive per-appliance poll scheduling."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _AppliancePoll:
+    interval: float
+    next_due: float
+    connected: bool = True
+    polls: int = 0
+    changes: int = 0
+
+
+class AdaptivePollSchedule:
+    """Polls appliances faster after commands or changes and backs off while they are stable."""
+
+    def __init__(
+        self,
+        *,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        disconnected_interval: float,
+        stagger: float,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        self.min_interval = min_interval
+        self.base_interval = max(min_interval, base_interval)
+        self.max_interval = max(self.base_interval, max_interval)
+        self.disconnected_interval = max(min_interval, disconnected_interval)
+        self.stagger = stagger
+        self.backoff_factor = backoff_factor
+        self._appliances: dict[str, _AppliancePoll] = {}
+
+    def sync(self, appliance_ids: Iterable[str], now: float) -> None:
+        appliance_ids = list(appliance_ids)
+        for appliance_id in list(self._appliances):
+            if appliance_id not in appliance_ids:
+                del self._appliances[appliance_id]
+        for appliance_id in appliance_ids:
+            if appliance_id not in self._appliances:
+                self._appliances[appliance_id] = _AppliancePoll(
+                    interval=self.base_interval,
+                    next_due=self._reserve(appliance_id, now + self.base_interval),
+                )
+
+    def due(self, now: float) -> list[str]:
+        return sorted(
+            (appliance_id for appliance_id, poll in self._appliances.items() if poll.next_due <= now),
+            key=lambda appliance_id: self._appliances[appliance_id].next_due,
+        )
+
+    def next_delay(self, now: float) -> float | None:
+        if not self._appliances:
+            return None
+        return max(0.0, min(poll.next_due for poll in self._appliances.values()) - now)
+
+    def record_poll(self, appliance_id: str, now: float, *, changed: bool, connected: bool) -> None:
+        poll = self._appliances.get(appliance_id)
+        if poll is None:
+            return
+
+        poll.polls += 1
+        poll.connected = connected
+        if not connected:
+            poll.interval = self.disconnected_interval
+        elif changed:
+            poll.changes += 1
+            poll.interval = self.min_interval
+        else:
+            poll.interval = min(self.max_interval, max(self.base_interval, poll.interval * self.backoff_factor))
+        poll.next_due = self._reserve(appliance_id, now + poll.interval)
+
+    def record_failure(self, appliance_id: str, now: float) -> None:
+        poll = self._appliances.get(appliance_id)
+        if poll is not None:
+            poll.next_due = self._reserve(appliance_id, now + poll.interval)
+
+    def record_command(self, appliance_id: str, now: float) -> None:
+        poll = self._appliances.get(appliance_id)
+        if poll is None:
+            return
+
+        poll.interval = self.min_interval
+        poll.next_due = self._reserve(appliance_id, min(poll.next_due, now + self.min_interval))
+
+    def _reserve(self, appliance_id: str, due: float) -> float:
+        taken = sorted(
+            poll.next_due for other_id, poll in self._appliances.items() if other_id != appliance_id
+        )
+        for other_due in taken:
+            if other_due - self.stagger < due < other_due + self.stagger:
+                due = other_due + self.stagger
+        return due
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            appliance_id: {
+                "interval": poll.interval,
+                "next_poll_in": round(max(0.0, poll.next_due - now), 1),
+                "connected": poll.connected,
+                "polls": poll.polls,
+                "changes": poll.changes,
+            }
+            for appliance_id, poll in self._appliances.items()
+        }
@@ -0,0 +1,86 @@
+"""Reconnect backoff with full jitter and a circuit breaker."""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ReconnectPolicy:
+    """Exponential backoff with full jitter that opens a circuit after repeated failures."""
+
+    def __init__(
+        self,
+        *,
+        base_delay: float,
+        max_delay: float,
+        failure_threshold: int,
+        open_duration: float,
+        multiplier: float = 2.0,
+        random_factor: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_duration = open_duration
+        self.multiplier = multiplier
+        self._random_factor = random_factor
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.total_attempts = 0
+        self.total_failures = 0
+        self.circuit_opened = 0
+        self.last_delay: float | None = None
+        self.next_retry_at: float | None = None
+
+    def before_attempt(self) -> None:
+        self.total_attempts += 1
+        self.next_retry_at = None
+        if self.state is CircuitState.OPEN:
+            self.state = CircuitState.HALF_OPEN
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.next_retry_at = None
+
+    def record_failure(self, min_delay: float = 0.0) -> float:
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state is not CircuitState.OPEN:
+                self.circuit_opened += 1
+            self.state = CircuitState.OPEN
+            delay = self.open_duration
+        else:
+            ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (self.consecutive_failures - 1))
+            delay = max(min_delay, self._random_factor() * ceiling)
+
+        self.last_delay = delay
+        self.next_retry_at = self._clock() + delay
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "total_attempts": self.total_attempts,
+            "total_failures": self.total_failures,
+            "circuit_opened": self.circuit_opened,
+            "last_delay": self.last_delay,
+            "next_retry_at": (
+                datetime.fromtimestamp(self.next_retry_at, UTC).isoformat() if self.next_retry_at is not None else None
+            ),
+        }
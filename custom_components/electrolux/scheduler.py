@@ -0,0 +1,227 @@
+"""Token-bucket request scheduling for the Electrolux developer API rate limits."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC
+from enum import IntEnum
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+REQUEST_HISTORY_SECONDS = 3600
+
+
+class RequestPriority(IntEnum):
+    """Request classes in the order they are served when the bucket is contended."""
+
+    COMMAND = 0
+    TOKEN = 1
+    STATE = 2
+    DISCOVERY = 3
+
+
+@dataclass
+class LaneStats:
+    limit: int
+    semaphore: asyncio.Semaphore = field(repr=False)
+    requests: int = 0
+    queued: int = 0
+    in_flight: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    last_wait_seconds: float = 0.0
+
+    def record_wait(self, waited: float) -> None:
+        self.requests += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.last_wait_seconds = waited
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "requests": self.requests,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "average_wait_seconds": round(self.wait_seconds / self.requests, 3) if self.requests else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "last_wait_seconds": round(self.last_wait_seconds, 3),
+        }
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    """Return the delay in seconds requested by a Retry-After header value."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, retry_at.timestamp() - now())
+
+
+class RequestScheduler:
+    """Hands out request slots from a token bucket by priority and honours server-mandated pauses."""
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        lane_limits: Mapping[RequestPriority, int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[RequestPriority, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._recent: deque[float] = deque()
+        self.lanes: dict[RequestPriority, LaneStats] = {}
+        for priority in RequestPriority:
+            limit = max(1, (lane_limits or {}).get(priority, self.burst))
+            self.lanes[priority] = LaneStats(limit=limit, semaphore=asyncio.Semaphore(limit))
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.rate_limited = 0
+        self.retries = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _take_token(self, now: float) -> bool:
+        if now < self._paused_until:
+            return False
+        self._refill(now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            now = self._clock()
+            if now < self._paused_until:
+                await self._sleep(self._paused_until - now)
+                continue
+
+            if self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+                continue
+
+            if self._take_token(now):
+                _, _, waiter = heapq.heappop(self._waiters)
+                waiter.set_result(None)
+                continue
+            await self._sleep((1 - self._tokens) / self.rate)
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.STATE) -> float:
+        started_at = self._clock()
+        if self._waiters or not self._take_token(started_at):
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.create_task(self._dispatch())
+            await waiter
+
+        now = self._clock()
+        waited = now - started_at
+        self.requests += 1
+        if waited > 0:
+            self.throttled += 1
+            self.wait_seconds += waited
+        self._recent.append(now)
+        self._prune_recent(now)
+        return waited
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[float]:
+        lane = self.lanes[priority]
+        started_at = self._clock()
+        lane.queued += 1
+        try:
+            await lane.semaphore.acquire()
+            try:
+                await self.acquire(priority)
+            except BaseException:
+                lane.semaphore.release()
+                raise
+        finally:
+            lane.queued -= 1
+
+        waited = self._clock() - started_at
+        lane.record_wait(waited)
+        lane.in_flight += 1
+        try:
+            yield waited
+        finally:
+            lane.in_flight -= 1
+            lane.semaphore.release()
+
+    def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for _, _, waiter in self._waiters:
+            waiter.cancel()
+        self._waiters.clear()
+
+    def pause(self, delay: float) -> None:
+        self.rate_limited += 1
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + delay)
+        self._tokens = min(self._tokens, 1.0)
+        self._updated_at = max(self._updated_at, self._paused_until)
+
+    def pause_remaining(self) -> float:
+        return max(0.0, self._paused_until - self._clock())
+
+    def _prune_recent(self, now: float) -> None:
+        while self._recent and self._recent[0] <= now - REQUEST_HISTORY_SECONDS:
+            self._recent.popleft()
+
+    def requests_in_last(self, seconds: float) -> int:
+        now = self._clock()
+        self._prune_recent(now)
+        cutoff = now - seconds
+        return sum(1 for sent_at in self._recent if sent_at > cutoff)
+
+    def as_dict(self) -> dict[str, Any]:
+        self._refill(max(self._clock(), self._updated_at))
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens_available": round(self._tokens, 2),
+            "requests": self.requests,
+            "requests_last_minute": self.requests_in_last(60),
+            "requests_last_hour": self.requests_in_last(REQUEST_HISTORY_SECONDS),
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "paused_for": round(self.pause_remaining(), 3),
+            "lanes": {priority.name.lower(): lane.as_dict() for priority, lane in self.lanes.items()},
+        }
@@ -0,0 +1,140 @@
+"""Incremental Server-Sent Events decoding for the Electrolux livestream."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SSEEvent:
+    event: str
+    data: str
+    id: str | None = None
+
+
+class SSEDecoder:
+    """Decode an SSE byte stream chunk by chunk as described by the HTML living standard.
+
+    ``last_event_id`` only advances when an event is dispatched, so it is safe to resume from after a disconnect.
+    """
+
+    def __init__(self, last_event_id: str | None = None) -> None:
+        self.last_event_id = last_event_id
+        self._event_id = last_event_id
+        self.retry: int | None = None
+        self._buffer = b""
+        self._pending_cr = False
+        self._first_line = True
+        self._event_type = ""
+        self._data: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        if self._pending_cr and chunk.startswith(b"\n"):
+            chunk = chunk[1:]
+        self._pending_cr = False
+
+        buffer = self._buffer + chunk if self._buffer else chunk
+        events: list[SSEEvent] = []
+        start = 0
+        length = len(buffer)
+        while start < length:
+            lf = buffer.find(b"\n", start)
+            cr = buffer.find(b"\r", start, lf if lf != -1 else length)
+            if cr != -1:
+                end = cr
+                next_start = cr + 1
+                if next_start < length:
+                    if buffer[next_start] == 0x0A:
+                        next_start += 1
+                else:
+                    self._pending_cr = True
+            elif lf != -1:
+                end = lf
+                next_start = lf + 1
+            else:
+                break
+
+            if event := self._process_line(buffer[start:end]):
+                events.append(event)
+            start = next_start
+
+        self._buffer = buffer[start:]
+        return events
+
+    def _process_line(self, raw_line: bytes) -> SSEEvent | None:
+        line = raw_line.decode("utf-8", errors="replace")
+        if self._first_line:
+            self._first_line = False
+            line = line.removeprefix("\ufeff")
+
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+
+        field, separator, value = line.partition(":")
+        if separator and value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                self._event_id = value
+        elif field == "retry":
+            if value.isascii() and value.isdigit():
+                self.retry = int(value)
+        return None
+
+    def _dispatch(self) -> SSEEvent | None:
+        self.last_event_id = self._event_id
+        data = self._data
+        event_type = self._event_type
+        self._data = []
+        self._event_type = ""
+        if not data:
+            return None
+        return SSEEvent(event=event_type or "message", data="\n".join(data), id=self.last_event_id)
+
+
+class IdleWatchdog:
+    """Single re-armed timer that fires when no activity was seen for the timeout."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        timeout: float,
+        on_idle: Callable[[], None],
+    ) -> None:
+        self._loop = loop
+        self._timeout = timeout
+        self._on_idle = on_idle
+        self._last_activity = loop.time()
+        self._handle: asyncio.TimerHandle | None = None
+        self.fired = False
+
+    def start(self) -> None:
+        self._last_activity = self._loop.time()
+        self._handle = self._loop.call_at(self._last_activity + self._timeout, self._check)
+
+    def touch(self) -> None:
+        self._last_activity = self._loop.time()
+
+    def cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _check(self) -> None:
+        deadline = self._last_activity + self._timeout
+        if self._loop.time() < deadline:
+            self._handle = self._loop.call_at(deadline, self._check)
+            return
+
+        self._handle = None
+        self.fired = True
+        self._on_idle()
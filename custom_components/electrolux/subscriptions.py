@@ -0,0 +1,135 @@
+"""Index of entities by appliance and by the livestream properties they consume."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+CONNECTION_STATE_PROPERTY = "connectionState"
+
+
+def _leaf(path: str) -> str:
+    return path.rsplit(".", 1)[-1]
+
+
+@dataclass
+class _ApplianceSubscriptions:
+    entities: dict[int, Any] = field(default_factory=dict)
+    properties: dict[int, frozenset[str] | None] = field(default_factory=dict)
+    dependencies: dict[int, frozenset[str] | None] = field(default_factory=dict)
+    by_leaf: dict[str, set[int]] = field(default_factory=dict)
+    wildcard: set[int] = field(default_factory=set)
+
+
+def _livestream_properties(entity: Any) -> frozenset[str] | None:
+    return getattr(entity, "livestream_properties", None)
+
+
+class EntitySubscriptions:
+    """Finds the entities of an appliance that consume a set of changed properties.
+
+    Entities without ``livestream_properties`` receive every update. Properties match on their leaf name, so an
+    entity consuming ``upperOven.mode`` also receives a change reported as ``mode``. ``dependencies`` widens an
+    entity's ``livestream_properties`` to every path it should be refreshed for.
+    """
+
+    def __init__(
+        self,
+        dependencies: Callable[[Any], frozenset[str] | None] = _livestream_properties,
+    ) -> None:
+        self._dependencies = dependencies
+        self._appliances: dict[str, _ApplianceSubscriptions] = {}
+        self._order: dict[int, int] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, entity: Any) -> None:
+        appliance_id = getattr(entity, "appliance_id", None)
+        if appliance_id is None or id(entity) in self._order:
+            return
+
+        subscriptions = self._appliances.setdefault(appliance_id, _ApplianceSubscriptions())
+        key = id(entity)
+        self._order[key] = self._sequence
+        self._sequence += 1
+        subscriptions.entities[key] = entity
+        self._index(subscriptions, key, entity)
+
+    def remove(self, entity: Any) -> None:
+        key = id(entity)
+        subscriptions = self._appliances.get(getattr(entity, "appliance_id", None))
+        if subscriptions is None or subscriptions.entities.get(key) is not entity:
+            return
+
+        self._unindex(subscriptions, key)
+        del subscriptions.entities[key]
+        del self._order[key]
+        if not subscriptions.entities:
+            del self._appliances[entity.appliance_id]
+
+    def refresh(self, entity: Any) -> None:
+        """Reindex an entity whose livestream_properties may have changed."""
+        subscriptions = self._appliances.get(getattr(entity, "appliance_id", None))
+        key = id(entity)
+        if subscriptions is None or subscriptions.entities.get(key) is not entity:
+            return
+
+        if _livestream_properties(entity) == subscriptions.properties[key]:
+            return
+        self._unindex(subscriptions, key)
+        self._index(subscriptions, key, entity)
+
+    def dependencies(self, entity: Any) -> frozenset[str] | None:
+        subscriptions = self._appliances.get(getattr(entity, "appliance_id", None))
+        if subscriptions is None:
+            return None
+        return subscriptions.dependencies.get(id(entity))
+
+    def for_appliance(self, appliance_id: str) -> list[Any]:
+        subscriptions = self._appliances.get(appliance_id)
+        return list(subscriptions.entities.values()) if subscriptions is not None else []
+
+    def matching(self, appliance_id: str, changed_properties: Iterable[str] | None) -> list[Any]:
+        """Entities of the appliance that consume any of the changed properties; None means all of them."""
+        subscriptions = self._appliances.get(appliance_id)
+        if subscriptions is None:
+            return []
+        if changed_properties is None:
+            return list(subscriptions.entities.values())
+
+        changed_properties = set(changed_properties)
+        if CONNECTION_STATE_PROPERTY in changed_properties:
+            return list(subscriptions.entities.values())
+        if not changed_properties:
+            return []
+
+        changed_leaves = {_leaf(path) for path in changed_properties}
+        keys = set(subscriptions.wildcard)
+        for leaf in changed_leaves:
+            keys |= subscriptions.by_leaf.get(leaf, set())
+        return [subscriptions.entities[key] for key in sorted(keys, key=self._order.__getitem__)]
+
+    def _index(self, subscriptions: _ApplianceSubscriptions, key: int, entity: Any) -> None:
+        subscriptions.properties[key] = _livestream_properties(entity)
+        dependencies = self._dependencies(entity)
+        subscriptions.dependencies[key] = dependencies
+        if dependencies is None:
+            subscriptions.wildcard.add(key)
+            return
+        for path in dependencies:
+            subscriptions.by_leaf.setdefault(_leaf(path), set()).add(key)
+
+    def _unindex(self, subscriptions: _ApplianceSubscriptions, key: int) -> None:
+        subscriptions.properties.pop(key, None)
+        dependencies = subscriptions.dependencies.pop(key, None)
+        subscriptions.wildcard.discard(key)
+        for path in dependencies or ():
+            keys = subscriptions.by_leaf.get(_leaf(path))
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del subscriptions.by_leaf[_leaf(path)]
@@ -0,0 +1,121 @@
+"""Compare compiled trigger evaluation against a raw JSON interpreter on the api-samples fixtures."""
+
+import json
+import sys
+import timeit
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+ROOT = Path(__file__).parents[1]
+SPEC = spec_from_file_location("electrolux_capabilities", ROOT / "custom_components" / "electrolux" / "capabilities.py")
+capabilities = module_from_spec(SPEC)
+sys.modules[SPEC.name] = capabilities
+SPEC.loader.exec_module(capabilities)
+
+ITERATIONS = 2000
+
+
+def interpreted_actions(capability, reported_state: dict) -> list[dict]:
+    """Walk the raw trigger JSON on every call, as the integration did before compile_triggers."""
+    triggers = list(capability.triggers)
+    current_value = capabilities.get_state_value(reported_state, capability.path)
+    raw_values = (capability.raw or {}).get("values")
+    if isinstance(raw_values, dict):
+        value_config = raw_values.get(str(current_value)) or raw_values.get(capabilities._normalize_value(current_value))
+        if isinstance(value_config, dict):
+            triggers.extend(trigger for trigger in value_config.get("triggers", []) if isinstance(trigger, dict))
+
+    actions = []
+    for trigger in triggers:
+        condition = trigger.get("condition")
+        if condition is not None and not evaluate_condition(condition, capability, reported_state):
+            continue
+
+        action = trigger.get("action")
+        if isinstance(action, dict):
+            actions.append(action)
+    return actions
+
+
+def evaluate_condition(condition, capability, reported_state: dict) -> bool:
+    if not isinstance(condition, dict):
+        return False
+
+    operator = str(condition.get("operator", "eq")).lower()
+    if operator in {"and", "or"}:
+        left = evaluate_condition(condition.get("operand_1"), capability, reported_state)
+        right = evaluate_condition(condition.get("operand_2"), capability, reported_state)
+        return left and right if operator == "and" else left or right
+
+    left = condition_operand_value(condition.get("operand_1"), capability, reported_state)
+    right = condition_operand_value(condition.get("operand_2"), capability, reported_state)
+    if operator == "ne":
+        return capabilities._normalize_value(left) != capabilities._normalize_value(right)
+    return capabilities._normalize_value(left) == capabilities._normalize_value(right)
+
+
+def condition_operand_value(operand, capability, reported_state: dict):
+    if isinstance(operand, dict):
+        return evaluate_condition(operand, capability, reported_state)
+    if operand == "value":
+        return capabilities.get_state_value(reported_state, capability.path)
+    if isinstance(operand, str):
+        target_path = operand
+        if capability.parent_path and "." not in operand:
+            target_path = f"{capability.parent_path}.{operand}"
+        value = capabilities.get_state_value(reported_state, target_path)
+        if value is not None:
+            return value
+    return operand
+
+
+def sample_states(sample_dir: Path, info) -> list[dict]:
+    state = json.loads((sample_dir / "state.json").read_text())["properties"]["reported"]
+    states = [state]
+    for capability in info.capabilities.values():
+        if capability.triggers or isinstance((capability.raw or {}).get("values"), dict):
+            states.extend({**state, capability.path: value} for value in capability.values)
+    return states
+
+
+def main() -> None:
+    for sample_dir in sorted(path for path in (ROOT / "api-samples").iterdir() if path.is_dir()):
+        info = capabilities.capabilities_from_json(json.loads((sample_dir / "capabilities.json").read_text()))
+        states = sample_states(sample_dir, info)
+        sources = [
+            (capability, compiled)
+            for capability in info.capabilities.values()
+            if (compiled := capabilities.compile_triggers(capability)) is not None
+        ]
+
+        mismatches = sum(
+            compiled.matching_actions(reported) != interpreted_actions(capability, reported)
+            for reported in states
+            for capability, compiled in sources
+        )
+        if mismatches:
+            raise SystemExit(f"{sample_dir.name}: compiled triggers disagree with the interpreter {mismatches} times")
+
+        def interpreted() -> None:
+            for reported in states:
+                for capability, _ in sources:
+                    interpreted_actions(capability, reported)
+
+        def compiled() -> None:
+            for reported in states:
+                for _, triggers in sources:
+                    triggers.matching_actions(reported)
+
+        interpreted_seconds = min(timeit.repeat(interpreted, number=ITERATIONS, repeat=3))
+        compiled_seconds = min(timeit.repeat(compiled, number=ITERATIONS, repeat=3))
+        evaluations = ITERATIONS * len(states) * len(sources)
+        print(
+            f"{sample_dir.name}: {evaluations} evaluations, "
+            f"interpreted {interpreted_seconds * 1e6 / evaluations:.2f}us, "
+            f"compiled {compiled_seconds * 1e6 / evaluations:.2f}us, "
+            f"speedup {interpreted_seconds / compiled_seconds:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import asyncio
+import unittest
+import sys
+from datetime import datetime, timedelta
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+
+HAS_AIOHTTP = find_spec("aiohttp") is not None
+
+if HAS_AIOHTTP:
+    from aiohttp import web
+
+    PACKAGE_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux"
+    PACKAGE_SPEC = spec_from_file_location(
+        "electrolux_api_package",
+        PACKAGE_PATH / "__init__.py",
+        submodule_search_locations=[str(PACKAGE_PATH)],
+    )
+    sys.modules[PACKAGE_SPEC.name] = module_from_spec(PACKAGE_SPEC)
+    API_SPEC = spec_from_file_location(f"{PACKAGE_SPEC.name}.api", PACKAGE_PATH / "api.py")
+    api = module_from_spec(API_SPEC)
+    sys.modules[API_SPEC.name] = api
+    API_SPEC.loader.exec_module(api)
+
+LIVESTREAM_URL = "https://api.electrolux.one/livestream"
+
+
+class LocalSession:
+    """Sends livestream requests to a local server instead of the Electrolux host."""
+
+    def __init__(self, session, url):
+        self._session = session
+        self._url = url
+
+    def get(self, url, **kwargs):
+        return self._session.get(self._url, **kwargs)
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp is not installed")
+class LivestreamTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.release = asyncio.Event()
+        app = web.Application()
+        app.router.add_get("/livestream", self._livestream)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        token = {
+            "access_token": "access",
+            "refresh_token": "refresh",
+            "token_expiration_date": datetime.now() + timedelta(hours=1),
+        }
+        self.api = api.ElectroluxAPI("key", token, lambda token: None)
+        self.api.session = LocalSession(self.api.session, f"http://127.0.0.1:{port}/livestream")
+
+    async def asyncTearDown(self):
+        self.release.set()
+        await self.api.session._session.close()
+        await self.runner.cleanup()
+
+    async def _livestream(self, request):
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(b'data: {"property": "PM2_5", "value": 12}\n\n')
+        await self.release.wait()
+        return response
+
+    async def test_connector_pools_connections(self):
+        self.assertEqual(self.api.connector.limit, 100)
+        self.assertTrue(self.api.connector.use_dns_cache)
+
+    async def test_idle_stream_is_reported_as_idle(self):
+        original_timeout = api.LIVESTREAM_IDLE_TIMEOUT
+        api.LIVESTREAM_IDLE_TIMEOUT = 0.05
+        self.addCleanup(setattr, api, "LIVESTREAM_IDLE_TIMEOUT", original_timeout)
+
+        batches = []
+        with self.assertRaisesRegex(ConnectionError, "idle"):
+            async for events in self.api.stream_livestream_events(LIVESTREAM_URL):
+                batches.append(events)
+
+        self.assertEqual(batches, [[{"property": "PM2_5", "value": 12}]])
+
+    async def test_rotation_ends_stream_without_error(self):
+        batches = []
+        async for events in self.api.stream_livestream_events(LIVESTREAM_URL):
+            batches.append(events)
+            self.api._rotate_livestream()
+
+        self.assertEqual(batches, [[{"property": "PM2_5", "value": 12}]])
+        self.assertEqual(self.api.connection_stats.livestream_rotations, 1)
+        self.assertFalse(self.api._livestream_rotating)
+        self.assertIsNone(self.api._livestream_response)
+
+
+class StopRefreshing(Exception):
+    pass
+
+
+class FakeClock:
+    """Wall clock that only moves when the token refresher sleeps."""
+
+    def __init__(self, limit):
+        self.now = datetime(2026, 1, 1, 12, 0)
+        self.sleeps = []
+        self.limit = limit
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        if len(self.sleeps) > self.limit:
+            raise StopRefreshing
+        self.now += timedelta(seconds=delay)
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp is not installed")
+class TokenRefreshTest(unittest.IsolatedAsyncioTestCase):
+    async def refresh_delays(self, expires_in, results, limit):
+        clock = FakeClock(limit)
+        token = {
+            "access_token": "access",
+            "refresh_token": "refresh",
+            "token_expiration_date": clock.now + timedelta(seconds=expires_in),
+        }
+        self.api = api.ElectroluxAPI("key", token, lambda token: None, clock=clock, sleep=clock.sleep)
+        self.addAsyncCleanup(self.api.session.close)
+        results = list(results)
+
+        async def refresh_access_token():
+            if not results.pop(0):
+                return False
+            self.api.token = {**self.api.token, "token_expiration_date": clock.now + timedelta(seconds=3600)}
+            return True
+
+        self.api.refresh_access_token = refresh_access_token
+        with self.assertRaises(StopRefreshing):
+            await self.api.keep_access_token_fresh()
+        return clock.sleeps
+
+    async def test_refreshes_the_margin_before_expiry(self):
+        delays = await self.refresh_delays(3600, [True], limit=1)
+
+        self.assertEqual(delays, [3000, 3000])
+        self.assertEqual(self.api.token_refresh_stats.proactive_refreshes, 1)
+
+    async def test_short_lived_token_refreshes_at_half_its_lifetime(self):
+        delays = await self.refresh_delays(1000, [True], limit=1)
+
+        self.assertEqual(delays, [500, 3000])
+
+    async def test_failures_back_off_exponentially_up_to_the_cap(self):
+        delays = await self.refresh_delays(3600, [False] * 7 + [True], limit=8)
+
+        self.assertEqual(delays, [3000, 30, 60, 120, 240, 480, 600, 600, 3000])
+        self.assertEqual(self.api.token_refresh_stats.failures, 7)
+        self.assertEqual(self.api.token_refresh_stats.proactive_refreshes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
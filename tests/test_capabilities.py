@@ -1,9 +1,12 @@
+import json
+from copy import deepcopy
 import unittest
 import sys
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 
 CAPABILITIES_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "capabilities.py"
+API_SAMPLES_PATH = Path(__file__).parents[1] / "api-samples"
 SPEC = spec_from_file_location("electrolux_capabilities", CAPABILITIES_PATH)
 capabilities = module_from_spec(SPEC)
 sys.modules[SPEC.name] = capabilities
@@ -11,6 +14,16 @@ SPEC.loader.exec_module(capabilities)
 
 capabilities_from_json = capabilities.capabilities_from_json
 command_body_for_capability = capabilities.command_body_for_capability
+command_body_for_capabilities = capabilities.command_body_for_capabilities
+reported_state_after = capabilities.reported_state_after
+implied_writes = capabilities.implied_writes
+diff_state_paths = capabilities.diff_state_paths
+appliance_info_from_dict = capabilities.appliance_info_from_dict
+appliance_info_to_dict = capabilities.appliance_info_to_dict
+
+
+def load_sample(pnc, name):
+    return json.loads((API_SAMPLES_PATH / pnc / f"{name}.json").read_text())
 
 
 class CapabilitiesTest(unittest.TestCase):
@@ -205,6 +218,274 @@ class CapabilitiesTest(unittest.TestCase):
             {"commands": [{"airConditioner": {"mode": "cool"}}]},
         )
 
+    def test_batched_dam_command_body_and_simulated_state(self):
+        info = capabilities_from_json(
+            {
+                "applianceInfo": {"deviceType": "PORTABLE_AIR_CONDITIONER"},
+                "capabilities": {
+                    "airConditioner": {
+                        "type": "object",
+                        "executeCommand": {"access": "write", "type": "string", "values": {"ON": {}, "OFF": {}}},
+                        "mode": {"access": "readwrite", "type": "string", "values": {"COOL": {}, "FANONLY": {}}},
+                    }
+                },
+            }
+        )
+        writes = [("airConditioner.executeCommand", "ON"), ("airConditioner.mode", "FANONLY")]
+        reported = {"airConditioner": {"mode": "COOL"}}
+
+        body = command_body_for_capabilities([(info.capabilities[path], value) for path, value in writes])
+        simulated = reported_state_after(reported, writes)
+
+        self.assertEqual(
+            body,
+            {"commands": [{"airConditioner": {"executeCommand": "ON"}}, {"airConditioner": {"mode": "FANONLY"}}]},
+        )
+        self.assertEqual(simulated, {"airConditioner": {"mode": "FANONLY", "executeCommand": "ON"}})
+        self.assertEqual(reported, {"airConditioner": {"mode": "COOL"}})
+
+    def test_implied_writes_follow_their_command_write(self):
+        power = ("airConditioner.executeCommand", "ON")
+        mode = ("airConditioner.mode", "FANONLY")
+        running = ("airConditioner.applianceState", "RUNNING")
+
+        self.assertEqual(implied_writes([power, mode], [power, running, mode]), [[running], []])
+        self.assertEqual(implied_writes([power, mode], [power, mode]), [[], []])
+        with self.assertRaises(ValueError):
+            implied_writes([power, mode], [running, power, mode])
+        with self.assertRaises(ValueError):
+            implied_writes([power, mode], [power, running])
+
+    def test_diff_state_paths_reports_changed_leaves(self):
+        old = {"mode": "COOL", "airConditioner": {"fanSpeed": "LOW", "swing": "OFF"}, "filter": {"life": 80}, "gone": 1}
+        new = {"mode": "COOL", "airConditioner": {"fanSpeed": "HIGH", "swing": "OFF"}, "filter": 80, "added": True}
+
+        self.assertEqual(
+            diff_state_paths(old, new),
+            {"airConditioner.fanSpeed", "filter", "filter.life", "gone", "added"},
+        )
+        self.assertEqual(diff_state_paths(old, deepcopy(old)), set())
+        self.assertEqual(diff_state_paths({"on": 1}, {"on": True}), {"on"})
+
+    def test_trigger_dependency_paths_cover_condition_sources(self):
+        purifier = capabilities_from_json(load_sample("950011559", "capabilities"))
+        air_conditioner = capabilities_from_json(load_sample("950011605", "capabilities"))
+
+        self.assertIn("Workmode", purifier.trigger_dependency_paths)
+        self.assertNotIn("Fanspeed", purifier.trigger_dependency_paths)
+        self.assertIn("mode", air_conditioner.trigger_dependency_paths)
+        self.assertNotIn("targetTemperatureC", air_conditioner.trigger_dependency_paths)
+
+    def test_runtime_capabilities_are_memoized_by_trigger_state(self):
+        info = capabilities_from_json(load_sample("950011559", "capabilities"))
+        state = load_sample("950011559", "state")["properties"]["reported"]
+
+        first = info.runtime_capabilities(state)
+        second = info.runtime_capabilities({**state, "PM2_5": 999})
+        changed = info.runtime_capabilities({**state, "Workmode": "Manual"})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, changed)
+        self.assertEqual(
+            info.runtime_cache_stats(),
+            {"hits": 1, "misses": 2, "size": 2, "incremental_updates": 0, "full_updates": 0},
+        )
+
+    def test_memoized_runtime_capabilities_match_full_evaluation(self):
+        for pnc, path in (("950011559", "Workmode"), ("950011605", "mode")):
+            info = capabilities_from_json(load_sample(pnc, "capabilities"))
+            state = load_sample(pnc, "state")["properties"]["reported"]
+            for value in (*info.capabilities[path].values, None):
+                with self.subTest(pnc=pnc, value=value):
+                    reported = {**state, path: value}
+                    info.runtime_capabilities(reported)
+
+                    self.assertEqual(info.runtime_capabilities(reported), info._compute_runtime_capabilities(reported))
+
+    def test_trigger_graph_maps_reads_to_written_capabilities(self):
+        info = capabilities_from_json(load_sample("950011605", "capabilities"))
+        graph = info.trigger_graph
+
+        self.assertEqual(graph.writes["mode"], frozenset({"fanSpeedSetting", "sleepMode", "targetTemperatureC"}))
+        self.assertEqual(graph.sources_reading({"mode"}), {"mode"})
+        self.assertEqual(graph.sources_reading({"ambientTemperatureC"}), set())
+        self.assertEqual(
+            graph.capabilities_affected_by({"mode"}),
+            {"fanSpeedSetting", "sleepMode", "targetTemperatureC"},
+        )
+
+    def test_trigger_inputs_for_written_capabilities(self):
+        info = capabilities_from_json(load_sample("950011559", "capabilities"))
+
+        self.assertIn("Workmode", info.trigger_graph.trigger_inputs_for({"Fanspeed"}))
+        self.assertEqual(info.trigger_graph.trigger_inputs_for({"PM2_5"}), set())
+
+    def test_incremental_runtime_update_matches_full_recompute(self):
+        for pnc, path in (("950011559", "Workmode"), ("950011605", "mode")):
+            info = capabilities_from_json(load_sample(pnc, "capabilities"))
+            reported = deepcopy(load_sample(pnc, "state")["properties"]["reported"])
+            self.assertEqual(info.update_runtime_capabilities(reported), set(info.capabilities))
+
+            for value in (*info.capabilities[path].values, None, info.capabilities[path].values[0]):
+                with self.subTest(pnc=pnc, value=value):
+                    before = info._compute_runtime_capabilities(reported)
+                    reported[path] = value
+
+                    changed = info.update_runtime_capabilities(reported)
+                    after = info._compute_runtime_capabilities(reported)
+
+                    self.assertEqual(info.runtime_capabilities(reported), after)
+                    self.assertEqual(changed, {key for key in after if after[key] != before[key]})
+
+            self.assertGreater(info.runtime_incremental_updates, 0)
+            self.assertEqual(info.runtime_full_updates, 1)
+
+    def test_incremental_runtime_update_ignores_non_trigger_changes(self):
+        info = capabilities_from_json(load_sample("950011559", "capabilities"))
+        reported = deepcopy(load_sample("950011559", "state")["properties"]["reported"])
+        info.update_runtime_capabilities(reported)
+
+        reported["PM2_5"] = 999
+
+        self.assertEqual(info.update_runtime_capabilities(reported), set())
+        self.assertEqual(info.runtime_incremental_updates, 0)
+
+    def test_compiled_triggers_evaluate_nested_conditions(self):
+        info = capabilities_from_json(
+            {
+                "capabilities": {
+                    "unit": {
+                        "access": "readwrite",
+                        "type": "string",
+                        "values": {"ON": {}, "OFF": {}},
+                        "triggers": [
+                            {
+                                "condition": {
+                                    "operator": "AND",
+                                    "operand_1": {"operand_1": "value", "operator": "eq", "operand_2": "ON"},
+                                    "operand_2": {"operand_1": "speed", "operator": "ne", "operand_2": 3},
+                                },
+                                "action": {"speed": {"max": 3}},
+                            },
+                            {
+                                "condition": {
+                                    "operator": "or",
+                                    "operand_1": {"operand_1": "child_lock", "operator": "eq", "operand_2": True},
+                                    "operand_2": {"operand_1": "missing", "operator": "eq", "operand_2": "missing"},
+                                },
+                                "action": {"self": {"access": "read"}},
+                            },
+                            {"condition": "not-a-condition", "action": {"speed": {"disabled": True}}},
+                            {"action": {"speed": {"step": 1}}},
+                        ],
+                    },
+                    "speed": {"access": "readwrite", "type": "int", "min": 1, "max": 5},
+                    "child_lock": {"access": "readwrite", "type": "boolean"},
+                }
+            }
+        )
+        unit = info.capabilities["unit"]
+        compiled = capabilities.compile_triggers(unit)
+
+        for value in ("ON", "on", "OFF", None):
+            for speed in (1, 3, None):
+                for child_lock in (True, False, None):
+                    reported = {"unit": value, "speed": speed, "child_lock": child_lock}
+                    # The "or" always holds: an operand missing from the state compares as its literal name.
+                    expected = [{"self": {"access": "read"}}, {"speed": {"step": 1}}]
+                    if value in ("ON", "on") and speed != 3:
+                        expected.insert(0, {"speed": {"max": 3}})
+                    with self.subTest(reported=reported):
+                        self.assertEqual(compiled.matching_actions(reported), expected)
+
+    def test_compiled_sample_triggers_match_fixture_conditions(self):
+        for pnc, path in (("950011559", "Workmode"), ("950011605", "mode")):
+            info = capabilities_from_json(load_sample(pnc, "capabilities"))
+            state = load_sample(pnc, "state")["properties"]["reported"]
+            capability = info.capabilities[path]
+            compiled = capabilities.compile_triggers(capability)
+            for value in (*capability.values, None, "unknown"):
+                expected = [
+                    trigger["action"] for trigger in capability.triggers if trigger["condition"]["operand_2"] == value
+                ]
+                with self.subTest(pnc=pnc, value=value):
+                    self.assertEqual(compiled.matching_actions({**state, path: value}), expected)
+
+    def test_indexed_find_capability_keeps_scan_precedence(self):
+        def scan(info, *names):
+            wanted = {capabilities._normalize_name(name) for name in names}
+            for capability in info.capabilities.values():
+                if (
+                    capabilities._normalize_name(capability.path) in wanted
+                    or capabilities._normalize_name(capability.name) in wanted
+                ):
+                    return capability
+            return None
+
+        for pnc in ("950011559", "950011605"):
+            info = capabilities_from_json(load_sample(pnc, "capabilities"))
+            names = [name for capability in info.capabilities.values() for name in (capability.path, capability.name)]
+            for first, second in zip(names, reversed(names)):
+                with self.subTest(pnc=pnc, names=(first, second)):
+                    self.assertEqual(info.find_capability(first, second), scan(info, first, second))
+            self.assertIsNone(info.find_capability("doesNotExist"))
+
+    def test_resolve_action_path_prefers_exact_then_sibling_then_name(self):
+        info = capabilities_from_json(
+            {
+                "capabilities": {
+                    "fan_speed": {"access": "readwrite", "type": "int"},
+                    "zone": {
+                        "mode": {"access": "readwrite", "type": "string"},
+                        "fanSpeed": {"access": "readwrite", "type": "int"},
+                    },
+                    "mode": {"access": "readwrite", "type": "string"},
+                }
+            }
+        )
+        source = info.capabilities["zone.mode"]
+        index = info.name_index
+
+        self.assertEqual(capabilities.resolve_action_path(source, "self", info.capabilities, index), "zone.mode")
+        self.assertEqual(capabilities.resolve_action_path(source, "mode", info.capabilities, index), "mode")
+        self.assertEqual(capabilities.resolve_action_path(source, "fanSpeed", info.capabilities, index), "zone.fanSpeed")
+        self.assertEqual(capabilities.resolve_action_path(source, "FAN-SPEED", info.capabilities, index), "fan_speed")
+        self.assertIsNone(capabilities.resolve_action_path(source, "missing", info.capabilities, index))
+        self.assertEqual(info.find_capability("fanSpeed").path, "fan_speed")
+
+    def test_property_paths_resolve_exact_then_unique_name_then_unique_leaf(self):
+        info = capabilities_from_json(
+            {
+                "capabilities": {
+                    "mode": {"access": "readwrite", "type": "string"},
+                    "upperOven": {
+                        "mode": {"access": "readwrite", "type": "string"},
+                        "targetTemperature": {"access": "readwrite", "type": "temperature"},
+                        "doorState": {"access": "read", "type": "string"},
+                    },
+                    "lowerOven": {
+                        "targetTemperature": {"access": "readwrite", "type": "temperature"},
+                    },
+                }
+            }
+        )
+
+        self.assertEqual(info.resolve_property_path("mode"), "mode")
+        self.assertEqual(info.resolve_property_path("upperOven.mode"), "upperOven.mode")
+        self.assertEqual(info.resolve_property_path("doorState"), "upperOven.doorState")
+        self.assertEqual(info.resolve_property_path("targetTemperature"), "targetTemperature")
+        self.assertEqual(info.resolve_property_path("unknown"), "unknown")
+
+    def test_appliance_info_round_trips_through_json(self):
+        for pnc in ("950011559", "950011605"):
+            with self.subTest(pnc=pnc):
+                info = capabilities_from_json(load_sample(pnc, "capabilities"))
+
+                restored = appliance_info_from_dict(json.loads(json.dumps(appliance_info_to_dict(info))))
+
+                self.assertEqual(restored, info)
+                self.assertEqual(list(restored.capabilities), list(info.capabilities))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+DEBOUNCE_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "debounce.py"
+SPEC = spec_from_file_location("electrolux_debounce", DEBOUNCE_PATH)
+debounce = module_from_spec(SPEC)
+sys.modules[SPEC.name] = debounce
+SPEC.loader.exec_module(debounce)
+
+CommandDebouncer = debounce.CommandDebouncer
+
+
+class CommandDebouncerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_rapid_writes_send_only_final_value(self):
+        debouncer = CommandDebouncer(0.02)
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+            return True
+
+        results = await asyncio.gather(
+            *(debouncer.submit(("1:950011559", "targetTemperatureC"), value, send) for value in (20, 21, 22))
+        )
+
+        self.assertEqual(sent, [22])
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(debouncer.as_dict()["avoided"], 2)
+        self.assertEqual(debouncer.as_dict()["sent"], 1)
+
+    async def test_superseded_callers_receive_final_outcome(self):
+        debouncer = CommandDebouncer(0.02)
+
+        async def send(value):
+            return value == "ok"
+
+        first = asyncio.create_task(debouncer.submit("key", "ok", send))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(debouncer.submit("key", "rejected", send))
+
+        self.assertEqual(await asyncio.gather(first, second), [False, False])
+
+    async def test_keys_are_debounced_independently(self):
+        debouncer = CommandDebouncer(0.01)
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+            return True
+
+        await asyncio.gather(debouncer.submit("a", 1, send), debouncer.submit("b", 2, send))
+
+        self.assertEqual(sorted(sent), [1, 2])
+        self.assertEqual(debouncer.avoided, 0)
+
+    async def test_write_during_send_starts_a_new_batch(self):
+        debouncer = CommandDebouncer(0.01)
+        release = asyncio.Event()
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+            await release.wait()
+            return True
+
+        first = asyncio.create_task(debouncer.submit("key", 1, send))
+        while not sent:
+            await asyncio.sleep(0.005)
+        second = asyncio.create_task(debouncer.submit("key", 2, send))
+        release.set()
+
+        self.assertEqual(await asyncio.gather(first, second), [True, True])
+        self.assertEqual(sent, [1, 2])
+
+    async def test_send_errors_propagate_to_all_callers(self):
+        debouncer = CommandDebouncer(0.01)
+
+        async def send(value):
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            debouncer.submit("key", 1, send),
+            debouncer.submit("key", 2, send),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_close_cancels_pending_callers(self):
+        debouncer = CommandDebouncer(10)
+
+        async def send(value):
+            return True
+
+        caller = asyncio.create_task(debouncer.submit("key", 1, send))
+        await asyncio.sleep(0)
+        await debouncer.close()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+
+
+if __name__ == "__main__":
+    unittest.main()
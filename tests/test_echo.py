@@ -0,0 +1,106 @@
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+ECHO_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "echo.py"
+SPEC = spec_from_file_location("electrolux_echo", ECHO_PATH)
+echo = module_from_spec(SPEC)
+sys.modules[SPEC.name] = echo
+SPEC.loader.exec_module(echo)
+
+CommandEchoTracker = echo.CommandEchoTracker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CommandEchoTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tracker = CommandEchoTracker(ttl=10, max_entries=3, clock=self.clock)
+
+    def test_each_registered_command_matches_one_echo(self):
+        self.tracker.register("ac", "mode", "COOL")
+        self.tracker.register("ac", "mode", "COOL")
+
+        self.assertTrue(self.tracker.match("ac", "mode", "COOL"))
+        self.assertTrue(self.tracker.match("ac", "mode", "COOL"))
+        self.assertFalse(self.tracker.match("ac", "mode", "COOL"))
+        self.assertFalse(self.tracker.match("purifier", "mode", "COOL"))
+        self.assertEqual(len(self.tracker), 0)
+
+    def test_entries_expire_after_ttl(self):
+        self.tracker.register("ac", "mode", "COOL")
+        self.clock.now += 5
+        self.tracker.register("ac", "mode", "HEAT")
+
+        self.clock.now += 6
+
+        self.assertFalse(self.tracker.match("ac", "mode", "COOL"))
+        self.assertTrue(self.tracker.match("ac", "mode", "HEAT"))
+        self.assertEqual(self.tracker.expired, 1)
+
+    def test_matched_entries_do_not_expire_newer_duplicates(self):
+        self.tracker.register("ac", "mode", "COOL")
+        self.assertTrue(self.tracker.match("ac", "mode", "COOL"))
+        self.clock.now += 5
+        self.tracker.register("ac", "mode", "COOL")
+
+        self.clock.now += 6
+
+        self.assertTrue(self.tracker.match("ac", "mode", "COOL"))
+        self.assertEqual(self.tracker.expired, 0)
+
+    def test_global_bound_evicts_oldest_across_appliances(self):
+        for appliance_id in ("a", "b", "c", "d"):
+            self.tracker.register(appliance_id, "mode", "COOL")
+
+        self.assertEqual(len(self.tracker), 3)
+        self.assertEqual(self.tracker.evicted, 1)
+        self.assertFalse(self.tracker.match("a", "mode", "COOL"))
+        self.assertTrue(self.tracker.match("d", "mode", "COOL"))
+
+    def test_quickly_matched_entries_do_not_grow_the_expiry_queue(self):
+        self.tracker.register("ac", "mode", "HEAT")
+        for _ in range(50):
+            self.tracker.register("ac", "mode", "COOL")
+            self.assertTrue(self.tracker.match("ac", "mode", "COOL"))
+            self.assertLessEqual(len(self.tracker._expiry), 2 * self.tracker.max_entries)
+
+        self.clock.now += 11
+
+        self.assertFalse(self.tracker.match("ac", "mode", "HEAT"))
+        self.assertEqual(self.tracker.expired, 1)
+        self.assertEqual(len(self.tracker), 0)
+
+    def test_records_echo_latency(self):
+        self.tracker.register("ac", "targetTemperatureC", 21)
+        self.clock.now += 0.5
+        self.tracker.match("ac", "targetTemperatureC", 21)
+
+        stats = self.tracker.as_dict()
+
+        self.assertEqual(stats["matched"], 1)
+        self.assertEqual(stats["average_latency_seconds"], 0.5)
+        self.assertEqual(stats["last_latency_seconds"], 0.5)
+
+    def test_unhashable_values_and_discard(self):
+        self.tracker.register("ac", "schedule", {"days": ["MON"], "on": True})
+        self.tracker.register("ac", "mode", "COOL")
+
+        self.assertTrue(self.tracker.match("ac", "schedule", {"on": True, "days": ["MON"]}))
+
+        self.tracker.discard_where(lambda appliance_id, property_name: property_name == "mode")
+
+        self.assertEqual(len(self.tracker), 0)
+        self.assertFalse(self.tracker.match("ac", "mode", "COOL"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import sys
+from importlib import import_module
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import SimpleNamespace
+
+HAS_HOMEASSISTANT = find_spec("homeassistant") is not None and find_spec("aiohttp") is not None
+
+ENTITY_STATE_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "entity_state.py"
+SPEC = spec_from_file_location("electrolux_entity_state", ENTITY_STATE_PATH)
+entity_state = module_from_spec(SPEC)
+sys.modules[SPEC.name] = entity_state
+SPEC.loader.exec_module(entity_state)
+
+attribute_snapshot = entity_state.attribute_snapshot
+
+if HAS_HOMEASSISTANT:
+    from homeassistant.components.sensor import SensorEntity
+
+    PACKAGE_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux"
+    PACKAGE_SPEC = spec_from_file_location(
+        "electrolux_entity_package",
+        PACKAGE_PATH / "__init__.py",
+        submodule_search_locations=[str(PACKAGE_PATH)],
+    )
+    sys.modules[PACKAGE_SPEC.name] = module_from_spec(PACKAGE_SPEC)
+    dynamic_helpers = import_module(f"{PACKAGE_SPEC.name}.dynamic_helpers")
+    appliance_state_module = import_module(f"{PACKAGE_SPEC.name}.appliance_state")
+
+    class RecordingSensorEntity(SensorEntity):
+        """Counts state writes instead of sending them to Home Assistant."""
+
+        writes = 0
+
+        def async_write_ha_state(self):
+            self.writes += 1
+
+    class DynamicSensor(dynamic_helpers.DynamicElectroluxEntity, RecordingSensorEntity):
+        def __init__(self, appliance_data):
+            super().__init__(None, appliance_data)
+            self._attr_native_value = 12
+            self._attr_icon = "mdi:air-filter"
+
+
+class CachedProperties(type):
+    """Stores ``_attr_`` values of cached properties under ``__attr_`` names like Home Assistant's metaclass."""
+
+    def __new__(mcs, name, bases, namespace, cached_properties=frozenset()):
+        for attribute in cached_properties:
+            private_name = f"__attr_{attribute}"
+            default = namespace.pop(f"_attr_{attribute}", None)
+
+            def getter(self, private_name=private_name, default=default):
+                return getattr(self, private_name, default)
+
+            def setter(self, value, private_name=private_name):
+                setattr(self, private_name, value)
+
+            namespace[f"_attr_{attribute}"] = property(getter, setter)
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class FakeSensor(metaclass=CachedProperties, cached_properties=frozenset({"native_value"})):
+    _attr_native_value = None
+
+    def __init__(self):
+        self._attr_native_value = 12
+        self._attr_icon = "mdi:air-filter"
+
+
+class AttributeSnapshotTest(unittest.TestCase):
+    def test_collects_plain_and_cached_attributes(self):
+        sensor = FakeSensor()
+
+        self.assertIn("__attr_native_value", vars(sensor))
+        self.assertEqual(
+            attribute_snapshot(sensor),
+            (("_attr_icon", "mdi:air-filter"), ("_attr_native_value", 12)),
+        )
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class DynamicEntityWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.appliance_state = SimpleNamespace(connectionState=appliance_state_module.ConnectionState.CONNECTED)
+        self.sensor = DynamicSensor(SimpleNamespace(appliance=None, info=None, state=self.appliance_state))
+
+    def test_cached_native_value_change_is_written(self):
+        self.assertIn("__attr_native_value", vars(self.sensor))
+        self.assertTrue(self.sensor.async_write_ha_state_if_changed())
+        self.assertFalse(self.sensor.async_write_ha_state_if_changed())
+
+        self.sensor._attr_native_value = 15
+
+        self.assertTrue(self.sensor.async_write_ha_state_if_changed())
+        self.assertEqual(self.sensor.writes, 2)
+
+    def test_availability_change_is_written(self):
+        self.sensor.async_write_ha_state_if_changed()
+
+        self.appliance_state.connectionState = appliance_state_module.ConnectionState.DISCONNECTED
+
+        self.assertTrue(self.sensor.async_write_ha_state_if_changed())
+        self.assertFalse(self.sensor.available)
+        self.assertEqual(self.sensor.writes, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
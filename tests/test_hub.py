@@ -0,0 +1,578 @@
+import asyncio
+import json
+import unittest
+import sys
+from datetime import datetime, timedelta
+from importlib import import_module
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+
+HAS_HOMEASSISTANT = find_spec("homeassistant") is not None and find_spec("aiohttp") is not None
+API_SAMPLES_PATH = Path(__file__).parents[1] / "api-samples"
+
+if HAS_HOMEASSISTANT:
+    PACKAGE_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux"
+    PACKAGE_SPEC = spec_from_file_location(
+        "electrolux_hub_package",
+        PACKAGE_PATH / "__init__.py",
+        submodule_search_locations=[str(PACKAGE_PATH)],
+    )
+    sys.modules[PACKAGE_SPEC.name] = module_from_spec(PACKAGE_SPEC)
+    hub_module = import_module(f"{PACKAGE_SPEC.name}.hub")
+    appliance_module = import_module(f"{PACKAGE_SPEC.name}.appliance")
+    appliance_state_module = import_module(f"{PACKAGE_SPEC.name}.appliance_state")
+    capabilities_module = import_module(f"{PACKAGE_SPEC.name}.capabilities")
+    capability_cache_module = import_module(f"{PACKAGE_SPEC.name}.capability_cache")
+    appliance_snapshot_module = import_module(f"{PACKAGE_SPEC.name}.appliance_snapshot")
+
+
+def load_sample(pnc, name):
+    return json.loads((API_SAMPLES_PATH / pnc / f"{name}.json").read_text())
+
+
+def sample_state(appliance_id, pnc="950011605", **reported):
+    data = load_sample(pnc, "state")
+    raw = {**data["properties"]["reported"], **reported}
+    return appliance_state_module.ApplianceState(
+        id=appliance_id,
+        connectionState=appliance_state_module.ConnectionState.from_string(data["connectionState"]),
+        status=appliance_state_module.Status.from_string(data["status"]),
+        properties=appliance_state_module.Properties(
+            reported=appliance_state_module.ReportedProperties(raw=raw),
+        ),
+        data_model_version=raw.get("dataModelVersion"),
+    )
+
+
+def sample_info(pnc="950011605"):
+    return capabilities_module.capabilities_from_json(load_sample(pnc, "capabilities"))
+
+
+def sample_appliance(appliance_id, appliance_type="PORTABLE_AIR_CONDITIONER"):
+    return appliance_module.Appliance(
+        id=appliance_id,
+        name=appliance_id,
+        type=appliance_type,
+        created=datetime(2024, 1, 1),
+    )
+
+
+class FakeHass:
+    def async_create_background_task(self, coro, name):
+        return asyncio.create_task(coro, name=name)
+
+
+class MemoryStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    def __init__(self, data=None):
+        self.data = data
+        self.saves = 0
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = json.loads(json.dumps(data))
+        self.saves += 1
+
+    def async_delay_save(self, data_func, delay=0):
+        self.data = json.loads(json.dumps(data_func()))
+
+    async def async_remove(self):
+        self.data = None
+
+
+def memory_capability_cache(store):
+    cache = capability_cache_module.CapabilityCache(FakeHass(), "entry")
+    cache._store = store
+    return cache
+
+
+def memory_appliance_snapshot(store):
+    snapshot = appliance_snapshot_module.ApplianceSnapshotStore(FakeHass(), "entry")
+    snapshot._store = store
+    return snapshot
+
+
+class FakeAPI:
+    """Appliance endpoints with per-appliance delays and failures that track how many requests run at once."""
+
+    def __init__(self, appliance_ids):
+        self.appliances = [sample_appliance(appliance_id) for appliance_id in appliance_ids]
+        self.delays = {}
+        self.failures = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.state_requests = []
+        self.info_requests = []
+        self.info_variant = None
+        self.reported = {}
+
+    async def _request(self, appliance_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(appliance_id, 0.01))
+            if appliance_id in self.failures:
+                raise RuntimeError(f"request for {appliance_id} failed")
+        finally:
+            self.in_flight -= 1
+
+    async def get_appliances(self):
+        return list(self.appliances)
+
+    async def get_appliance_info(self, appliance_id):
+        self.info_requests.append(appliance_id)
+        await self._request(appliance_id)
+        info = sample_info()
+        if self.info_variant is not None:
+            info.appliance_info.variant = self.info_variant
+        return info
+
+    async def get_appliance_state(self, appliance_id):
+        self.state_requests.append(appliance_id)
+        await self._request(appliance_id)
+        return sample_state(appliance_id, **self.reported)
+
+    async def close(self):
+        pass
+
+
+class FakeEntity:
+    """Records the updates the hub dispatches to an entity of one appliance."""
+
+    entity_id = "climate.fake"
+    platform = None
+    livestream_properties = None
+
+    def __init__(self, appliance_data):
+        self.hass = object()
+        self.appliance_data = appliance_data
+        self.appliance = appliance_data.appliance
+        self.info = appliance_data.info
+        self.appliance_state = appliance_data.state
+        self.updates = []
+
+    @property
+    def appliance_id(self):
+        return self.appliance.id
+
+    def _handle_appliance_state_update(self, changed_properties):
+        self.updates.append((self.appliance_state, changed_properties))
+
+    def async_write_ha_state_if_changed(self):
+        return True
+
+
+class HubTestCase(unittest.IsolatedAsyncioTestCase):
+    appliance_ids = ("ac-1", "ac-2", "ac-3", "ac-4", "ac-5")
+    hub_options = {}
+
+    async def asyncSetUp(self):
+        token = {
+            "access_token": "access",
+            "refresh_token": "refresh",
+            "token_expiration_date": datetime.now() + timedelta(hours=1),
+        }
+        self.hub = hub_module.ElectroluxHub(
+            hass=FakeHass(),
+            api_key="key",
+            token=token,
+            scan_interval=None,
+            **self.hub_options,
+        )
+        await self.hub.api.close()
+        self.api = FakeAPI(self.appliance_ids)
+        self.hub.api = self.api
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+
+    async def wait_for_background_tasks(self):
+        while self.hub._background_tasks:
+            await asyncio.gather(*self.hub._background_tasks)
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class DiscoveryTest(HubTestCase):
+    hub_options = {"discovery_concurrency": 2}
+
+    async def test_discovery_is_bounded_by_the_concurrency_option(self):
+        appliances = await self.hub.discover_appliances()
+
+        self.assertEqual([appliance.id for appliance in appliances], list(self.appliance_ids))
+        self.assertEqual(set(self.hub.discovered_appliance_data), set(self.appliance_ids))
+        self.assertEqual(self.api.max_in_flight, 2)
+
+    async def test_failed_appliance_is_skipped(self):
+        self.api.failures.add("ac-2")
+
+        await self.hub.discover_appliances()
+
+        self.assertEqual(set(self.hub.discovered_appliance_data), {"ac-1", "ac-3", "ac-4", "ac-5"})
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class StateRefreshTest(HubTestCase):
+    hub_options = {"state_refresh_concurrency": 2, "state_refresh_timeout": 0.1}
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.hub.discover_appliances()
+        self.discovered_states = {
+            appliance_id: appliance_data.state
+            for appliance_id, appliance_data in self.hub.discovered_appliance_data.items()
+        }
+        self.api.max_in_flight = 0
+
+    def refreshed(self):
+        return {
+            appliance_id
+            for appliance_id, appliance_data in self.hub.discovered_appliance_data.items()
+            if appliance_data.state is not self.discovered_states[appliance_id]
+        }
+
+    async def test_refresh_is_bounded_by_the_concurrency_limit(self):
+        await self.hub._refresh_appliance_states(call_async_update=False)
+
+        self.assertEqual(self.refreshed(), set(self.appliance_ids))
+        self.assertEqual(self.api.max_in_flight, 2)
+
+    async def test_slow_or_failing_appliance_does_not_block_the_others(self):
+        self.api.delays["ac-1"] = 10
+        self.api.failures.add("ac-2")
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        await self.hub._refresh_appliance_states(call_async_update=False)
+
+        self.assertLess(loop.time() - started_at, 1)
+        self.assertEqual(self.refreshed(), {"ac-3", "ac-4", "ac-5"})
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class CapabilityCacheTest(HubTestCase):
+    appliance_ids = ("ac-1", "ac-2")
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.store = MemoryStore()
+        self.reloads = 0
+        self.hub._capability_cache = memory_capability_cache(self.store)
+        self.hub._on_appliances_changed = self.count_reload
+
+    def count_reload(self):
+        self.reloads += 1
+
+    async def test_entries_hit_only_for_the_same_pnc_and_data_model_version(self):
+        cache = memory_capability_cache(MemoryStore())
+        await cache.async_load()
+        info = sample_info()
+        cache.set("ac-1", info, sample_state("ac-1"))
+
+        self.assertEqual(cache.get("ac-1", sample_state("ac-1")), info)
+        self.assertIsNone(cache.get("ac-1", sample_state("ac-1", dataModelVersion="2.0.0")))
+        self.assertIsNone(cache.get("ac-1", sample_state("ac-1", applianceData={"pnc": "950011559"})))
+        self.assertIsNone(cache.get("ac-2", sample_state("ac-2")))
+
+    async def test_discovery_uses_saved_capabilities_and_revalidates_them(self):
+        await self.hub.discover_appliances()
+        self.assertEqual(sorted(self.api.info_requests), ["ac-1", "ac-2"])
+
+        self.hub._capability_cache = memory_capability_cache(self.store)
+        self.api.info_requests.clear()
+
+        await self.hub.discover_appliances()
+
+        self.assertEqual(self.api.info_requests, [])
+        self.assertEqual(set(self.hub.discovered_appliance_data), {"ac-1", "ac-2"})
+        await self.wait_for_background_tasks()
+        self.assertEqual(sorted(self.api.info_requests), ["ac-1", "ac-2"])
+        self.assertEqual(self.reloads, 0)
+
+    async def test_changed_capabilities_trigger_one_reload(self):
+        await self.hub.discover_appliances()
+        self.hub._capability_cache = memory_capability_cache(self.store)
+        self.api.info_variant = "AZULTM07"
+        await self.hub.discover_appliances()
+
+        await self.wait_for_background_tasks()
+
+        self.assertEqual(self.reloads, 1)
+        saved_variants = {entry["info"]["appliance_info"]["variant"] for entry in self.store.data["appliances"].values()}
+        self.assertEqual(saved_variants, {"AZULTM07"})
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class FastStartTest(HubTestCase):
+    appliance_ids = ("ac-1", "ac-2")
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.cache_store = MemoryStore()
+        self.snapshot_store = MemoryStore()
+        self.reloads = 0
+        self.hub._on_appliances_changed = self.count_reload
+        self.use_stores()
+        await self.hub.discover_appliances()
+        self.use_stores()
+        self.hub.discovered_appliances = []
+        self.hub.discovered_appliance_data = {}
+        self.api.state_requests.clear()
+        self.api.info_requests.clear()
+
+    def use_stores(self):
+        self.hub._capability_cache = memory_capability_cache(self.cache_store)
+        self.hub._appliance_snapshot = memory_appliance_snapshot(self.snapshot_store)
+
+    def count_reload(self):
+        self.reloads += 1
+
+    async def test_restore_uses_the_snapshot_without_requests(self):
+        self.assertTrue(await self.hub.restore_appliance_snapshot())
+
+        self.assertEqual(set(self.hub.discovered_appliance_data), {"ac-1", "ac-2"})
+        self.assertEqual(self.hub.discovered_appliance_data["ac-1"].state.get_reported("targetTemperatureC"), 23)
+        self.assertEqual(self.api.state_requests + self.api.info_requests, [])
+
+    async def test_restore_needs_cached_capabilities(self):
+        self.cache_store.data = None
+        self.use_stores()
+
+        self.assertFalse(await self.hub.restore_appliance_snapshot())
+        self.assertEqual(self.hub.discovered_appliance_data, {})
+
+    async def test_reconcile_applies_live_state_in_place(self):
+        await self.hub.restore_appliance_snapshot()
+        restored = self.hub.discovered_appliance_data["ac-1"]
+        self.api.reported = {"targetTemperatureC": 19}
+
+        self.hub.reconcile_appliances_in_background()
+        await self.wait_for_background_tasks()
+
+        self.assertIs(self.hub.discovered_appliance_data["ac-1"], restored)
+        self.assertEqual(restored.state.get_reported("targetTemperatureC"), 19)
+        self.assertEqual(self.reloads, 0)
+        saved = {item["state"]["id"]: item["state"]["reported"] for item in self.snapshot_store.data["appliances"]}
+        self.assertEqual(saved["ac-1"]["targetTemperatureC"], 19)
+
+    async def test_reconcile_reloads_when_appliances_changed(self):
+        await self.hub.restore_appliance_snapshot()
+        self.api.appliances.append(sample_appliance("ac-3"))
+
+        self.hub.reconcile_appliances_in_background()
+        await self.wait_for_background_tasks()
+
+        self.assertEqual(set(self.hub.discovered_appliance_data), {"ac-1", "ac-2", "ac-3"})
+        self.assertEqual(self.reloads, 1)
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class LivestreamCoalescingTest(HubTestCase):
+    appliance_ids = ("ac-1", "ac-2")
+    hub_options = {"livestream_coalesce_window": 0.05}
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.hub.discover_appliances()
+        self.entities = {
+            appliance_id: FakeEntity(appliance_data)
+            for appliance_id, appliance_data in self.hub.discovered_appliance_data.items()
+        }
+        self.hub.add_entities(list(self.entities.values()))
+
+    async def send_events(self, *events):
+        for appliance_id, property_name, value in events:
+            await self.hub._handle_livestream_event(
+                {"applianceId": appliance_id, "property": property_name, "value": value},
+                {},
+            )
+
+    async def flush(self):
+        await self.hub._livestream_flush_task
+
+    async def test_events_are_folded_into_one_update_per_appliance(self):
+        await self.send_events(
+            ("ac-1", "targetTemperatureC", 20),
+            ("ac-1", "targetTemperatureC", 21),
+            ("ac-1", "fanSpeedSetting", "high"),
+            ("ac-2", "targetTemperatureC", 18),
+        )
+        self.assertEqual(self.entities["ac-1"].updates, [])
+
+        await self.flush()
+
+        self.assertEqual(
+            self.entities["ac-1"].updates,
+            [(self.hub.discovered_appliance_data["ac-1"].state, frozenset({"targetTemperatureC", "fanSpeedSetting"}))],
+        )
+        self.assertEqual(len(self.entities["ac-2"].updates), 1)
+        self.assertEqual(self.entities["ac-1"].appliance_state.get_reported("targetTemperatureC"), 21)
+        stats = self.hub.livestream_stats
+        self.assertEqual((stats.events_applied, stats.events_folded, stats.flushes, stats.dispatches), (4, 2, 1, 2))
+
+    async def test_flush_dispatches_the_current_state_after_a_poll(self):
+        await self.send_events(("ac-1", "targetTemperatureC", 20), ("ac-2", "targetTemperatureC", 18))
+        self.api.reported = {"targetTemperatureC": 17}
+
+        await self.hub._poll_appliance("ac-1")
+        await self.flush()
+
+        polled_state = self.hub.discovered_appliance_data["ac-1"].state
+        self.assertEqual(polled_state.get_reported("targetTemperatureC"), 17)
+        self.assertEqual(
+            self.entities["ac-1"].updates,
+            [(polled_state, frozenset({"targetTemperatureC"}))],
+        )
+        self.assertIs(self.entities["ac-1"].appliance_state, polled_state)
+        self.assertEqual(self.hub.livestream_stats.dispatches, 1)
+
+    async def test_flush_skips_appliances_that_are_gone(self):
+        await self.send_events(("ac-1", "targetTemperatureC", 20))
+        del self.hub.discovered_appliance_data["ac-1"]
+
+        await self.flush()
+
+        self.assertEqual(self.entities["ac-1"].updates, [])
+        self.assertEqual(self.hub.livestream_stats.dispatches, 0)
+
+
+RUNNING_GATED_CAPABILITIES = {
+    "applianceInfo": {"pnc": "1", "deviceType": "PORTABLE_AIR_CONDITIONER"},
+    "capabilities": {
+        "executeCommand": {"access": "readwrite", "type": "string", "values": {"OFF": {}, "ON": {}}},
+        "applianceState": {
+            "access": "read",
+            "type": "string",
+            "values": {"OFF": {}, "RUNNING": {}},
+            "triggers": [
+                {
+                    "action": {"mode": {"access": "read"}},
+                    "condition": {"operand_1": "value", "operand_2": "OFF", "operator": "eq"},
+                }
+            ],
+        },
+        "mode": {"access": "readwrite", "type": "string", "values": {"COOL": {}, "FANONLY": {}}},
+    },
+}
+POWER_ON = ("executeCommand", "ON")
+RUNNING = ("applianceState", "RUNNING")
+FAN_ONLY = ("mode", "FANONLY")
+
+
+@unittest.skipUnless(HAS_HOMEASSISTANT, "homeassistant is not installed")
+class CapabilityCommandsTest(HubTestCase):
+    appliance_ids = ()
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.sent = []
+        self.results = []
+        self.hub.send_command = self.send_command
+
+    async def send_command(self, appliance_id, body, *, expected_livestream=None):
+        self.sent.append(body)
+        return self.results.pop(0) if self.results else True
+
+    def add_appliance(self, appliance_id, *, dam):
+        state = appliance_state_module.ApplianceState(
+            id=appliance_id,
+            connectionState=appliance_state_module.ConnectionState.CONNECTED,
+            status=appliance_state_module.Status.ENABLED,
+            properties=appliance_state_module.Properties(
+                reported=appliance_state_module.ReportedProperties(
+                    raw={"executeCommand": "OFF", "applianceState": "OFF", "mode": "COOL"},
+                ),
+            ),
+            data_model_version="1.0.0" if dam else None,
+        )
+        info = capabilities_module.capabilities_from_json(RUNNING_GATED_CAPABILITIES)
+        info.update_runtime_capabilities(state.properties.reported.raw)
+        self.hub.discovered_appliance_data[appliance_id] = appliance_module.ApplianceData(
+            appliance=sample_appliance(appliance_id),
+            info=info,
+            state=state,
+        )
+        return state
+
+    async def test_dam_writes_are_validated_against_the_simulated_state(self):
+        state = self.add_appliance("dam", dam=True)
+
+        self.assertFalse(await self.hub.send_capability_commands("dam", [POWER_ON, FAN_ONLY]))
+        self.assertEqual(self.sent, [])
+
+        sent = await self.hub.send_capability_commands(
+            "dam",
+            [POWER_ON, FAN_ONLY],
+            simulated_writes=[POWER_ON, RUNNING, FAN_ONLY],
+        )
+
+        self.assertTrue(sent)
+        self.assertEqual(self.sent, [{"commands": [{"executeCommand": "ON"}, {"mode": "FANONLY"}]}])
+        self.assertEqual(
+            state.properties.reported.raw,
+            {"executeCommand": "ON", "applianceState": "RUNNING", "mode": "FANONLY"},
+        )
+
+    async def test_dam_validation_failure_sends_nothing(self):
+        state = self.add_appliance("dam", dam=True)
+
+        sent = await self.hub.send_capability_commands(
+            "dam",
+            [POWER_ON, ("mode", "TURBO")],
+            simulated_writes=[POWER_ON, RUNNING, ("mode", "TURBO")],
+        )
+
+        self.assertFalse(sent)
+        self.assertEqual(self.sent, [])
+        self.assertEqual(state.get_reported("applianceState"), "OFF")
+
+    async def test_dam_failure_leaves_the_simulated_state_unapplied(self):
+        state = self.add_appliance("dam", dam=True)
+        self.results = [False]
+
+        sent = await self.hub.send_capability_commands(
+            "dam",
+            [POWER_ON, FAN_ONLY],
+            simulated_writes=[POWER_ON, RUNNING, FAN_ONLY],
+        )
+
+        self.assertFalse(sent)
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(
+            state.properties.reported.raw,
+            {"executeCommand": "OFF", "applianceState": "OFF", "mode": "COOL"},
+        )
+
+    async def test_legacy_writes_apply_the_running_state_between_puts(self):
+        state = self.add_appliance("legacy", dam=False)
+
+        sent = await self.hub.send_capability_commands(
+            "legacy",
+            [POWER_ON, FAN_ONLY],
+            simulated_writes=[POWER_ON, RUNNING, FAN_ONLY],
+        )
+
+        self.assertTrue(sent)
+        self.assertEqual(self.sent, [{"executeCommand": "ON"}, {"mode": "FANONLY"}])
+        self.assertEqual(state.get_reported("applianceState"), "RUNNING")
+
+    async def test_legacy_writes_stop_at_the_first_failed_put(self):
+        state = self.add_appliance("legacy", dam=False)
+        self.results = [False]
+
+        sent = await self.hub.send_capability_commands(
+            "legacy",
+            [POWER_ON, FAN_ONLY],
+            simulated_writes=[POWER_ON, RUNNING, FAN_ONLY],
+        )
+
+        self.assertFalse(sent)
+        self.assertEqual(self.sent, [{"executeCommand": "ON"}])
+        self.assertEqual(state.get_reported("applianceState"), "OFF")
+        self.assertEqual(state.get_reported("mode"), "COOL")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+POLLING_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "polling.py"
+SPEC = spec_from_file_location("electrolux_polling", POLLING_PATH)
+polling = module_from_spec(SPEC)
+sys.modules[SPEC.name] = polling
+SPEC.loader.exec_module(polling)
+
+AdaptivePollSchedule = polling.AdaptivePollSchedule
+
+
+def make_schedule(**kwargs):
+    options = {
+        "base_interval": 120,
+        "min_interval": 30,
+        "max_interval": 480,
+        "disconnected_interval": 900,
+        "stagger": 2,
+    }
+    options.update(kwargs)
+    return AdaptivePollSchedule(**options)
+
+
+class AdaptivePollScheduleTest(unittest.TestCase):
+    def test_new_appliances_are_staggered(self):
+        schedule = make_schedule()
+
+        schedule.sync(["a", "b", "c"], now=0)
+        due_times = sorted(poll["next_poll_in"] for poll in schedule.as_dict(0).values())
+
+        self.assertEqual(due_times, [120, 122, 124])
+        self.assertEqual(schedule.due(121), ["a"])
+        self.assertEqual(schedule.next_delay(0), 120)
+
+    def test_stable_appliance_backs_off_up_to_max(self):
+        schedule = make_schedule()
+        schedule.sync(["a"], now=0)
+
+        intervals = []
+        for _ in range(4):
+            schedule.record_poll("a", 0, changed=False, connected=True)
+            intervals.append(schedule.as_dict(0)["a"]["interval"])
+
+        self.assertEqual(intervals, [240, 480, 480, 480])
+
+    def test_change_polls_at_floor_then_backs_off_from_base(self):
+        schedule = make_schedule()
+        schedule.sync(["a"], now=0)
+
+        schedule.record_poll("a", 0, changed=True, connected=True)
+        self.assertEqual(schedule.as_dict(0)["a"]["interval"], 30)
+
+        schedule.record_poll("a", 30, changed=False, connected=True)
+        self.assertEqual(schedule.as_dict(30)["a"]["interval"], 120)
+
+    def test_disconnected_appliance_is_probed_rarely(self):
+        schedule = make_schedule()
+        schedule.sync(["a"], now=0)
+
+        schedule.record_poll("a", 0, changed=True, connected=False)
+
+        self.assertEqual(schedule.as_dict(0)["a"]["next_poll_in"], 900)
+        self.assertFalse(schedule.as_dict(0)["a"]["connected"])
+
+    def test_command_brings_next_poll_forward_to_floor(self):
+        schedule = make_schedule()
+        schedule.sync(["a"], now=0)
+        schedule.record_poll("a", 0, changed=False, connected=True)
+
+        schedule.record_command("a", 10)
+
+        self.assertEqual(schedule.next_delay(10), 30)
+        self.assertEqual(schedule.as_dict(10)["a"]["interval"], 30)
+
+    def test_intervals_never_go_below_floor(self):
+        schedule = make_schedule(base_interval=5, disconnected_interval=10)
+
+        self.assertEqual(schedule.base_interval, 30)
+        self.assertEqual(schedule.disconnected_interval, 30)
+
+    def test_sync_drops_removed_appliances(self):
+        schedule = make_schedule()
+        schedule.sync(["a", "b"], now=0)
+
+        schedule.sync(["b"], now=0)
+
+        self.assertEqual(list(schedule.as_dict(0)), ["b"])
+        schedule.record_poll("a", 0, changed=True, connected=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+RECONNECT_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "reconnect.py"
+SPEC = spec_from_file_location("electrolux_reconnect", RECONNECT_PATH)
+reconnect = module_from_spec(SPEC)
+sys.modules[SPEC.name] = reconnect
+SPEC.loader.exec_module(reconnect)
+
+CircuitState = reconnect.CircuitState
+ReconnectPolicy = reconnect.ReconnectPolicy
+
+
+def make_policy(random_factor=1.0, **kwargs):
+    options = {"base_delay": 5, "max_delay": 60, "failure_threshold": 4, "open_duration": 900}
+    options.update(kwargs)
+    return ReconnectPolicy(random_factor=lambda: random_factor, clock=lambda: 1000.0, **options)
+
+
+class ReconnectPolicyTest(unittest.TestCase):
+    def test_backoff_grows_exponentially_up_to_cap(self):
+        policy = make_policy(failure_threshold=10)
+
+        delays = [policy.record_failure() for _ in range(6)]
+
+        self.assertEqual(delays, [5, 10, 20, 40, 60, 60])
+        self.assertEqual(policy.next_retry_at, 1060.0)
+
+    def test_full_jitter_scales_the_ceiling(self):
+        policy = make_policy(random_factor=0.25)
+
+        self.assertEqual(policy.record_failure(), 1.25)
+        self.assertEqual(policy.record_failure(), 2.5)
+
+    def test_min_delay_is_respected(self):
+        policy = make_policy(random_factor=0.0)
+
+        self.assertEqual(policy.record_failure(min_delay=3), 3)
+
+    def test_circuit_opens_after_threshold_and_half_opens_on_next_attempt(self):
+        policy = make_policy()
+        for _ in range(3):
+            policy.before_attempt()
+            policy.record_failure()
+        self.assertIs(policy.state, CircuitState.CLOSED)
+
+        policy.before_attempt()
+        self.assertEqual(policy.record_failure(), 900)
+        self.assertIs(policy.state, CircuitState.OPEN)
+
+        policy.before_attempt()
+        self.assertIs(policy.state, CircuitState.HALF_OPEN)
+        self.assertEqual(policy.record_failure(), 900)
+        self.assertIs(policy.state, CircuitState.OPEN)
+        self.assertEqual(policy.circuit_opened, 2)
+
+    def test_success_closes_circuit_and_resets_backoff(self):
+        policy = make_policy()
+        for _ in range(4):
+            policy.record_failure()
+        policy.before_attempt()
+
+        policy.record_success()
+
+        self.assertIs(policy.state, CircuitState.CLOSED)
+        self.assertEqual(policy.record_failure(), 5)
+
+    def test_as_dict_reports_state_and_next_retry(self):
+        policy = make_policy()
+        policy.before_attempt()
+        policy.record_failure()
+
+        diagnostics = policy.as_dict()
+
+        self.assertEqual(diagnostics["state"], "closed")
+        self.assertEqual(diagnostics["consecutive_failures"], 1)
+        self.assertEqual(diagnostics["total_attempts"], 1)
+        self.assertEqual(diagnostics["next_retry_at"], "1970-01-01T00:16:45+00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import asyncio
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+SCHEDULER_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "scheduler.py"
+SPEC = spec_from_file_location("electrolux_scheduler", SCHEDULER_PATH)
+scheduler = module_from_spec(SPEC)
+sys.modules[SPEC.name] = scheduler
+SPEC.loader.exec_module(scheduler)
+
+RequestPriority = scheduler.RequestPriority
+RequestScheduler = scheduler.RequestScheduler
+parse_retry_after = scheduler.parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+class ParseRetryAfterTest(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertEqual(parse_retry_after(" 5 "), 5)
+
+    def test_http_date(self):
+        now = 1445412480.0  # Wed, 21 Oct 2015 07:28:00 GMT
+
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=lambda: now), 30)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:27:00 GMT", now=lambda: now), 0)
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(""))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after("²"))
+        self.assertIsNone(parse_retry_after("١٢"))
+
+
+class RequestSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    def make_scheduler(self, rate=2.0, burst=3):
+        clock = FakeClock()
+        return clock, RequestScheduler(rate=rate, burst=burst, clock=clock, sleep=clock.sleep)
+
+    async def test_burst_is_served_immediately_then_rate_limited(self):
+        clock, request_scheduler = self.make_scheduler()
+
+        waits = [await request_scheduler.acquire() for _ in range(5)]
+
+        self.assertEqual(waits, [0, 0, 0, 0.5, 0.5])
+        self.assertEqual(clock.now, 1.0)
+        self.assertEqual(request_scheduler.throttled, 2)
+        self.assertEqual(request_scheduler.as_dict()["requests_last_minute"], 5)
+
+    async def test_tokens_refill_up_to_burst(self):
+        clock, request_scheduler = self.make_scheduler()
+        for _ in range(3):
+            await request_scheduler.acquire()
+
+        clock.now += 60
+
+        self.assertEqual(request_scheduler.as_dict()["tokens_available"], 3)
+
+    async def test_pause_delays_all_requests(self):
+        clock, request_scheduler = self.make_scheduler()
+
+        request_scheduler.pause(30)
+        first_wait = await request_scheduler.acquire()
+        second_wait = await request_scheduler.acquire()
+
+        self.assertEqual(first_wait, 30)
+        self.assertEqual(second_wait, 0.5)
+        self.assertEqual(request_scheduler.rate_limited, 1)
+        self.assertEqual(request_scheduler.pause_remaining(), 0)
+
+    async def test_budget_window_forgets_old_requests(self):
+        clock, request_scheduler = self.make_scheduler()
+        await request_scheduler.acquire()
+
+        clock.now += 120
+        await request_scheduler.acquire()
+        diagnostics = request_scheduler.as_dict()
+
+        self.assertEqual(diagnostics["requests_last_minute"], 1)
+        self.assertEqual(diagnostics["requests_last_hour"], 2)
+        self.assertEqual(diagnostics["requests"], 2)
+
+    async def test_contended_tokens_are_granted_by_priority(self):
+        clock, request_scheduler = self.make_scheduler(burst=1)
+        await request_scheduler.acquire()
+        order = []
+
+        async def request(priority):
+            await request_scheduler.acquire(priority)
+            order.append(priority)
+
+        await asyncio.gather(
+            request(RequestPriority.DISCOVERY),
+            request(RequestPriority.STATE),
+            request(RequestPriority.COMMAND),
+            request(RequestPriority.STATE),
+        )
+
+        self.assertEqual(
+            order,
+            [RequestPriority.COMMAND, RequestPriority.STATE, RequestPriority.STATE, RequestPriority.DISCOVERY],
+        )
+
+    async def test_lane_concurrency_and_wait_are_tracked_per_lane(self):
+        clock = FakeClock()
+        request_scheduler = RequestScheduler(
+            rate=100,
+            burst=100,
+            lane_limits={RequestPriority.STATE: 2},
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        release = asyncio.Event()
+        peak = 0
+
+        async def state_request():
+            nonlocal peak
+            async with request_scheduler.slot(RequestPriority.STATE):
+                peak = max(peak, request_scheduler.lanes[RequestPriority.STATE].in_flight)
+                await release.wait()
+
+        tasks = [asyncio.create_task(state_request()) for _ in range(4)]
+        await asyncio.sleep(0)
+        self.assertEqual(request_scheduler.lanes[RequestPriority.STATE].queued, 2)
+
+        async with request_scheduler.slot(RequestPriority.COMMAND) as waited:
+            self.assertEqual(waited, 0)
+
+        release.set()
+        await asyncio.gather(*tasks)
+        lanes = request_scheduler.as_dict()["lanes"]
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(lanes["state"]["requests"], 4)
+        self.assertEqual(lanes["state"]["in_flight"], 0)
+        self.assertEqual(lanes["command"]["requests"], 1)
+
+    async def test_cancelled_waiter_does_not_consume_a_token(self):
+        clock, request_scheduler = self.make_scheduler(burst=1)
+        await request_scheduler.acquire()
+
+        cancelled = asyncio.create_task(request_scheduler.acquire(RequestPriority.COMMAND))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        waited = await request_scheduler.acquire(RequestPriority.DISCOVERY)
+
+        self.assertEqual(waited, 0.5)
+        self.assertEqual(request_scheduler.requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
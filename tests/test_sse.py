@@ -0,0 +1,138 @@
+import asyncio
+import json
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+SSE_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "sse.py"
+SPEC = spec_from_file_location("electrolux_sse", SSE_PATH)
+sse = module_from_spec(SPEC)
+sys.modules[SPEC.name] = sse
+SPEC.loader.exec_module(sse)
+
+SSEDecoder = sse.SSEDecoder
+SSEEvent = sse.SSEEvent
+IdleWatchdog = sse.IdleWatchdog
+
+RECORDED_STREAM = (
+    b": connected\n\n"
+    b"event: ping\ndata: {}\n\n"
+    b'id: 41\ndata: {"applianceId": "1:950011559", "property": "PM2_5", "value": 12}\n\n'
+    b'id: 42\ndata: {"applianceId": "1:950011559", "property": "PM10", "value": 15}\n\n'
+    b"retry: 5000\n"
+    b'data: {"applianceId": "1:950011559", "property": "TVOC", "value": 3}\n\n'
+)
+
+
+def decode_in_chunks(stream, chunk_size):
+    decoder = SSEDecoder()
+    events = []
+    for start in range(0, len(stream), chunk_size):
+        events.extend(decoder.feed(stream[start:start + chunk_size]))
+    return decoder, events
+
+
+class SSEDecoderTest(unittest.TestCase):
+    def test_recorded_stream_is_decoded(self):
+        decoder, events = decode_in_chunks(RECORDED_STREAM, len(RECORDED_STREAM))
+
+        self.assertEqual([event.event for event in events], ["ping", "message", "message", "message"])
+        self.assertEqual(json.loads(events[1].data)["property"], "PM2_5")
+        self.assertEqual(events[1].id, "41")
+        self.assertEqual(events[3].id, "42")
+        self.assertEqual(decoder.last_event_id, "42")
+        self.assertEqual(decoder.retry, 5000)
+
+    def test_chunk_boundaries_do_not_change_events(self):
+        _, expected = decode_in_chunks(RECORDED_STREAM, len(RECORDED_STREAM))
+
+        for chunk_size in (1, 2, 3, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                _, events = decode_in_chunks(RECORDED_STREAM, chunk_size)
+                self.assertEqual(events, expected)
+
+    def test_crlf_and_cr_line_endings(self):
+        stream = b"data: first\r\n\r\ndata: second\r\rdata: third\n\n"
+
+        for chunk_size in (1, len(stream)):
+            with self.subTest(chunk_size=chunk_size):
+                _, events = decode_in_chunks(stream, chunk_size)
+                self.assertEqual([event.data for event in events], ["first", "second", "third"])
+
+    def test_multi_line_data_is_joined_with_newlines(self):
+        decoder = SSEDecoder()
+
+        events = decoder.feed(b"data: {\ndata:  \"a\": 1\ndata: }\n\n")
+
+        self.assertEqual(events, [SSEEvent(event="message", data='{\n "a": 1\n}')])
+        self.assertEqual(json.loads(events[0].data), {"a": 1})
+
+    def test_incomplete_event_is_kept_until_blank_line(self):
+        decoder = SSEDecoder()
+
+        self.assertEqual(decoder.feed(b"event: update\ndata: 1\n"), [])
+        self.assertEqual(decoder.feed(b"\n"), [SSEEvent(event="update", data="1")])
+
+    def test_bom_comments_and_invalid_fields(self):
+        decoder = SSEDecoder(last_event_id="7")
+
+        events = decoder.feed(b"\xef\xbb\xbfdata: x\n: comment\nid: a\0b\nretry: soon\nunknown: 1\n\n")
+
+        self.assertEqual(events, [SSEEvent(event="message", data="x", id="7")])
+        self.assertIsNone(decoder.retry)
+
+    def test_event_id_is_committed_only_on_dispatch(self):
+        decoder = SSEDecoder(last_event_id="42")
+
+        self.assertEqual(decoder.feed(b'id: 43\ndata: {"value": 1}\n'), [])
+        self.assertEqual(decoder.last_event_id, "42")
+
+        self.assertEqual(decoder.feed(b"\n"), [SSEEvent(event="message", data='{"value": 1}', id="43")])
+        self.assertEqual(decoder.last_event_id, "43")
+
+    def test_retry_ignores_non_ascii_digits(self):
+        decoder = SSEDecoder()
+
+        decoder.feed("retry: ²\nretry: ١٢\ndata: x\n\n".encode())
+
+        self.assertIsNone(decoder.retry)
+
+    def test_utf8_split_across_chunks(self):
+        payload = "data: Łódź\n\n".encode()
+        decoder = SSEDecoder()
+
+        events = decoder.feed(payload[:7]) + decoder.feed(payload[7:])
+
+        self.assertEqual(events, [SSEEvent(event="message", data="Łódź")])
+
+
+class IdleWatchdogTest(unittest.IsolatedAsyncioTestCase):
+    async def test_fires_once_after_inactivity(self):
+        loop = asyncio.get_running_loop()
+        fired = asyncio.Event()
+        watchdog = IdleWatchdog(loop, 0.05, fired.set)
+        watchdog.start()
+
+        for _ in range(3):
+            await asyncio.sleep(0.02)
+            watchdog.touch()
+        self.assertFalse(watchdog.fired)
+
+        await asyncio.wait_for(fired.wait(), timeout=1)
+        self.assertTrue(watchdog.fired)
+
+    async def test_cancel_prevents_firing(self):
+        loop = asyncio.get_running_loop()
+        calls = []
+        watchdog = IdleWatchdog(loop, 0.01, lambda: calls.append(True))
+        watchdog.start()
+        watchdog.cancel()
+
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+SUBSCRIPTIONS_PATH = Path(__file__).parents[1] / "custom_components" / "electrolux" / "subscriptions.py"
+SPEC = spec_from_file_location("electrolux_subscriptions", SUBSCRIPTIONS_PATH)
+subscriptions = module_from_spec(SPEC)
+sys.modules[SPEC.name] = subscriptions
+SPEC.loader.exec_module(subscriptions)
+
+EntitySubscriptions = subscriptions.EntitySubscriptions
+
+
+class FakeEntity:
+    def __init__(self, appliance_id, livestream_properties=None):
+        self.appliance_id = appliance_id
+        self.livestream_properties = livestream_properties
+
+
+class EntitySubscriptionsTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = EntitySubscriptions()
+        self.mode = FakeEntity("ac", frozenset({"upperOven.mode"}))
+        self.temperature = FakeEntity("ac", frozenset({"targetTemperatureC"}))
+        self.everything = FakeEntity("ac")
+        self.purifier = FakeEntity("purifier", frozenset({"mode"}))
+        for entity in (self.mode, self.temperature, self.everything, self.purifier):
+            self.registry.add(entity)
+
+    def test_matches_by_exact_path_and_leaf(self):
+        self.assertEqual(self.registry.matching("ac", {"upperOven.mode"}), [self.mode, self.everything])
+        self.assertEqual(self.registry.matching("ac", {"mode"}), [self.mode, self.everything])
+        self.assertEqual(self.registry.matching("ac", {"PM2_5"}), [self.everything])
+        self.assertEqual(self.registry.matching("purifier", {"mode"}), [self.purifier])
+
+    def test_full_updates_and_empty_changes(self):
+        all_ac = [self.mode, self.temperature, self.everything]
+
+        self.assertEqual(self.registry.matching("ac", None), all_ac)
+        self.assertEqual(self.registry.matching("ac", {"connectionState"}), all_ac)
+        self.assertEqual(self.registry.matching("ac", set()), [])
+        self.assertEqual(self.registry.matching("unknown", None), [])
+
+    def test_removed_entities_are_not_matched(self):
+        self.registry.remove(self.mode)
+        self.registry.remove(self.mode)
+
+        self.assertEqual(self.registry.matching("ac", {"mode"}), [self.everything])
+        self.assertEqual(self.registry.for_appliance("ac"), [self.temperature, self.everything])
+        self.assertEqual(len(self.registry), 3)
+
+    def test_refresh_reindexes_changed_properties(self):
+        self.temperature.livestream_properties = frozenset({"targetTemperatureF"})
+        self.assertEqual(self.registry.matching("ac", {"targetTemperatureF"}), [self.everything])
+
+        self.registry.refresh(self.temperature)
+
+        self.assertEqual(self.registry.matching("ac", {"targetTemperatureF"}), [self.temperature, self.everything])
+        self.assertEqual(self.registry.matching("ac", {"targetTemperatureC"}), [self.everything])
+
+    def test_dependencies_widen_subscriptions(self):
+        registry = EntitySubscriptions(
+            lambda entity: None
+            if entity.livestream_properties is None
+            else entity.livestream_properties | ({"Workmode"} if "Fanspeed" in entity.livestream_properties else set())
+        )
+        fan_speed = FakeEntity("purifier", frozenset({"Fanspeed"}))
+        ionizer = FakeEntity("purifier", frozenset({"Ionizer"}))
+        registry.add(fan_speed)
+        registry.add(ionizer)
+
+        self.assertEqual(registry.matching("purifier", {"Workmode"}), [fan_speed])
+        self.assertEqual(registry.dependencies(fan_speed), frozenset({"Fanspeed", "Workmode"}))
+
+        fan_speed.livestream_properties = frozenset({"Ionizer"})
+        registry.refresh(fan_speed)
+
+        self.assertEqual(registry.matching("purifier", {"Workmode"}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()